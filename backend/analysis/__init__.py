@@ -1,6 +1,6 @@
 """시황 분석 모듈"""
 from .market import MarketAnalyzer
 from .news import NewsCrawler
-from .crawler import get_all_indices, get_stock_price
+from .crawler import get_all_indices, get_stock_price, get_stock_prices
 
-__all__ = ["MarketAnalyzer", "NewsCrawler", "get_all_indices", "get_stock_price"]
+__all__ = ["MarketAnalyzer", "NewsCrawler", "get_all_indices", "get_stock_price", "get_stock_prices"]
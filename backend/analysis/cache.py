@@ -0,0 +1,203 @@
+# -*- coding: utf-8 -*-
+"""
+시세 캐시 모듈
+
+KRX 장 운영 여부에 따라 TTL이 달라지는 메모리 캐시입니다.
+장중에는 몇 초, 장 마감 후에는 몇 시간 동안 같은 시세를 재사용해
+여러 브라우저가 동시에 폴링해도 TTL 구간당 업스트림 호출은 1회로 줄어듭니다.
+만료된 값은 최대 묵은 시간(SWR_MAX_STALE) 안에서 즉시 반환하고 백그라운드에서 갱신할 수 있습니다.
+"""
+import copy
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, time as dtime, timedelta, timezone
+from functools import wraps
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple, Union
+
+KST = timezone(timedelta(hours=9))
+KRX_OPEN = dtime(9, 0)
+KRX_CLOSE = dtime(15, 30)
+
+# 장중/장외 시세 TTL (초)
+QUOTE_TTL_OPEN = float(os.getenv("QUOTE_TTL_OPEN", "5"))
+QUOTE_TTL_CLOSED = float(os.getenv("QUOTE_TTL_CLOSED", "3600"))
+QUOTE_CACHE_SIZE = int(os.getenv("QUOTE_CACHE_SIZE", "1024"))
+INDICATOR_MEMO_SIZE = int(os.getenv("INDICATOR_MEMO_SIZE", "512"))
+NEWS_CACHE_SIZE = int(os.getenv("NEWS_CACHE_SIZE", "256"))
+# 만료 후에도 묵은 값을 내줄 수 있는 최대 시간 (초). 넘기면 동기 조회
+SWR_MAX_STALE = float(os.getenv("SWR_MAX_STALE", "600"))
+
+
+def is_krx_session(now: Optional[datetime] = None) -> bool:
+    """KRX 정규장(평일 09:00~15:30, 한국 시간) 여부"""
+    now = now.astimezone(KST) if now else datetime.now(KST)
+    if now.weekday() >= 5:
+        return False
+    return KRX_OPEN <= now.time() <= KRX_CLOSE
+
+
+def seconds_until_open(now: Optional[datetime] = None) -> float:
+    """다음 정규장 개장(평일 09:00, 한국 시간)까지 남은 시간 (초)"""
+    now = now.astimezone(KST) if now else datetime.now(KST)
+    opening = datetime.combine(now.date(), KRX_OPEN, tzinfo=KST)
+    if now >= opening:
+        opening += timedelta(days=1)
+    while opening.weekday() >= 5:
+        opening += timedelta(days=1)
+    return (opening - now).total_seconds()
+
+
+def quote_ttl(now: Optional[datetime] = None) -> float:
+    """현재 장 상태에 맞는 시세 TTL (초). 장외 TTL은 다음 개장 시각을 넘기지 않음"""
+    if is_krx_session(now):
+        return QUOTE_TTL_OPEN
+    return max(min(QUOTE_TTL_CLOSED, seconds_until_open(now)), QUOTE_TTL_OPEN)
+
+
+class TTLCache:
+    """크기 제한(LRU)과 적중/미스 카운터가 있는 스레드 안전 TTL 캐시"""
+
+    def __init__(self, name: str, maxsize: int = 1024):
+        self.name = name
+        self.maxsize = maxsize
+        # key -> (값, 저장 시각, 만료 시각)  (time.monotonic 기준)
+        self._data: "OrderedDict[Hashable, Tuple[Any, float, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._refreshing: set = set()
+        self.hits = 0
+        self.misses = 0
+        self.stale_hits = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """만료되지 않은 값 조회 (없으면 None)"""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None or entry[2] <= time.monotonic():
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def set(self, key: Hashable, value: Any, ttl: float) -> None:
+        """값 저장 (가득 차면 가장 오래 안 쓴 항목 제거)"""
+        with self._lock:
+            now = time.monotonic()
+            self._data[key] = (value, now, now + ttl)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def get_or_revalidate(
+        self,
+        key: Hashable,
+        loader: Callable[[], Any],
+        ttl: float,
+        max_stale: float = SWR_MAX_STALE,
+        cacheable: Callable[[Any], bool] = lambda v: v is not None,
+    ) -> Tuple[Any, float]:
+        """
+        Stale-while-revalidate 조회
+
+        신선한 값은 그대로, 만료됐지만 max_stale 이내인 값은 즉시 반환하고 백그라운드에서 갱신합니다.
+        값이 없거나 max_stale을 넘기면 동기로 조회합니다.
+
+        Returns:
+            (값, 데이터 나이 초)
+        """
+        now = time.monotonic()
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None:
+                value, stored_at, expires_at = entry
+                if expires_at > now:
+                    self._data.move_to_end(key)
+                    self.hits += 1
+                    return value, now - stored_at
+                if now - expires_at <= max_stale:
+                    self.stale_hits += 1
+                    if key not in self._refreshing:
+                        self._refreshing.add(key)
+                        _revalidator.submit(self._revalidate, key, loader, ttl, cacheable)
+                    return value, now - stored_at
+            self.misses += 1
+
+        value = loader()
+        if cacheable(value):
+            self.set(key, value, ttl)
+        return value, 0.0
+
+    def _revalidate(self, key, loader, ttl, cacheable) -> None:
+        try:
+            value = loader()
+            if cacheable(value):
+                self.set(key, value, ttl)
+        except Exception as e:
+            print(f"[Error] {self.name} revalidate failed ({key}): {e}")
+        finally:
+            with self._lock:
+                self._refreshing.discard(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "name": self.name,
+                "size": len(self._data),
+                "maxsize": self.maxsize,
+                "hits": self.hits,
+                "misses": self.misses,
+                "staleHits": self.stale_hits,
+                "evictions": self.evictions,
+                "hitRate": round(self.hits / total, 4) if total else 0.0,
+            }
+
+
+_revalidator = ThreadPoolExecutor(max_workers=4, thread_name_prefix="revalidate")
+
+quote_cache = TTLCache("quotes", maxsize=QUOTE_CACHE_SIZE)
+# 라우트 응답 단위(지수 묶음, 스크리너 스냅샷 등) stale-while-revalidate 캐시
+feed_cache = TTLCache("feeds", maxsize=64)
+# 봉 단위 기술적 지표 메모 ((종목코드, 마지막 봉 날짜, 마지막 종가) -> TechnicalIndicators).
+# 키에 마지막 봉이 들어가 새 봉·새 체결가가 오면 자연히 다른 키가 되므로 만료 없이 LRU로만 정리
+indicator_memo = TTLCache("indicators", maxsize=INDICATOR_MEMO_SIZE)
+# 종목별 뉴스 목록 (종목코드 -> (List[NewsItem], 기사를 끝까지 읽었는지)). 분석 파이프라인과 /news/stock 라우트가 함께 사용
+news_cache = TTLCache("news", maxsize=NEWS_CACHE_SIZE)
+
+
+def cached_quote(
+    key: Union[str, Callable[..., Hashable]],
+    cacheable: Callable[[Any], bool] = lambda v: v is not None,
+):
+    """
+    시세 조회 함수용 캐시 데코레이터
+
+    캐시에 든 값을 호출자가 고쳐도 다른 요청에 번지지 않도록 항상 얕은 복사본을 반환합니다.
+
+    Args:
+        key: 캐시 키 문자열, 또는 함수 인자로 키를 만드는 함수
+        cacheable: 결과를 캐시할지 판단 (실패 결과는 캐시하지 않음)
+    """
+    def decorator(fn):
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            cache_key = key(*args, **kwargs) if callable(key) else key
+            value = quote_cache.get(cache_key)
+            if value is not None:
+                return copy.copy(value)
+            value = fn(*args, **kwargs)
+            if cacheable(value):
+                quote_cache.set(cache_key, value, quote_ttl())
+                return copy.copy(value)
+            return value
+        return wrapper
+    return decorator
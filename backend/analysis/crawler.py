@@ -4,11 +4,23 @@
 
 안정적인 데이터 수집을 위해 네이버 모바일 금융 API를 사용합니다.
 """
-import requests
-from typing import Dict, List, Any, Optional
+import copy
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, List, Any, Optional, Tuple
 from dataclasses import dataclass
 from datetime import datetime
 
+try:
+    from . import http_client
+    from .cache import cached_quote, quote_cache
+except ImportError:
+    import http_client
+    from cache import cached_quote, quote_cache
+
+# 여러 종목 시세 동시 조회 워커 수
+STOCK_BATCH_WORKERS = int(os.getenv("STOCK_BATCH_WORKERS", "8"))
+
 
 HEADERS = {
     "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
@@ -26,11 +38,17 @@ class IndexData:
     change_percent: float
 
 
+def _is_valid_index(idx: IndexData) -> bool:
+    """조회 실패(0값) 결과는 캐시하지 않음"""
+    return idx is not None and idx.value > 0
+
+
+@cached_quote("index:KOSPI", _is_valid_index)
 def get_kospi_index() -> IndexData:
     """코스피 지수 조회 (네이버 JSON API)"""
     try:
         url = "https://m.stock.naver.com/api/index/KOSPI/basic"
-        response = requests.get(url, headers=HEADERS, timeout=10)
+        response = http_client.get(url, headers=HEADERS)
         response.raise_for_status()
         data = response.json()
         
@@ -50,11 +68,12 @@ def get_kospi_index() -> IndexData:
         return IndexData("코스피", 0.0, 0.0, 0.0)
 
 
+@cached_quote("index:KOSDAQ", _is_valid_index)
 def get_kosdaq_index() -> IndexData:
     """코스닥 지수 조회 (네이버 JSON API)"""
     try:
         url = "https://m.stock.naver.com/api/index/KOSDAQ/basic"
-        response = requests.get(url, headers=HEADERS, timeout=10)
+        response = http_client.get(url, headers=HEADERS)
         response.raise_for_status()
         data = response.json()
         
@@ -73,6 +92,7 @@ def get_kosdaq_index() -> IndexData:
         return IndexData("코스닥", 0.0, 0.0, 0.0)
 
 
+@cached_quote("index:NASDAQ", _is_valid_index)
 def get_nasdaq_index() -> IndexData:
     """나스닥 지수 조회 (네이버 해외지수)"""
     from bs4 import BeautifulSoup
@@ -81,9 +101,9 @@ def get_nasdaq_index() -> IndexData:
     try:
         # 네이버 금융 해외지수 페이지 크롤링
         url = "https://finance.naver.com/world/sise.naver?symbol=NAS@IXIC"
-        response = requests.get(url, headers={
+        response = http_client.get(url, headers={
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
-        }, timeout=10)
+        })
         response.raise_for_status()
         
         soup = BeautifulSoup(response.text, "lxml")
@@ -130,15 +150,34 @@ def get_nasdaq_index() -> IndexData:
     return IndexData("나스닥", 0.0, 0.0, 0.0)
 
 
-def get_all_indices() -> List[IndexData]:
-    """모든 주요 지수 조회"""
-    return [
-        get_kospi_index(),
-        get_kosdaq_index(),
-        get_nasdaq_index()
-    ]
+def fetch_index_group(
+    sources: List[Tuple[str, Callable[[], IndexData]]],
+    deadline: Optional[float] = None,
+) -> List[IndexData]:
+    """
+    여러 지수/시세를 동시에 조회
+
+    Args:
+        sources: (이름, 조회 함수) 리스트
+        deadline: 전체 마감 시간(초). 넘긴 소스는 0값 IndexData로 채움
+
+    Returns:
+        sources 순서대로 정렬된 IndexData 리스트
+    """
+    results = http_client.fetch_all({name: fn for name, fn in sources}, deadline)
+    return [results.get(name) or IndexData(name, 0.0, 0.0, 0.0) for name, _ in sources]
+
+
+def get_all_indices(deadline: Optional[float] = None) -> List[IndexData]:
+    """모든 주요 지수 조회 (동시 조회)"""
+    return fetch_index_group([
+        ("코스피", get_kospi_index),
+        ("코스닥", get_kosdaq_index),
+        ("나스닥", get_nasdaq_index),
+    ], deadline)
 
 
+@cached_quote("index:NI225", _is_valid_index)
 def get_nikkei_index() -> IndexData:
     """니케이225 지수 조회 (네이버 해외지수 JPX@NI225)"""
     from bs4 import BeautifulSoup
@@ -146,10 +185,10 @@ def get_nikkei_index() -> IndexData:
     
     try:
         url = "https://finance.naver.com/world/sise.naver?symbol=JPX@NI225"
-        response = requests.get(url, headers={
+        response = http_client.get(url, headers={
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
             "Accept-Language": "ko-KR,ko;q=0.9",
-        }, timeout=10)
+        })
         response.raise_for_status()
         response.encoding = response.apparent_encoding or "utf-8"
         soup = BeautifulSoup(response.text, "lxml")
@@ -193,6 +232,7 @@ def get_nikkei_index() -> IndexData:
     return IndexData("니케이225", 0.0, 0.0, 0.0)
 
 
+@cached_quote(lambda code, name: f"commodity:{code}", _is_valid_index)
 def get_commodity_price(code: str, name: str) -> IndexData:
     """원자재 시세 조회 (금, 은, 구리) - worldGoldDetail 동일 템플릿 사용"""
     from bs4 import BeautifulSoup
@@ -200,10 +240,10 @@ def get_commodity_price(code: str, name: str) -> IndexData:
     
     try:
         url = f"https://finance.naver.com/marketindex/worldGoldDetail.naver?marketindexCd={code}"
-        response = requests.get(url, headers={
+        response = http_client.get(url, headers={
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
             "Accept-Language": "ko-KR,ko;q=0.9",
-        }, timeout=10)
+        })
         response.raise_for_status()
         response.encoding = response.apparent_encoding or "utf-8"
         html = response.text
@@ -279,11 +319,12 @@ def get_copper_price() -> IndexData:
     return get_commodity_price("CMDT_HG", "구리")
 
 
+@cached_quote("crypto:BTC", _is_valid_index)
 def get_btc_price() -> IndexData:
     """비트코인 시세 (CoinGecko 무료 API)"""
     try:
         url = "https://api.coingecko.com/api/v3/simple/price?ids=bitcoin&vs_currencies=usd&include_24hr_change=true"
-        response = requests.get(url, headers=HEADERS, timeout=10)
+        response = http_client.get(url, headers=HEADERS)
         response.raise_for_status()
         data = response.json()
         btc = data.get("bitcoin", {})
@@ -297,21 +338,32 @@ def get_btc_price() -> IndexData:
     return IndexData("비트코인", 0.0, 0.0, 0.0)
 
 
-def get_commodities_and_world() -> List[IndexData]:
-    """원자재 및 해외 지수 조회"""
-    return [
-        get_nikkei_index(),
-        get_gold_price(),
-        get_silver_price(),
-        get_copper_price()
-    ]
+def get_commodities_and_world(deadline: Optional[float] = None) -> List[IndexData]:
+    """원자재 및 해외 지수 조회 (동시 조회)"""
+    return fetch_index_group([
+        ("니케이225", get_nikkei_index),
+        ("금", get_gold_price),
+        ("은", get_silver_price),
+        ("구리", get_copper_price),
+    ], deadline)
 
 
+def get_commodities_and_btc(deadline: Optional[float] = None) -> List[IndexData]:
+    """원자재(금, 은, 구리) 및 비트코인 시세 조회 (동시 조회)"""
+    return fetch_index_group([
+        ("금", get_gold_price),
+        ("은", get_silver_price),
+        ("구리", get_copper_price),
+        ("비트코인", get_btc_price),
+    ], deadline)
+
+
+@cached_quote(lambda code: f"stock:{code}")
 def get_stock_price(code: str) -> Optional[Dict[str, Any]]:
     """개별 종목 시세 조회 (네이버 JSON API)"""
     try:
         url = f"https://m.stock.naver.com/api/stock/{code}/basic"
-        response = requests.get(url, headers=HEADERS, timeout=10)
+        response = http_client.get(url, headers=HEADERS)
         response.raise_for_status()
         data = response.json()
         
@@ -344,11 +396,40 @@ def get_stock_price(code: str) -> Optional[Dict[str, Any]]:
         return None
 
 
+def get_stock_prices(codes: Iterable[str], max_workers: int = STOCK_BATCH_WORKERS) -> Dict[str, Optional[Dict[str, Any]]]:
+    """
+    여러 종목 시세 일괄 조회
+
+    Args:
+        codes: 종목코드 목록 (중복·빈 값은 제거)
+        max_workers: 동시에 조회할 최대 종목 수
+
+    Returns:
+        종목코드 -> get_stock_price 결과 (실패 시 None), 입력 순서 유지
+    """
+    unique = list(dict.fromkeys(c.strip() for c in codes if c and c.strip()))
+    results: Dict[str, Optional[Dict[str, Any]]] = {}
+    missing = []
+    for code in unique:
+        cached = quote_cache.get(f"stock:{code}")
+        if cached is not None:
+            results[code] = copy.copy(cached)
+        else:
+            missing.append(code)
+
+    if missing:
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(missing)))) as pool:
+            for code, stock in zip(missing, pool.map(get_stock_price, missing)):
+                results[code] = stock
+
+    return {code: results.get(code) for code in unique}
+
+
 def get_stock_basic_info(code: str) -> Optional[Dict[str, Any]]:
     """종목 기본 정보 조회"""
     try:
         url = f"https://m.stock.naver.com/api/stock/{code}/integration"
-        response = requests.get(url, headers=HEADERS, timeout=10)
+        response = http_client.get(url, headers=HEADERS)
         response.raise_for_status()
         data = response.json()
         
@@ -0,0 +1,218 @@
+# -*- coding: utf-8 -*-
+"""
+공용 HTTP 클라이언트
+
+크롤러·기술지표·뉴스 모듈이 함께 쓰는 호스트별 keep-alive 커넥션 풀과,
+여러 데이터 소스를 하나의 마감 시간 안에서 동시에 조회하는 fan-out 헬퍼를 제공합니다.
+"""
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, Optional, Tuple, TypeVar, Union
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    from .ratelimit import RateLimitTimeout, guard_for
+    from .singleflight import SingleFlight, WaitTimeout
+except ImportError:
+    from ratelimit import RateLimitTimeout, guard_for
+    from singleflight import SingleFlight, WaitTimeout
+
+T = TypeVar("T")
+
+# 호스트당 최대 연결 수 (keep-alive로 재사용, 초과 요청은 빈 연결을 기다림)
+POOL_MAXSIZE = int(os.getenv("HTTP_POOL_MAXSIZE", "20"))
+# 연결/읽기 타임아웃 (초)
+CONNECT_TIMEOUT = float(os.getenv("HTTP_CONNECT_TIMEOUT", "3"))
+READ_TIMEOUT = float(os.getenv("HTTP_READ_TIMEOUT", "10"))
+# 동시 조회 워커 수
+FETCH_WORKERS = int(os.getenv("FETCH_WORKERS", "16"))
+# 동시 조회 전체 마감 시간 (초). 넘긴 소스는 결과에서 빠짐
+FETCH_DEADLINE = float(os.getenv("FETCH_DEADLINE", "8"))
+DEFAULT_TIMEOUT = (CONNECT_TIMEOUT, READ_TIMEOUT)
+
+
+def _create_session() -> requests.Session:
+    session = requests.Session()
+    # 연결 수립 실패만 1회 재시도 (읽기 실패는 재시도하지 않음)
+    adapter = HTTPAdapter(
+        pool_connections=1,
+        pool_maxsize=POOL_MAXSIZE,
+        pool_block=True,
+        max_retries=Retry(total=1, connect=1, read=0, status=0, backoff_factor=0.2),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+# 호스트(스킴+호스트) -> 전용 세션
+_sessions: Dict[str, requests.Session] = {}
+_request_counts: Dict[str, int] = {}
+_sessions_lock = threading.Lock()
+
+
+def _host_key(url: str) -> str:
+    parts = urlsplit(url)
+    return f"{parts.scheme}://{parts.netloc}"
+
+
+def session_for(url: str) -> requests.Session:
+    """URL의 호스트 전용 세션 (없으면 생성)"""
+    host = _host_key(url)
+    with _sessions_lock:
+        session = _sessions.get(host)
+        if session is None:
+            session = _sessions[host] = _create_session()
+        _request_counts[host] = _request_counts.get(host, 0) + 1
+        return session
+
+
+def pool_stats() -> Dict[str, Dict[str, Any]]:
+    """호스트별 요청 수와 풀에 유지 중인 연결 수"""
+    out = {}
+    with _sessions_lock:
+        for host, session in _sessions.items():
+            pools = session.get_adapter(host).poolmanager.pools
+            opened = sum(pools[key].num_connections for key in pools.keys())
+            out[host] = {"requests": _request_counts.get(host, 0), "connectionsOpened": opened}
+    return out
+
+
+_executor = ThreadPoolExecutor(max_workers=FETCH_WORKERS, thread_name_prefix="fetch")
+# fetch_all 작업 스레드의 마감 시각 (time.monotonic 기준). get()이 타임아웃을 남은 시간으로 줄임
+_deadline = threading.local()
+
+
+class DeadlineExceeded(requests.Timeout):
+    """fetch_all 마감 때문에 요청을 보내지 않았거나 줄인 타임아웃이 만료됨 (업스트림 장애 아님)"""
+
+
+def _remaining() -> Optional[float]:
+    """현재 스레드의 마감까지 남은 시간 (초). 마감이 없으면 None"""
+    at = getattr(_deadline, "at", None)
+    return None if at is None else at - time.monotonic()
+
+
+def _within_deadline(timeout: Union[float, Tuple[float, float]]) -> Union[float, Tuple[float, float]]:
+    """현재 스레드에 마감 시각이 있으면 타임아웃을 남은 시간 이하로 (이미 지났으면 DeadlineExceeded)"""
+    remaining = _remaining()
+    if remaining is None:
+        return timeout
+    if remaining <= 0:
+        raise DeadlineExceeded("fetch deadline exceeded")
+    if isinstance(timeout, tuple):
+        return tuple(min(t, remaining) for t in timeout)
+    return min(timeout, remaining)
+
+
+def _run_until(fn: Callable[[], T], at: float) -> T:
+    """마감 시각을 건 채로 fn 실행 (중첩 호출이면 더 이른 마감 유지)"""
+    previous = getattr(_deadline, "at", None)
+    _deadline.at = at if previous is None else min(at, previous)
+    try:
+        return fn()
+    finally:
+        _deadline.at = previous
+
+
+# 동일한 (URL, 파라미터) GET 요청 병합
+inflight = SingleFlight()
+
+
+def get(
+    url: str,
+    params: Optional[Dict[str, Any]] = None,
+    headers: Optional[Dict[str, str]] = None,
+    timeout: Union[float, Tuple[float, float]] = DEFAULT_TIMEOUT,
+    coalesce: bool = True,
+) -> requests.Response:
+    """
+    호스트별 공용 세션으로 GET 요청 (keep-alive 연결 재사용)
+
+    coalesce=True면 같은 URL·파라미터로 진행 중인 요청이 있을 때 새로 보내지 않고
+    그 응답을 함께 사용합니다. 응답 본문은 이미 읽힌 상태라 여러 스레드에서 읽어도 안전합니다.
+    먼저 보낸 요청이 그 호출자의 fetch_all 마감으로 실패하면 기다리던 호출은 직접 다시 요청합니다.
+    실제 요청은 호스트별 요청 제한을 따르며, 서킷이 열린 호스트는 CircuitOpenError로 바로 실패합니다.
+    fetch_all 마감 때문에 생긴 타임아웃은 호스트 실패로 집계하지 않습니다.
+    """
+    def send() -> requests.Response:
+        guard = guard_for(urlsplit(url).netloc)
+        # 마감이 이미 지났거나 토큰 대기가 마감을 넘기면 토큰·시험 요청 기회를 쓰지 않고 실패
+        _within_deadline(timeout)
+        try:
+            guard.before_request(max_wait=_remaining())
+        except RateLimitTimeout as e:
+            raise DeadlineExceeded(f"fetch deadline exceeded ({e})") from None
+        try:
+            bounded = _within_deadline(timeout)
+        except DeadlineExceeded:
+            guard.breaker.release()
+            raise
+        try:
+            response = session_for(url).get(url, params=params, headers=headers, timeout=bounded)
+        except requests.Timeout as e:
+            # 마감에 맞춰 줄인 타임아웃이 만료된 것은 업스트림 장애로 보지 않음
+            if bounded != timeout:
+                guard.breaker.release()
+                raise DeadlineExceeded(f"fetch deadline exceeded ({e})") from e
+            guard.breaker.record_failure()
+            raise
+        except requests.RequestException:
+            guard.breaker.record_failure()
+            raise
+        # 5xx·429는 호스트 장애/차단으로 보고 실패로 집계
+        if response.status_code >= 500 or response.status_code == 429:
+            guard.breaker.record_failure()
+        else:
+            guard.breaker.record_success()
+        return response
+
+    if not coalesce:
+        return send()
+    key = (url, tuple(sorted((params or {}).items())))
+    # 리더의 마감 초과는 공유하지 않고(기다리던 호출은 새 리더로 다시 시도), 기다리는 시간은 자기 마감까지
+    try:
+        return inflight.do(
+            key, send, timeout=_remaining(), share_error=lambda e: not isinstance(e, DeadlineExceeded)
+        )
+    except WaitTimeout:
+        raise DeadlineExceeded(f"fetch deadline exceeded waiting for {url}") from None
+
+
+def fetch_all(tasks: Dict[str, Callable[[], T]], deadline: Optional[float] = None) -> Dict[str, T]:
+    """
+    여러 조회 함수를 동시에 실행
+
+    Args:
+        tasks: 키 -> 인자 없는 조회 함수
+        deadline: 전체 마감 시간(초). 없으면 FETCH_DEADLINE.
+            작업 안의 get() 요청 타임아웃은 남은 시간으로 줄어들고, 마감 뒤 시작한 요청은 바로 실패합니다.
+
+    Returns:
+        마감 시간 안에 성공한 결과만 담은 딕셔너리 (실패·시간 초과 키는 빠짐)
+    """
+    if deadline is None:
+        deadline = FETCH_DEADLINE
+    # 마감을 넘긴 작업도 워커를 붙잡고 있지 않도록 요청 타임아웃을 남은 시간으로 제한
+    at = time.monotonic() + deadline
+    futures = {key: _executor.submit(_run_until, fn, at) for key, fn in tasks.items()}
+    done, _ = wait(futures.values(), timeout=deadline)
+
+    results: Dict[str, T] = {}
+    for key, future in futures.items():
+        if future not in done:
+            future.cancel()
+            print(f"[Warning] {key} missed fetch deadline ({deadline}s)")
+            continue
+        error = future.exception()
+        if error is not None:
+            print(f"[Error] {key} fetch failed: {error}")
+            continue
+        results[key] = future.result()
+    return results
@@ -0,0 +1,300 @@
+# -*- coding: utf-8 -*-
+"""
+다종목 벡터화 기술적 지표 엔진
+
+종목 × 일자 종가 행렬 하나로 전 종목의 RSI, 볼린저밴드, 이동평균(5/20/60/120),
+골든/데드크로스를 NumPy 연산 한 번에 계산합니다.
+detect_crosses는 전 구간의 MA 교차 이벤트를 모든 종목·MA 쌍에 대해 한 번에 찾아 인덱스로 만듭니다.
+계산 규칙은 technical.py의 pandas 구현(calculate_rsi, calculate_bollinger_bands,
+calculate_moving_averages, check_cross)과 같고, 결과는 TechnicalIndicators로 반환합니다.
+
+행렬은 종목마다 자기 일봉을 오른쪽(최근 봉)에 맞춰 채우고 부족한 앞부분은 NaN으로 둡니다.
+(달력 날짜로 맞추면 거래정지일이 NaN 구멍이 되어 종목별 계산과 결과가 달라짐)
+"""
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+try:
+    from .cache import indicator_memo
+    from .technical import (
+        TechnicalIndicators, _stock_name, get_bb_status, get_ma_status,
+        get_rsi_status, get_stock_ohlcv, get_trend,
+    )
+except ImportError:
+    from cache import indicator_memo
+    from technical import (
+        TechnicalIndicators, _stock_name, get_bb_status, get_ma_status,
+        get_rsi_status, get_stock_ohlcv, get_trend,
+    )
+
+RSI_PERIOD = 14
+BB_PERIOD = 20
+BB_STD_DEV = 2.0
+MA_WINDOWS = (5, 20, 60, 120)
+CROSS_LOOKBACK = 5  # check_cross와 같은 최근 5개 지점
+MIN_BARS = 120  # analyze_stock과 같은 최소 봉 수
+
+
+def close_matrix(closes: Sequence[Sequence[float]], days: int = 150) -> np.ndarray:
+    """
+    종목별 종가 시퀀스 -> (종목 수, days) 행렬
+
+    각 행은 해당 종목의 최근 days개 종가를 오래된 순으로 오른쪽 정렬하고, 빈 앞부분은 NaN입니다.
+    """
+    matrix = np.full((len(closes), days), np.nan)
+    for i, series in enumerate(closes):
+        values = np.asarray(series, dtype=float)[-days:]
+        if len(values):
+            matrix[i, days - len(values):] = values
+    return matrix
+
+
+def _rolling_mean_tail(close: np.ndarray, window: int, points: int = 1) -> np.ndarray:
+    """각 행의 마지막 points개 지점의 window 이동평균 (창에 NaN이 있으면 NaN)"""
+    tail = close[:, -(window + points - 1):]
+    return sliding_window_view(tail, window, axis=1).mean(axis=-1)
+
+
+def compute_indicator_arrays(close: np.ndarray) -> Dict[str, np.ndarray]:
+    """
+    종가 행렬의 최신 지표를 종목별 1차원 배열로 계산
+
+    Args:
+        close: (종목 수, 일수) 종가 행렬, 최근 봉이 마지막 열
+
+    Returns:
+        price, rsi, bb_upper/middle/lower/width, ma5/20/60/120, golden_cross, dead_cross, bars
+    """
+    close = np.asarray(close, dtype=float)
+    if close.ndim != 2 or close.shape[1] < MIN_BARS:
+        raise ValueError(f"close matrix must be 2-D (symbols x days) with at least {MIN_BARS} days")
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        # RSI: pandas diff().where()와 같이 첫 변화량(NaN)은 상승/하락 0으로 취급
+        delta = np.diff(close[:, -(RSI_PERIOD + 1):], axis=1, prepend=np.nan)[:, -RSI_PERIOD:]
+        gain = np.where(delta > 0, delta, 0.0)
+        loss = np.where(delta < 0, -delta, 0.0)
+        avg_gain = gain.mean(axis=1)
+        avg_loss = loss.mean(axis=1)
+        rsi = 100 - 100 / (1 + avg_gain / avg_loss)
+
+        # 볼린저밴드: 표본 표준편차(ddof=1)
+        window = close[:, -BB_PERIOD:]
+        middle = window.mean(axis=1)
+        std = window.std(axis=1, ddof=1)
+        upper = middle + std * BB_STD_DEV
+        lower = middle - std * BB_STD_DEV
+        width = (upper - lower) / middle * 100
+
+        ma = {w: _rolling_mean_tail(close, w, CROSS_LOOKBACK if w in (5, 20) else 1) for w in MA_WINDOWS}
+
+        # 골든/데드크로스: 최근 5개 지점 중 연속 두 지점에서 MA5-MA20 부호가 바뀜
+        diff = ma[5] - ma[20]
+        prev, curr = diff[:, :-1], diff[:, 1:]
+        golden = ((prev < 0) & (curr > 0)).any(axis=1)
+        dead = ((prev > 0) & (curr < 0)).any(axis=1)
+
+    return {
+        "price": close[:, -1],
+        "bars": np.count_nonzero(~np.isnan(close), axis=1),
+        "rsi": rsi,
+        "bb_upper": upper,
+        "bb_middle": middle,
+        "bb_lower": lower,
+        "bb_width": width,
+        "ma5": ma[5][:, -1],
+        "ma20": ma[20][:, -1],
+        "ma60": ma[60][:, -1],
+        "ma120": ma[120][:, -1],
+        "golden_cross": golden,
+        "dead_cross": dead,
+    }
+
+
+def analyze_close_matrix(
+    codes: Sequence[str],
+    close: np.ndarray,
+    names: Optional[Sequence[str]] = None,
+) -> List[Optional[TechnicalIndicators]]:
+    """
+    종가 행렬 -> 종목별 TechnicalIndicators (codes 순서, 봉이 부족한 종목은 None)
+    """
+    if len(codes) != len(close):
+        raise ValueError("codes and close matrix rows must have the same length")
+
+    arrays = compute_indicator_arrays(close)
+    # 상태 판단은 technical.py의 함수를 그대로 써서 분류 기준을 한 곳에 유지
+    cols = {k: v.tolist() for k, v in arrays.items()}
+
+    results: List[Optional[TechnicalIndicators]] = []
+    for i, code in enumerate(codes):
+        if cols["bars"][i] < MIN_BARS:
+            results.append(None)
+            continue
+        price, rsi = cols["price"][i], cols["rsi"][i]
+        upper, middle, lower = cols["bb_upper"][i], cols["bb_middle"][i], cols["bb_lower"][i]
+        ma5, ma20, ma60, ma120 = cols["ma5"][i], cols["ma20"][i], cols["ma60"][i], cols["ma120"][i]
+        results.append(TechnicalIndicators(
+            code=code,
+            name=names[i] if names is not None else _stock_name(code),
+            current_price=price,
+            rsi=round(rsi, 2),
+            rsi_status=get_rsi_status(rsi),
+            bb_upper=round(upper, 2),
+            bb_middle=round(middle, 2),
+            bb_lower=round(lower, 2),
+            bb_status=get_bb_status(price, upper, middle, lower),
+            bb_width=round(cols["bb_width"][i], 2),
+            ma5=round(ma5, 2),
+            ma20=round(ma20, 2),
+            ma60=round(ma60, 2),
+            ma120=round(ma120, 2),
+            ma_status=get_ma_status(ma5, ma20, ma60, ma120),
+            trend=get_trend(price, ma20, ma60, rsi),
+            golden_cross=cols["golden_cross"][i],
+            dead_cross=cols["dead_cross"][i],
+        ))
+    return results
+
+
+def analyze_stocks_vectorized(codes: List[str], days: int = 150) -> List[TechnicalIndicators]:
+    """
+    여러 종목 일봉을 불러와 한 번에 기술적 분석 (봉이 부족하거나 조회 실패한 종목은 제외)
+    """
+    closes = []
+    for code in codes:
+        df = get_stock_ohlcv(code, days)
+        closes.append(df["close"].to_numpy() if df is not None else [])
+    results = analyze_close_matrix(codes, close_matrix(closes, days))
+    return [r for r in results if r is not None]
+
+
+# ===== 이동평균 교차 이벤트 =====
+
+DEFAULT_CROSS_PAIRS = ((5, 20), (20, 60), (60, 120))
+CROSS_KINDS = {1: "golden", -1: "dead"}
+
+
+def moving_average_matrix(close: np.ndarray, window: int) -> np.ndarray:
+    """전 구간 이동평균 (pandas rolling(window).mean()과 같이 앞 window-1개와 NaN 포함 창은 NaN)"""
+    out = np.full(close.shape, np.nan)
+    if close.shape[-1] >= window:
+        out[..., window - 1:] = sliding_window_view(close, window, axis=-1).mean(axis=-1)
+    return out
+
+
+class CrossEventIndex:
+    """
+    골든/데드크로스 이벤트 인덱스
+
+    이벤트마다 (종목 행, 발생 일자 열, MA 쌍, 종류)를 정수 배열로 보관하며 (종목, 일자) 순으로 정렬됩니다.
+    발생 일자는 단기 MA가 장기 MA를 넘어선(또는 내려간) 첫 봉입니다.
+    """
+
+    def __init__(self, symbol: np.ndarray, pos: np.ndarray, pair: np.ndarray, kind: np.ndarray,
+                 pairs: Sequence[tuple], codes: Sequence[str], dates: Optional[np.ndarray], days: int):
+        self.symbol = symbol
+        self.pos = pos
+        self.pair = pair
+        self.kind = kind
+        self.pairs = tuple(pairs)
+        self.codes = list(codes)
+        self.dates = dates
+        self.days = days
+
+    def __len__(self) -> int:
+        return len(self.pos)
+
+    def _date(self, symbol: int, pos: int) -> Optional[str]:
+        if self.dates is None:
+            return None
+        return str(self.dates[pos] if self.dates.ndim == 1 else self.dates[symbol, pos])
+
+    def mask(self, code: Optional[str] = None, kind: Optional[str] = None,
+             pair: Optional[tuple] = None, within: Optional[int] = None) -> np.ndarray:
+        """조건에 맞는 이벤트 불리언 마스크 (within: 최근 within개 봉 이내)"""
+        m = np.ones(len(self), dtype=bool)
+        if code is not None:
+            m &= self.symbol == (self.codes.index(code) if code in self.codes else -1)
+        if kind is not None:
+            m &= self.kind == {v: k for k, v in CROSS_KINDS.items()}[kind]
+        if pair is not None:
+            m &= self.pair == (self.pairs.index(tuple(pair)) if tuple(pair) in self.pairs else -1)
+        if within is not None:
+            m &= self.pos >= self.days - within
+        return m
+
+    def query(self, code: Optional[str] = None, kind: Optional[str] = None,
+              pair: Optional[tuple] = None, within: Optional[int] = None) -> List[Dict[str, Any]]:
+        """조건에 맞는 이벤트 목록 (종목, 일자 순)"""
+        idx = np.flatnonzero(self.mask(code, kind, pair, within))
+        return [
+            {
+                "code": self.codes[s],
+                "date": self._date(s, p),
+                "barsAgo": self.days - 1 - p,
+                "type": CROSS_KINDS[k],
+                "pair": f"MA{self.pairs[q][0]}/MA{self.pairs[q][1]}",
+            }
+            for s, p, q, k in zip(self.symbol[idx].tolist(), self.pos[idx].tolist(),
+                                  self.pair[idx].tolist(), self.kind[idx].tolist())
+        ]
+
+    def bars_since(self, kind: str, pair: tuple) -> np.ndarray:
+        """종목별 마지막 kind 크로스 이후 지난 봉 수 (없으면 -1)"""
+        m = self.mask(kind=kind, pair=pair)
+        last = np.full(len(self.codes), -1)
+        np.maximum.at(last, self.symbol[m], self.pos[m])
+        return np.where(last >= 0, self.days - 1 - last, -1)
+
+
+def detect_crosses(
+    close: np.ndarray,
+    pairs: Sequence[tuple] = DEFAULT_CROSS_PAIRS,
+    codes: Optional[Sequence[str]] = None,
+    dates: Optional[np.ndarray] = None,
+) -> CrossEventIndex:
+    """
+    전 구간 MA 교차 이벤트를 모든 종목·MA 쌍에 대해 한 번에 탐지
+
+    check_cross와 같이 직전 봉의 (단기-장기)가 음수이고 현재 봉이 양수면 골든, 반대면 데드크로스입니다.
+
+    Args:
+        close: 종가 (일수,) 또는 (종목 수, 일수)
+        pairs: (단기, 장기) MA 기간 쌍 목록
+        codes: 종목코드 (행 순서)
+        dates: 일자 (일수,) 공통 또는 (종목 수, 일수) 종목별
+    """
+    close = np.atleast_2d(np.asarray(close, dtype=float))
+    windows = sorted({w for pair in pairs for w in pair})
+    with np.errstate(invalid="ignore"):
+        ma = {w: moving_average_matrix(close, w) for w in windows}
+        # (쌍, 종목, 일자) 차이 텐서에서 부호 변화를 한 번에 찾음
+        diff = np.stack([ma[s] - ma[l] for s, l in pairs])
+        prev, curr = diff[..., :-1], diff[..., 1:]
+        kind = np.where((prev < 0) & (curr > 0), 1, 0) - np.where((prev > 0) & (curr < 0), 1, 0)
+    pair, symbol, pos = np.nonzero(kind)
+    kinds = kind[pair, symbol, pos].astype(np.int8)
+    pos = pos + 1  # 변화가 확인된 봉
+    order = np.lexsort((pair, pos, symbol))
+    if codes is None:
+        codes = [str(i) for i in range(close.shape[0])]
+    if dates is not None:
+        dates = np.asarray(dates)
+    return CrossEventIndex(symbol[order], pos[order], pair[order], kinds[order],
+                           pairs, codes, dates, close.shape[1])
+
+
+def get_cross_events(code: str, days: int = 500, pairs: Sequence[tuple] = DEFAULT_CROSS_PAIRS) -> Optional[CrossEventIndex]:
+    """종목 하나의 최근 days개 봉 교차 이벤트 (마지막 봉이 같으면 indicator_memo에서 재사용)"""
+    df = get_stock_ohlcv(code, days)
+    if df is None or df.empty:
+        return None
+    key = ("cross", code, df["date"].iloc[-1], float(df["close"].iloc[-1]), days, tuple(pairs))
+    events = indicator_memo.get(key)
+    if events is None:
+        events = detect_crosses(df["close"].to_numpy(), pairs, [code], df["date"].to_numpy())
+        indicator_memo.set(key, events, float("inf"))
+    return events
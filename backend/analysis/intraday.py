@@ -0,0 +1,219 @@
+# -*- coding: utf-8 -*-
+"""
+장중 분봉 저장소
+
+관심 종목의 분봉을 종목별 고정 크기 링 버퍼(미리 할당한 NumPy 배열)에 보관합니다.
+갱신할 때는 마지막으로 받은 분봉부터 현재까지만 네이버 금융 siseJson(timeframe=minute)에서 받아
+덧붙이므로, 매번 장 전체 분봉을 다시 내려받지 않습니다.
+technical.py의 지표 함수(RSI, 볼린저밴드, 이동평균)를 그대로 분봉에 적용할 수 있습니다.
+
+환경변수:
+    INTRADAY_RING_SIZE: 종목당 보관할 최대 분봉 수 (기본 800, 약 2거래일)
+    INTRADAY_MIN_INTERVAL: 같은 종목 분봉을 다시 받기까지 최소 간격 (초)
+    INTRADAY_MAX_RINGS: 보관할 최대 종목 수 (넘으면 가장 오래 안 쓴 종목의 링부터 제거)
+"""
+import os
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+try:
+    from . import http_client
+    from .cache import KST
+    from .sise_parser import parse_sise_json
+    from .technical import HEADERS, calculate_bollinger_bands, calculate_moving_averages, calculate_rsi
+except ImportError:
+    import http_client
+    from cache import KST
+    from sise_parser import parse_sise_json
+    from technical import HEADERS, calculate_bollinger_bands, calculate_moving_averages, calculate_rsi
+
+INTRADAY_RING_SIZE = int(os.getenv("INTRADAY_RING_SIZE", "800"))
+INTRADAY_MIN_INTERVAL = float(os.getenv("INTRADAY_MIN_INTERVAL", "30"))
+INTRADAY_MAX_RINGS = int(os.getenv("INTRADAY_MAX_RINGS", "200"))
+
+FIELDS = ("open", "high", "low", "close", "volume")
+
+
+class MinuteRing:
+    """분봉 링 버퍼 (가득 차면 가장 오래된 분봉부터 덮어씀)"""
+
+    def __init__(self, capacity: int = INTRADAY_RING_SIZE):
+        self.capacity = capacity
+        self.ts = np.zeros(capacity, dtype=np.int64)  # YYYYMMDDHHMM
+        self.data = {f: np.zeros(capacity) for f in FIELDS}
+        self._head = 0  # 다음에 쓸 위치
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def last_ts(self) -> Optional[int]:
+        if not self._size:
+            return None
+        return int(self.ts[(self._head - 1) % self.capacity])
+
+    def extend(self, ts: np.ndarray, columns: Dict[str, np.ndarray]) -> int:
+        """
+        분봉 추가 (오래된 순). 마지막 분봉과 같은 시각이면 덮어쓰고(진행 중인 분봉), 이전 시각은 무시
+
+        Returns:
+            새로 추가한 분봉 수
+        """
+        added = 0
+        with self._lock:
+            last = self.last_ts
+            for i, t in enumerate(ts.tolist()):
+                if last is not None and t < last:
+                    continue
+                if t == last:
+                    pos = (self._head - 1) % self.capacity
+                else:
+                    pos = self._head
+                    self._head = (self._head + 1) % self.capacity
+                    self._size = min(self._size + 1, self.capacity)
+                    added += 1
+                self.ts[pos] = t
+                for f in FIELDS:
+                    self.data[f][pos] = columns[f][i]
+                last = t
+        return added
+
+    def arrays(self, n: Optional[int] = None) -> Dict[str, np.ndarray]:
+        """최근 n개(없으면 전체) 분봉 컬럼 복사본 (오래된 순)"""
+        with self._lock:
+            size = self._size if n is None else min(n, self._size)
+            idx = (np.arange(self._head - size, self._head)) % self.capacity
+            out = {"ts": self.ts[idx]}
+            for f in FIELDS:
+                out[f] = self.data[f][idx]
+        return out
+
+    def to_frame(self, n: Optional[int] = None) -> pd.DataFrame:
+        """technical.py 지표 함수에 넘길 수 있는 DataFrame (date, open, high, low, close, volume)"""
+        cols = self.arrays(n)
+        return pd.DataFrame({"date": cols.pop("ts").astype(str), **cols})
+
+
+def _fetch_minute_bars(code: str, start: str, end: str) -> Optional[Dict[str, np.ndarray]]:
+    """네이버 금융 siseJson 분봉 조회 (start/end: YYYYMMDDHHMM)"""
+    try:
+        params = {
+            "symbol": code,
+            "requestType": "1",
+            "startTime": start,
+            "endTime": end,
+            "timeframe": "minute",
+        }
+        response = http_client.get("https://api.finance.naver.com/siseJson.naver", params=params, headers=HEADERS)
+        response.raise_for_status()
+        columns = parse_sise_json(response.text)
+        if "close" not in columns:
+            return None
+        # 분봉 응답에 시가·고가·저가가 없거나 0이면 종가로 채움
+        close = columns["close"]
+        for f in ("open", "high", "low"):
+            col = columns.get(f)
+            columns[f] = close.copy() if col is None else np.where(col > 0, col, close)
+        columns.setdefault("volume", np.zeros(len(close)))
+        return columns
+    except Exception as e:
+        print(f"[Error] Failed to fetch minute bars for {code}: {e}")
+        return None
+
+
+class IntradayStore:
+    """종목코드 -> MinuteRing (최대 max_rings개, LRU)"""
+
+    def __init__(self, capacity: int = INTRADAY_RING_SIZE, max_rings: int = INTRADAY_MAX_RINGS):
+        self.capacity = capacity
+        self.max_rings = max_rings
+        self._rings: "OrderedDict[str, MinuteRing]" = OrderedDict()
+        self._fetched_at: Dict[str, float] = {}
+        self._lock = threading.Lock()
+        self.evictions = 0
+
+    def ring(self, code: str) -> MinuteRing:
+        """종목 링 (없으면 할당하고, 가득 차면 가장 오래 안 쓴 종목 링 제거)"""
+        with self._lock:
+            ring = self._rings.get(code)
+            if ring is None:
+                ring = self._rings[code] = MinuteRing(self.capacity)
+                while len(self._rings) > self.max_rings:
+                    evicted, _ = self._rings.popitem(last=False)
+                    self._fetched_at.pop(evicted, None)
+                    self.evictions += 1
+            self._rings.move_to_end(code)
+            return ring
+
+    def get(self, code: str) -> Optional[MinuteRing]:
+        """이미 있는 종목 링 (없으면 할당하지 않고 None)"""
+        with self._lock:
+            ring = self._rings.get(code)
+            if ring is not None:
+                self._rings.move_to_end(code)
+            return ring
+
+    def ingest(self, code: str, min_interval: float = INTRADAY_MIN_INTERVAL) -> int:
+        """
+        마지막 분봉(진행 중일 수 있음)부터 현재까지 분봉을 받아 링에 추가
+
+        Returns:
+            새로 추가한 분봉 수 (min_interval 안에 다시 호출하면 0)
+        """
+        if time.time() - self._fetched_at.get(code, 0.0) < min_interval:
+            return 0
+        ring = self.ring(code)
+        now = datetime.now(KST)
+        last = ring.last_ts
+        today_open = now.strftime("%Y%m%d") + "0900"
+        start = str(last) if last and str(last) >= today_open else today_open
+        columns = _fetch_minute_bars(code, start, now.strftime("%Y%m%d%H%M"))
+        self._fetched_at[code] = time.time()
+        if not columns:
+            return 0
+        return ring.extend(columns["date"].astype(np.int64), columns)
+
+    def codes(self) -> List[str]:
+        with self._lock:
+            return list(self._rings.keys())
+
+    def indicators(self, code: str) -> Optional[Dict[str, Any]]:
+        """분봉 기준 RSI(14)·볼린저밴드(20)·이동평균(5/20/60). 분봉이 20개 미만이면 None"""
+        ring = self.get(code)
+        if ring is None or len(ring) < 20:
+            return None
+        df = ring.to_frame()
+        rsi = calculate_rsi(df).iloc[-1]
+        bb = calculate_bollinger_bands(df)
+        ma = calculate_moving_averages(df)
+
+        def last(series: pd.Series) -> Optional[float]:
+            value = series.iloc[-1]
+            return None if pd.isna(value) else round(float(value), 2)
+
+        return {
+            "code": code,
+            "time": str(ring.last_ts),
+            "price": float(df["close"].iloc[-1]),
+            "bars": len(ring),
+            "rsi": None if pd.isna(rsi) else round(float(rsi), 2),
+            "bbUpper": last(bb["upper"]),
+            "bbMiddle": last(bb["middle"]),
+            "bbLower": last(bb["lower"]),
+            "bbWidth": last(bb["width"]),
+            "ma5": last(ma["ma5"]),
+            "ma20": last(ma["ma20"]),
+            "ma60": last(ma["ma60"]),
+        }
+
+
+# 싱글톤 인스턴스
+intraday_store = IntradayStore()
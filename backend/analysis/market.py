@@ -7,7 +7,7 @@ GPT를 활용하여 기술적 지표, 뉴스 기반 시황 분석, 유망 테마
 import os
 from typing import Dict, List, Any, Optional
 from dataclasses import dataclass, asdict, field
-from datetime import datetime
+from datetime import datetime, timedelta
 import json
 
 from dotenv import load_dotenv
@@ -27,16 +27,17 @@ except ImportError:
 from typing import Generator
 
 try:
+    from .cache import KST
     from .news import news_crawler, NewsItem
+    from .news_store import get_news_store
+    from .poller import market_poller, quote_board
     from .crawler import (
         get_all_indices,
-        get_stock_price,
+        get_stock_prices,
         IndexData,
-        get_gold_price,
-        get_silver_price,
-        get_copper_price,
-        get_btc_price,
+        get_commodities_and_btc,
     )
+    from .symbols import get_symbol_master
     from .technical import (
         analyze_multiple_stocks, 
         format_technical_for_prompt,
@@ -44,16 +45,17 @@ try:
         TechnicalIndicators
     )
 except ImportError:
+    from cache import KST
     from news import news_crawler, NewsItem
+    from news_store import get_news_store
+    from poller import market_poller, quote_board
     from crawler import (
         get_all_indices,
-        get_stock_price,
+        get_stock_prices,
         IndexData,
-        get_gold_price,
-        get_silver_price,
-        get_copper_price,
-        get_btc_price,
+        get_commodities_and_btc,
     )
+    from symbols import get_symbol_master
     from technical import (
         analyze_multiple_stocks, 
         format_technical_for_prompt,
@@ -61,6 +63,9 @@ except ImportError:
         TechnicalIndicators
     )
 
+# 보유 종목 라이브 뉴스가 부족할 때 아카이브에서 찾을 기간 (일)
+HOLDINGS_NEWS_LOOKBACK_DAYS = 7
+
 
 @dataclass
 class MarketIndex:
@@ -167,6 +172,16 @@ def _normalize_holdings_strategy_field(raw: Any) -> str:
     return str(raw)
 
 
+def _commodities_and_btc_from_board() -> Optional[List[IndexData]]:
+    """폴러 시세판의 금·은·구리와 비트코인 (폴러가 꺼져 있거나 스냅샷이 없거나 너무 오래됐으면 None → 직접 조회)"""
+    if not market_poller.is_running():
+        return None
+    commodities, btc = quote_board.get_fresh("commodities"), quote_board.get_fresh("btc")
+    if not commodities or not btc:
+        return None
+    return [idx for idx in commodities[0] if idx.name in ("금", "은", "구리")] + [btc[0]]
+
+
 class MarketAnalyzer:
     """시황 분석기 (Professional Version)"""
     
@@ -208,10 +223,9 @@ class MarketAnalyzer:
         return indices
     
     def get_commodities_and_btc(self) -> List[MarketIndex]:
-        """원자재(금, 은, 구리) 및 비트코인 시세 조회"""
+        """원자재(금, 은, 구리) 및 비트코인 시세 조회 (폴러가 실행 중이면 시세판에서 읽음)"""
         out = []
-        for fn in (get_gold_price, get_silver_price, get_copper_price, get_btc_price):
-            idx = fn()
+        for idx in _commodities_and_btc_from_board() or get_commodities_and_btc():
             out.append(MarketIndex(
                 name=idx.name,
                 value=idx.value,
@@ -255,45 +269,70 @@ class MarketAnalyzer:
         return indices, news, technical_indicators, tech_summary
 
     def _get_holdings_names(self, user_holdings: List[str], tech_list: List) -> Dict[str, str]:
-        """보유 종목 코드 -> 종목명 맵. 기술지표에 있으면 사용, 없으면 API로 조회."""
+        """보유 종목 코드 -> 종목명 맵. 기술지표·종목 마스터에 있으면 사용, 없으면 API로 조회."""
         code_to_name: Dict[str, str] = {}
         for t in tech_list or []:
             code_to_name[t.code] = t.name
+        master = get_symbol_master()
         for code in user_holdings or []:
-            if code in code_to_name:
-                continue
+            name = master.name_of(code)
+            if name and code not in code_to_name:
+                code_to_name[code] = name
+        missing = [code for code in user_holdings or [] if code not in code_to_name]
+        if missing:
             try:
-                info = get_stock_price(code)
-                code_to_name[code] = (info.get("name") or code) if info else code
+                quotes = get_stock_prices(missing)
             except Exception as e:
-                print(f"[Warning] get_stock_price({code}) failed: {e}")
-                code_to_name[code] = code
+                print(f"[Warning] get_stock_prices({missing}) failed: {e}")
+                quotes = {}
+            for code in missing:
+                info = quotes.get(code)
+                code_to_name[code] = (info.get("name") or code) if info else code
         return code_to_name
 
-    def _collect_holdings_news(self, user_holdings: List[str]) -> Dict[str, List[str]]:
-        """보유 종목별 뉴스 제목 수집 (종목코드 -> 제목 리스트)."""
+    def _collect_holdings_news(self, user_holdings: List[str], holdings_names: Dict[str, str] = None) -> Dict[str, List[str]]:
+        """
+        보유 종목별 뉴스 제목 수집 (종목코드 -> 제목 리스트). 캐시에 없는 종목만 동시에 조회.
+
+        라이브 종목 뉴스가 10건이 안 되면 뉴스 아카이브에서 최근 HOLDINGS_NEWS_LOOKBACK_DAYS일 동안
+        그 종목으로 수집됐거나 제목·요약에 종목명이 들어간 기사로 채웁니다.
+        """
+        try:
+            by_code = news_crawler.get_stock_news_many(user_holdings or [], limit=10)
+        except Exception as e:
+            print(f"[Warning] get_stock_news_many failed: {e}")
+            by_code = {}
+        holdings_names = holdings_names or {}
+        # 아카이브의 게시 시각은 한국 시간이므로 기준 시각도 한국 시간으로
+        since = (datetime.now(KST) - timedelta(days=HOLDINGS_NEWS_LOOKBACK_DAYS)).strftime("%Y-%m-%d %H:%M")
         out: Dict[str, List[str]] = {}
         for code in user_holdings or []:
-            try:
-                items = news_crawler.get_stock_news(code, limit=10)
-                out[code] = [n.title for n in items]
-            except Exception as e:
-                print(f"[Warning] get_stock_news({code}) failed: {e}")
-                out[code] = []
+            titles = [n.title for n in by_code.get(code, [])]
+            if len(titles) < 10:
+                name = holdings_names.get(code)
+                try:
+                    archived = get_news_store().search(
+                        q=name if name and name != code else "", code=code, since=since, limit=10, match_any=True
+                    )
+                except Exception as e:
+                    print(f"[Warning] news archive search({code}) failed: {e}")
+                    archived = []
+                titles += [n.title for n in archived if n.title not in titles][:10 - len(titles)]
+            out[code] = titles
         return out
 
-    def generate_analysis(self, user_holdings: List[str] = None, holdings_names: Dict[str, str] = None) -> MarketAnalysis:
-        """AI 시황 분석 생성. holdings_names 있으면 그대로 사용(포트폴리오에서 넘긴 종목명), 없으면 API로 조회."""
+    def generate_analysis(self, user_holdings: List[str] = None, holdings_names: Dict[str, str] = None, timeframes: List[str] = None) -> MarketAnalysis:
+        """AI 시황 분석 생성. holdings_names 있으면 그대로 사용(포트폴리오에서 넘긴 종목명), 없으면 API로 조회. timeframes: 프롬프트에 넣을 주봉/월봉."""
         print(f"[Debug] generate_analysis called, client={self.client is not None}")
         
         # 데이터 수집 (예외 시에도 빈 값으로 진행)
         print("[Info] Collecting market data...")
         indices, news, technical_indicators, tech_summary = self._collect_market_data(user_holdings)
         holdings_technical = technical_indicators if user_holdings else []
-        holdings_news = self._collect_holdings_news(user_holdings) if user_holdings else {}
         if not holdings_names and user_holdings:
             holdings_names = self._get_holdings_names(user_holdings, holdings_technical)
         holdings_names = holdings_names or {}
+        holdings_news = self._collect_holdings_news(user_holdings, holdings_names) if user_holdings else {}
         
         # GPT 클라이언트가 없으면 모의 분석 반환
         if not self.client:
@@ -305,7 +344,7 @@ class MarketAnalyzer:
             prompt = self._build_analysis_prompt(
                 indices, news, technical_indicators, user_holdings,
                 holdings_technical=holdings_technical, holdings_news=holdings_news,
-                holdings_names=holdings_names
+                holdings_names=holdings_names, timeframes=timeframes
             )
             
             print("[Info] Calling OpenAI API...")
@@ -400,7 +439,8 @@ class MarketAnalyzer:
         user_holdings: List[str] = None,
         holdings_technical: List[TechnicalIndicators] = None,
         holdings_news: Dict[str, List[str]] = None,
-        holdings_names: Dict[str, str] = None
+        holdings_names: Dict[str, str] = None,
+        timeframes: List[str] = None
     ) -> str:
         """분석 프롬프트 생성"""
         holdings_technical = holdings_technical or []
@@ -427,7 +467,7 @@ class MarketAnalyzer:
         ])
         
         # 기술적 지표
-        tech_text = format_technical_for_prompt(technical_indicators)
+        tech_text = format_technical_for_prompt(technical_indicators, timeframes)
         
         # 보유 종목 정보 (종목별 이름·기술지표·뉴스)
         holdings_text = ""
@@ -517,18 +557,18 @@ class MarketAnalyzer:
 
         return prompt
     
-    def generate_analysis_stream(self, user_holdings: List[str] = None, holdings_names: Dict[str, str] = None) -> Generator[str, None, None]:
-        """AI 시황 분석 스트리밍 생성. holdings_names 있으면 그대로 사용(포트폴리오에서 넘긴 종목명)."""
+    def generate_analysis_stream(self, user_holdings: List[str] = None, holdings_names: Dict[str, str] = None, timeframes: List[str] = None) -> Generator[str, None, None]:
+        """AI 시황 분석 스트리밍 생성. holdings_names 있으면 그대로 사용(포트폴리오에서 넘긴 종목명). timeframes: 프롬프트에 넣을 주봉/월봉."""
         print(f"[Debug] generate_analysis_stream called, client={self.client is not None}")
         
         yield "data: [STATUS] 시장 데이터 수집 중...\n\n"
         print("[Info] Collecting market data...")
         indices, news, technical_indicators, tech_summary = self._collect_market_data(user_holdings)
         holdings_technical = technical_indicators if user_holdings else []
-        holdings_news = self._collect_holdings_news(user_holdings) if user_holdings else {}
         if not holdings_names and user_holdings:
             holdings_names = self._get_holdings_names(user_holdings, holdings_technical)
         holdings_names = holdings_names or {}
+        holdings_news = self._collect_holdings_news(user_holdings, holdings_names) if user_holdings else {}
         
         # GPT 클라이언트가 없으면 에러
         if not self.client:
@@ -543,7 +583,7 @@ class MarketAnalyzer:
             prompt = self._build_streaming_prompt(
                 indices, news, technical_indicators, user_holdings,
                 holdings_technical=holdings_technical, holdings_news=holdings_news,
-                holdings_names=holdings_names
+                holdings_names=holdings_names, timeframes=timeframes
             )
             
             print("[Info] Calling OpenAI API with streaming...")
@@ -620,7 +660,8 @@ class MarketAnalyzer:
         user_holdings: List[str] = None,
         holdings_technical: List[TechnicalIndicators] = None,
         holdings_news: Dict[str, List[str]] = None,
-        holdings_names: Dict[str, str] = None
+        holdings_names: Dict[str, str] = None,
+        timeframes: List[str] = None
     ) -> str:
         """스트리밍용 프롬프트 생성"""
         holdings_technical = holdings_technical or []
@@ -647,7 +688,7 @@ class MarketAnalyzer:
         ])
         
         # 기술적 지표
-        tech_text = format_technical_for_prompt(technical_indicators)
+        tech_text = format_technical_for_prompt(technical_indicators, timeframes)
         tech_note = ""
         if "없음" in tech_text or not technical_indicators:
             tech_note = "\n(기술적 지표가 일시적으로 없을 수 있음. 이 경우 '제공된 기술적 지표가 없다'고 쓰지 말고, 지수·뉴스·원자재만으로 기술적 관점을 1~2문장으로 서술하세요.)\n"
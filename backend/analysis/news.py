@@ -1,14 +1,54 @@
 # -*- coding: utf-8 -*-
 """
 뉴스 크롤링 모듈
+
+목록 페이지는 news_parser(lxml XPath)로 읽고, 실패하면 BeautifulSoup으로 다시 읽습니다.
+실시간 속보는 MarketNewsIngester가 새 기사만 최근 헤드라인 링에 쌓습니다.
+종목 뉴스는 종목코드별로 news_cache에 STOCK_NEWS_TTL 동안 보관하며,
+여러 종목은 get_stock_news_many로 동시에 조회합니다.
+수집한 기사는 모두 로컬 뉴스 아카이브(news_store)에 저장됩니다.
 """
-import requests
+import os
+import threading
+import time
 from bs4 import BeautifulSoup
-from typing import List, Dict
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from typing import Callable, Deque, Iterable, Iterator, List, Dict, Optional, Tuple
 from dataclasses import dataclass, asdict
 from datetime import datetime
 import re
 
+try:
+    from . import http_client
+    from .cache import news_cache
+    from .news_parser import parse_market_links, parse_stock_rows
+except ImportError:
+    import http_client
+    from cache import news_cache
+    from news_parser import parse_market_links, parse_stock_rows
+
+# 종목 뉴스 캐시 TTL (초), 여러 종목 뉴스 동시 조회 워커 수
+STOCK_NEWS_TTL = float(os.getenv("STOCK_NEWS_TTL", "300"))
+NEWS_WORKERS = int(os.getenv("NEWS_WORKERS", "8"))
+# 실시간 속보 최근 헤드라인 링 크기
+NEWS_RING_SIZE = int(os.getenv("NEWS_RING_SIZE", "200"))
+# 실시간 속보 목록을 다시 받기까지 최소 간격 (초). 그 사이 헤드라인 조회는 링만 읽음
+NEWS_INGEST_INTERVAL = float(os.getenv("NEWS_INGEST_INTERVAL", "60"))
+# 여러 페이지 뉴스 조회 시 기본 최대 페이지 수
+NEWS_MAX_PAGES = int(os.getenv("NEWS_MAX_PAGES", "10"))
+
+MARKET_NEWS_URL = "https://finance.naver.com/news/news_list.naver?mode=LSS2D&section_id=101&section_id2=258"
+STOCK_NEWS_URL = "https://finance.naver.com/item/news_news.naver"
+
+_NEWS_READ = re.compile(r"news_read\.naver")
+_ARTICLE_ID = re.compile(r"article_id=(\d+)")
+_OFFICE_ID = re.compile(r"office_id=(\d+)")
+_TIME = re.compile(r"(\d{2}:\d{2})")
+_DATETIME = re.compile(r"(\d{4})[.-](\d{2})[.-](\d{2})\s*(\d{2}):(\d{2})")
+_SOURCE = re.compile(r"([가-힣][가-힣A-Za-z0-9]*)\s*\|?\s*\d{4}-\d{2}-\d{2}")
+
 
 @dataclass
 class NewsItem:
@@ -18,6 +58,7 @@ class NewsItem:
     time: str
     url: str
     summary: str = ""
+    published: str = ""  # 게시 시각 "YYYY-MM-DD HH:MM" (목록에 없으면 빈 문자열)
     
     def to_dict(self) -> Dict:
         return asdict(self)
@@ -30,82 +71,13 @@ class NewsCrawler:
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
     }
     
-    def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update(self.HEADERS)
-    
     def get_market_news(self, limit: int = 15) -> List[NewsItem]:
-        """네이버 금융 실시간 뉴스"""
-        news_list = []
-        
+        """네이버 금융 실시간 뉴스 (새 기사만 반영한 최근 헤드라인 링에서 읽음, 목록은 NEWS_INGEST_INTERVAL마다 갱신)"""
         try:
-            url = "https://finance.naver.com/news/news_list.naver?mode=LSS2D&section_id=101&section_id2=258"
-            response = self.session.get(url, timeout=10)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.text, "lxml")
-            
-            # 뉴스 링크 찾기 - news_read.naver 포함된 모든 a 태그
-            all_links = soup.find_all("a", href=re.compile(r"news_read\.naver"))
-            
-            seen_titles = set()
-            for link in all_links:
-                try:
-                    title = link.get_text(strip=True)
-                    
-                    # 제목 필터링
-                    if not title or len(title) < 10:
-                        continue
-                    if title in seen_titles:
-                        continue
-                    
-                    seen_titles.add(title)
-                    
-                    href = link.get("href", "")
-                    if not href.startswith("http"):
-                        href = f"https://finance.naver.com{href}"
-                    
-                    # 직접 기사 링크로 변환
-                    article_match = re.search(r'article_id=(\d+)', href)
-                    office_match = re.search(r'office_id=(\d+)', href)
-                    if article_match and office_match:
-                        href = f"https://n.news.naver.com/mnews/article/{office_match.group(1)}/{article_match.group(1)}"
-                    
-                    # 부모 요소에서 시간 찾기
-                    parent = link.find_parent("li") or link.find_parent("dd") or link.find_parent()
-                    time_str = ""
-                    source = "네이버금융"
-                    
-                    if parent:
-                        parent_text = parent.get_text()
-                        # 시간 파싱: HH:MM 형식
-                        time_match = re.search(r'(\d{2}:\d{2})', parent_text)
-                        if time_match:
-                            time_str = time_match.group(1)
-                        
-                        # 출처 파싱: 한글|시간 형식
-                        source_match = re.search(r'([가-힣]+)\s*\|?\s*\d{4}-\d{2}-\d{2}', parent_text)
-                        if source_match:
-                            source = source_match.group(1)
-                    
-                    if not time_str:
-                        time_str = datetime.now().strftime("%H:%M")
-                    
-                    news_list.append(NewsItem(
-                        title=title,
-                        source=source,
-                        time=time_str,
-                        url=href
-                    ))
-                    
-                    if len(news_list) >= limit:
-                        break
-                        
-                except Exception:
-                    continue
-                    
+            market_news_ingester.refresh()
         except Exception as e:
             print(f"[Error] News crawling failed: {e}")
+        news_list = market_news_ingester.headlines(limit)
         
         # 뉴스가 없으면 백업 시도
         if not news_list:
@@ -119,7 +91,7 @@ class NewsCrawler:
         
         try:
             url = "https://news.naver.com/section/101"
-            response = self.session.get(url, timeout=10)
+            response = http_client.get(url, headers=self.HEADERS)
             response.raise_for_status()
             
             soup = BeautifulSoup(response.text, "lxml")
@@ -149,6 +121,7 @@ class NewsCrawler:
         except Exception as e:
             print(f"[Error] Backup news failed: {e}")
         
+        _archive(news_list)
         return news_list
     
     def get_market_headlines(self) -> List[NewsItem]:
@@ -156,56 +129,358 @@ class NewsCrawler:
         return self.get_market_news(limit=15)
     
     def get_stock_news(self, stock_code: str, limit: int = 10) -> List[NewsItem]:
-        """특정 종목 관련 뉴스"""
-        news_list = []
-        
+        """특정 종목 관련 뉴스 (종목별 캐시, 없거나 만료되면 필요한 페이지까지만 조회)"""
+        cached = _cached_stock_news(stock_code, limit)
+        if cached is not None:
+            return cached
         try:
-            url = f"https://finance.naver.com/item/news_news.naver?code={stock_code}&page=1"
-            response = self.session.get(url, timeout=10)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.text, "lxml")
-            rows = soup.select("table.type5 tr")
-            
-            for row in rows[:limit]:
-                try:
-                    cols = row.select("td")
-                    if len(cols) < 3:
-                        continue
-                    
-                    title_link = cols[0].select_one("a")
-                    if not title_link:
-                        continue
-                    
-                    title = title_link.get_text(strip=True)
-                    href = title_link.get("href", "")
-                    
-                    if href and not href.startswith("http"):
-                        href = f"https://finance.naver.com{href}"
-                    
-                    # 직접 기사 링크로 변환
-                    article_match = re.search(r'article_id=(\d+)', href)
-                    office_match = re.search(r'office_id=(\d+)', href)
-                    if article_match and office_match:
-                        href = f"https://n.news.naver.com/mnews/article/{office_match.group(1)}/{article_match.group(1)}"
-                    
-                    source = cols[1].get_text(strip=True) if len(cols) > 1 else ""
-                    time_str = cols[2].get_text(strip=True) if len(cols) > 2 else ""
-                    
-                    news_list.append(NewsItem(
-                        title=title,
-                        source=source,
-                        time=time_str,
-                        url=href
-                    ))
-                except:
-                    continue
-                    
+            news_list = list(islice(self.iter_stock_news(stock_code), limit))
         except Exception as e:
             print(f"[Error] Stock news failed ({stock_code}): {e}")
-        
+            return []
+        # 실패·빈 결과는 캐시하지 않음. limit건을 못 채웠으면 기사가 더 없다는 것도 함께 저장
+        if news_list:
+            news_cache.set(stock_code, (news_list, len(news_list) < limit), STOCK_NEWS_TTL)
         return news_list
 
+    def get_stock_news_many(
+        self, stock_codes: Iterable[str], limit: int = 10, max_workers: int = NEWS_WORKERS
+    ) -> Dict[str, List[NewsItem]]:
+        """
+        여러 종목 뉴스 일괄 조회
+
+        캐시에 없는 종목만 동시에 조회하므로 N개 종목 분석의 대기 시간은 대략 가장 느린 1회 조회 시간입니다.
+
+        Returns:
+            종목코드 -> 뉴스 목록 (실패 시 빈 리스트), 입력 순서 유지
+        """
+        unique = list(dict.fromkeys(c for c in stock_codes if c))
+        results: Dict[str, List[NewsItem]] = {}
+        missing = []
+        for code in unique:
+            cached = _cached_stock_news(code, limit)
+            if cached is not None:
+                results[code] = cached
+            else:
+                missing.append(code)
+
+        if missing:
+            with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(missing)))) as pool:
+                for code, items in zip(missing, pool.map(lambda c: self.get_stock_news(c, limit), missing)):
+                    results[code] = items
+
+        return {code: results.get(code, []) for code in unique}
+
+    def iter_stock_news(
+        self, stock_code: str, max_pages: int = NEWS_MAX_PAGES, since: Optional[datetime] = None
+    ) -> Iterator[NewsItem]:
+        """
+        종목 뉴스를 최신순으로 페이지를 넘기며 하나씩 반환
+
+        다음 페이지는 앞 페이지를 다 소비했을 때만 요청합니다.
+        예) 최근 30건: list(islice(news_crawler.iter_stock_news("005930"), 30))
+
+        Args:
+            max_pages: 최대 페이지 수
+            since: 이 시각보다 오래된 기사를 만나면 중단
+        """
+        return _walk_pages(
+            lambda page: self._get_page(STOCK_NEWS_URL, {"code": stock_code, "page": page}),
+            _iter_stock_page, max_pages, since, code=stock_code,
+        )
+
+    def iter_market_news(self, max_pages: int = NEWS_MAX_PAGES, since: Optional[datetime] = None) -> Iterator[NewsItem]:
+        """실시간 속보를 최신순으로 페이지를 넘기며 하나씩 반환 (iter_stock_news와 같은 방식)"""
+        return _walk_pages(
+            lambda page: self._get_page(MARKET_NEWS_URL, {"page": page}),
+            _iter_market_page, max_pages, since,
+        )
+
+    def _get_page(self, url: str, params: Dict) -> str:
+        response = http_client.get(url, params=params, headers=self.HEADERS)
+        response.raise_for_status()
+        return response.text
+
+
+def _cached_stock_news(stock_code: str, limit: int) -> Optional[List[NewsItem]]:
+    """캐시된 종목 뉴스가 limit건 이상이거나 조회 때 기사가 더 없었으면 앞 limit건, 아니면 None"""
+    cached = news_cache.get(stock_code)
+    if cached is None:
+        return None
+    items, exhausted = cached
+    if len(items) < limit and not exhausted:
+        return None
+    return items[:limit]
+
+
+def _walk_pages(
+    fetch: Callable[[int], str],
+    parse: Callable[[str], Iterator[Tuple[Tuple[str, str], NewsItem]]],
+    max_pages: int,
+    since: Optional[datetime],
+    code: Optional[str] = None,
+) -> Iterator[NewsItem]:
+    """
+    페이지를 차례로 받아 기사를 하나씩 반환. 새 기사가 없는 페이지(마지막 페이지 반복)에서 중단
+
+    반환한 기사는 페이지마다(호출자가 중간에 멈추면 그 시점에) 뉴스 아카이브에 저장합니다.
+    """
+    cutoff = since.strftime("%Y-%m-%d %H:%M") if since else None
+    seen = set()
+    page_items: List[NewsItem] = []
+    try:
+        for page in range(1, max_pages + 1):
+            for key, item in parse(fetch(page)):
+                if key in seen:
+                    continue
+                seen.add(key)
+                if cutoff and item.published and item.published < cutoff:
+                    return
+                page_items.append(item)
+                yield item
+            if not page_items:
+                return
+            _archive(page_items, code)
+            page_items = []
+    finally:
+        _archive(page_items, code)
+
+
+def _archive(items: List[NewsItem], code: Optional[str] = None) -> None:
+    """뉴스 아카이브에 저장 (news_store가 NewsItem을 import하므로 지연 import)"""
+    if not items:
+        return
+    try:
+        from .news_store import archive_news
+    except ImportError:
+        from news_store import archive_news
+    archive_news(items, code)
+
+
+def article_key(href: str) -> Optional[Tuple[str, str]]:
+    """기사 링크 -> (office_id, article_id). 없으면 None"""
+    article_match = _ARTICLE_ID.search(href)
+    office_match = _OFFICE_ID.search(href)
+    if article_match and office_match:
+        return office_match.group(1), article_match.group(1)
+    return None
+
+
+def _parse_market_link(link) -> Optional[NewsItem]:
+    """실시간 속보 목록의 기사 링크 하나 -> NewsItem (BeautifulSoup, 제목이 짧으면 None)"""
+    title = link.get_text(strip=True)
+    if not title or len(title) < 10:
+        return None
+    
+    # 부모 요소에서 시간 찾기
+    parent = link.find_parent("li") or link.find_parent("dd") or link.find_parent()
+    return _market_item(link.get("href", ""), title, parent.get_text() if parent else "")
+
+
+def _market_item(href: str, title: str, meta: str) -> NewsItem:
+    """실시간 속보 링크·제목·주변 텍스트 -> NewsItem"""
+    if not href.startswith("http"):
+        href = f"https://finance.naver.com{href}"
+    
+    # 직접 기사 링크로 변환
+    key = article_key(href)
+    if key:
+        href = f"https://n.news.naver.com/mnews/article/{key[0]}/{key[1]}"
+    
+    # 시간 파싱: HH:MM 형식
+    time_match = _TIME.search(meta)
+    time_str = time_match.group(1) if time_match else datetime.now().strftime("%H:%M")
+    
+    # 출처 파싱: 한글|시간 형식
+    source_match = _SOURCE.search(meta)
+    source = source_match.group(1) if source_match else "네이버금융"
+    
+    return NewsItem(title=title, source=source, time=time_str, url=href, published=_parse_published(meta))
+
+
+def _stock_item(href: str, title: str, source: str, time_str: str) -> NewsItem:
+    """종목 뉴스 표 한 행 -> NewsItem"""
+    if not href.startswith("http"):
+        href = f"https://finance.naver.com{href}"
+    
+    # 직접 기사 링크로 변환
+    key = article_key(href)
+    if key:
+        href = f"https://n.news.naver.com/mnews/article/{key[0]}/{key[1]}"
+    
+    return NewsItem(title=title, source=source, time=time_str, url=href, published=_parse_published(time_str))
+
+
+def _parse_published(text: str) -> str:
+    """"2024-01-02 09:30" 또는 "2024.01.02 09:30" -> "2024-01-02 09:30" (없으면 빈 문자열)"""
+    match = _DATETIME.search(text)
+    if not match:
+        return ""
+    y, m, d, hh, mm = match.groups()
+    return f"{y}-{m}-{d} {hh}:{mm}"
+
+
+def _iter_market_page(html: str) -> Iterator[Tuple[Tuple[str, str], NewsItem]]:
+    """실시간 속보 목록 페이지 -> (기사 키, NewsItem) 최신순. ID 없는 링크의 키는 ("", 제목)"""
+    try:
+        links = parse_market_links(html)
+    except Exception as e:
+        # 예상과 다른 문서면 느린 범용 파서로 재시도
+        print(f"[Warning] Fast market news parse failed, falling back: {e}")
+        return _iter_market_page_soup(html)
+    return (
+        (article_key(href) or ("", title), _market_item(href, title, meta))
+        for href, title, meta in links
+    )
+
+
+def _iter_stock_page(html: str) -> Iterator[Tuple[Tuple[str, str], NewsItem]]:
+    """
+    종목 뉴스 페이지 -> (기사 키, NewsItem) 최신순
+
+    헤더·구분선 행은 건너뛰고, 관련 기사 묶음(중첩 표)은 안쪽 행만 기사로 읽습니다.
+    """
+    try:
+        rows = parse_stock_rows(html)
+    except Exception as e:
+        print(f"[Warning] Fast stock news parse failed, falling back: {e}")
+        return _iter_stock_page_soup(html)
+    return (
+        (article_key(href) or ("", title), _stock_item(href, title, source, time_str))
+        for href, title, source, time_str in rows
+    )
+
+
+def _iter_market_page_soup(html: str) -> Iterator[Tuple[Tuple[str, str], NewsItem]]:
+    """_iter_market_page의 BeautifulSoup 버전 (lxml 파싱 실패 시, 벤치마크 기준)"""
+    soup = BeautifulSoup(html, "lxml")
+    # 뉴스 링크 찾기 - news_read.naver 포함된 모든 a 태그
+    for link in soup.find_all("a", href=_NEWS_READ):
+        try:
+            item = _parse_market_link(link)
+        except Exception:
+            continue
+        if item is None:
+            continue
+        yield article_key(link.get("href", "")) or ("", item.title), item
+
+
+def _iter_stock_page_soup(html: str) -> Iterator[Tuple[Tuple[str, str], NewsItem]]:
+    """_iter_stock_page의 BeautifulSoup 버전 (lxml 파싱 실패 시, 벤치마크 기준)"""
+    soup = BeautifulSoup(html, "lxml")
+    for row in soup.select("table.type5 tr"):
+        try:
+            cols = row.find_all("td", recursive=False)
+            if len(cols) < 3:
+                continue
+            
+            title_link = cols[0].find("a")
+            if not title_link:
+                continue
+            
+            title = title_link.get_text(strip=True)
+            href = title_link.get("href", "")
+            if not title or not href:
+                continue
+            
+            yield article_key(href) or ("", title), _stock_item(
+                href, title, cols[1].get_text(strip=True), cols[2].get_text(strip=True)
+            )
+        except Exception:
+            continue
+
+
+class MarketNewsIngester:
+    """
+    실시간 속보 증분 수집기
+
+    본 기사의 (office_id, article_id)를 색인에 남겨 두고, 목록(최신순)을 읽다가
+    이미 본 기사를 만나면 파싱을 멈춥니다. 새 기사만 최근 헤드라인 링 앞에 붙이므로
+    헤드라인 조회는 링을 자르는 것으로 끝납니다.
+    """
+
+    def __init__(self, ring_size: int = NEWS_RING_SIZE):
+        self._ring: Deque[NewsItem] = deque(maxlen=ring_size)
+        # 본 기사 색인 (오래된 순). 링보다 넉넉히 보관해 링에서 밀려난 기사가 다시 들어오지 않게 함
+        self._seen: "OrderedDict[Tuple[str, str], None]" = OrderedDict()
+        self._seen_size = max(ring_size * 4, 1000)
+        self._lock = threading.Lock()
+        self._ingest_lock = threading.Lock()
+        self.ingested_at = 0.0  # 마지막 수집 시각 (time.monotonic 기준)
+
+    def refresh(self, min_interval: float = NEWS_INGEST_INTERVAL) -> int:
+        """
+        마지막 수집 후 min_interval이 지났을 때만 ingest
+
+        다른 스레드가 수집 중이면 기다리지 않고 링을 그대로 읽게 합니다 (링이 비어 있으면 기다림).
+
+        Returns:
+            새로 추가한 기사 수
+        """
+        if time.monotonic() - self.ingested_at < min_interval:
+            return 0
+        if not self._ingest_lock.acquire(blocking=not self._ring):
+            return 0
+        try:
+            if time.monotonic() - self.ingested_at < min_interval:
+                return 0
+            try:
+                return self.ingest()
+            finally:
+                # 실패해도 다음 시도는 min_interval 뒤 (매 조회마다 목록을 다시 받지 않음)
+                self.ingested_at = time.monotonic()
+        finally:
+            self._ingest_lock.release()
+
+    def ingest(self) -> int:
+        """
+        목록 1페이지를 받아 새 기사만 링에 추가
+
+        Returns:
+            새로 추가한 기사 수
+        """
+        response = http_client.get(MARKET_NEWS_URL, headers=NewsCrawler.HEADERS)
+        response.raise_for_status()
+        
+        fresh: List[Tuple[Tuple[str, str], NewsItem]] = []
+        page_keys = set()
+        for key, item in _iter_market_page(response.text):
+            if key in page_keys:
+                continue
+            with self._lock:
+                indexed = key in self._seen
+            # 최신순이므로 이전 수집에서 색인한 기사부터는 모두 본 기사
+            if indexed and key[0]:
+                break
+            # 이번 페이지 안 중복(썸네일·제목 링크, 헤드라인과 목록), ID 없는 링크는 제목으로 구분
+            if indexed:
+                continue
+            page_keys.add(key)
+            fresh.append((key, item))
+
+        added = 0
+        with self._lock:
+            for key, item in reversed(fresh):
+                # 동시에 수집한 다른 스레드가 먼저 넣었으면 건너뜀
+                if key in self._seen:
+                    continue
+                self._seen[key] = None
+                self._ring.appendleft(item)
+                added += 1
+            while len(self._seen) > self._seen_size:
+                self._seen.popitem(last=False)
+        _archive([item for _, item in fresh])
+        return added
+
+    def headlines(self, limit: int = 15) -> List[NewsItem]:
+        """최근 헤드라인 (최신순)"""
+        with self._lock:
+            return list(islice(self._ring, limit))
+
+    def __len__(self) -> int:
+        return len(self._ring)
+
 
 # 싱글톤 인스턴스
 news_crawler = NewsCrawler()
+market_news_ingester = MarketNewsIngester()
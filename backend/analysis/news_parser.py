@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+"""
+네이버 금융 뉴스 목록 파서 (lxml XPath)
+
+BeautifulSoup 트리를 만들고 링크마다 부모를 거슬러 올라가 전체 텍스트를 읽는 대신,
+lxml로 파싱한 뒤 필요한 앵커와 메타데이터(언론사, 날짜)만 XPath로 꺼냅니다.
+
+    실시간 속보 (news_list.naver?mode=LSS2D)
+        <dd class="articleSubject"><a href="/news/news_read.naver?article_id=..&office_id=..">제목</a></dd>
+        <dd class="articleSummary">요약<span class="press">한국경제</span>|<span class="wdate">2024-01-02 09:30</span></dd>
+
+    종목 뉴스 (item/news_news.naver)
+        <table class="type5"><tr><td class="title"><a href="..">제목</a></td><td class="info">언론사</td><td class="date">2024.01.02 09:30</td></tr>
+
+반환값은 문자열 튜플이며, NewsItem 변환(링크 정규화, 시간·출처 추출)은 news.py에서 합니다.
+"""
+from typing import Iterator, Tuple
+
+from lxml import etree, html as lxml_html
+
+_NEWS_LINKS = etree.XPath("//a[contains(@href, 'news_read.naver')]")
+# 링크가 든 dt/dd 바로 뒤의 요약(dd.articleSummary) 안 언론사·날짜
+_PRESS = etree.XPath("string(../following-sibling::dd[contains(@class, 'articleSummary')][1]/span[@class='press'])")
+_WDATE = etree.XPath("string(../following-sibling::dd[contains(@class, 'articleSummary')][1]/span[@class='wdate'])")
+_ANCESTOR_LI = etree.XPath("ancestor::li[1]")
+_ANCESTOR_DD = etree.XPath("ancestor::dd[1]")
+_STOCK_ROWS = etree.XPath("//table[contains(concat(' ', normalize-space(@class), ' '), ' type5 ')]//tr[count(td) >= 3]")
+_ROW_LINK = etree.XPath("(td[1]//a)[1]")
+_ROW_INFO = etree.XPath("normalize-space(td[2])")
+_ROW_DATE = etree.XPath("normalize-space(td[3])")
+
+
+def _parse(html: str):
+    """본문 -> lxml 트리 (빈 문서면 ValueError)"""
+    if not html or not html.strip():
+        raise ValueError("empty news page")
+    return lxml_html.fromstring(html)
+
+
+def _text(element) -> str:
+    """BeautifulSoup get_text(strip=True)와 같은 결과 (조각마다 strip 후 이어 붙임)"""
+    return "".join(s.strip() for s in element.itertext())
+
+
+def parse_market_links(html: str) -> Iterator[Tuple[str, str, str]]:
+    """
+    실시간 속보 목록 -> (href, 제목, 메타 텍스트) 문서 순서대로
+
+    메타 텍스트는 요약의 "언론사|YYYY-MM-DD HH:MM"이며,
+    요약이 없는 형식이면 링크를 감싼 li(없으면 dd, 부모) 전체 텍스트입니다.
+
+    Raises:
+        ValueError: 빈 문서
+    """
+    root = _parse(html)
+
+    def rows() -> Iterator[Tuple[str, str, str]]:
+        for link in _NEWS_LINKS(root):
+            title = _text(link)
+            # 썸네일 링크 등 짧은 제목은 메타를 읽기 전에 건너뜀
+            if len(title) < 10:
+                continue
+            press, wdate = _PRESS(link), _WDATE(link)
+            if press or wdate:
+                meta = f"{press}|{wdate}"
+            else:
+                context = _ANCESTOR_LI(link) or _ANCESTOR_DD(link)
+                parent = context[0] if context else link.getparent()
+                meta = parent.text_content() if parent is not None else ""
+            yield link.get("href", ""), title, meta
+
+    return rows()
+
+
+def parse_stock_rows(html: str) -> Iterator[Tuple[str, str, str, str]]:
+    """
+    종목 뉴스 표 -> (href, 제목, 언론사, 날짜) 문서 순서대로
+
+    td가 3개 미만인 헤더·구분선·관련뉴스 제목 행은 XPath 단계에서 제외되고,
+    관련 기사 묶음(중첩 표)은 안쪽 행만 기사로 읽힙니다.
+
+    Raises:
+        ValueError: 빈 문서
+    """
+    root = _parse(html)
+
+    def rows() -> Iterator[Tuple[str, str, str, str]]:
+        for row in _STOCK_ROWS(root):
+            links = _ROW_LINK(row)
+            if not links:
+                continue
+            title = _text(links[0])
+            href = links[0].get("href", "")
+            if title and href:
+                yield href, title, _ROW_INFO(row), _ROW_DATE(row)
+
+    return rows()
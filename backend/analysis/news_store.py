@@ -0,0 +1,233 @@
+# -*- coding: utf-8 -*-
+"""
+로컬 뉴스 아카이브
+
+크롤링한 뉴스(NewsItem)를 SQLite(data/news.sqlite3)에 보관하고 제목·요약에 FTS5 전문 색인을 둡니다.
+같은 기사(링크)는 한 번만 저장되며, 종목 뉴스로 수집된 기사는 종목코드와 연결됩니다.
+NEWS_RETENTION_DAYS보다 오래된 기사는 prune()에서 지웁니다 (저장 시 한 시간에 한 번 자동 실행).
+
+한국어 제목은 "SK하이닉스가"처럼 종목명에 다른 글자가 붙으므로 trigram 토크나이저로 색인해
+검색어의 각 단어를 부분 문자열로 찾습니다 ("하이닉스"로 "SK하이닉스 HBM 호조" 검색, SQLite 3.34 이상).
+trigram 색인은 3글자 이상 단어만 찾을 수 있어 "삼성" 같은 2글자 단어는 LIKE로 찾습니다.
+
+환경변수:
+    NEWS_DB_PATH: 아카이브 경로 (기본 data/news.sqlite3)
+    NEWS_RETENTION_DAYS: 보관 기간 (일, 기본 90)
+"""
+import os
+import re
+import sqlite3
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Iterable, List, Optional
+
+try:
+    from .cache import KST
+    from .news import NewsItem
+except ImportError:
+    from cache import KST
+    from news import NewsItem
+
+NEWS_DB_PATH = os.getenv(
+    "NEWS_DB_PATH",
+    os.path.join(os.path.dirname(__file__), "..", "data", "news.sqlite3"),
+)
+NEWS_RETENTION_DAYS = int(os.getenv("NEWS_RETENTION_DAYS", "90"))
+PRUNE_INTERVAL = 3600
+
+_TERM = re.compile(r"[\w]+", re.UNICODE)
+
+
+def fts_query(text: str) -> str:
+    """검색어 -> FTS5 trigram 질의 (3글자 이상 단어마다 부분 문자열 검색, 모두 AND). 해당 단어가 없으면 빈 문자열"""
+    return " AND ".join(f'"{term}"' for term in _TERM.findall(text) if len(term) >= 3)
+
+
+def _short_terms(text: str) -> List[str]:
+    """trigram 색인으로 찾을 수 없는 3글자 미만 단어"""
+    return [term for term in _TERM.findall(text) if len(term) < 3]
+
+
+class NewsStore:
+    """뉴스 아카이브 SQLite 저장소 (스레드 안전)"""
+
+    def __init__(self, path: str = NEWS_DB_PATH, retention_days: int = NEWS_RETENTION_DAYS):
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.retention_days = retention_days
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        self._pruned_at = 0.0
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            # published: "YYYY-MM-DD HH:MM" (목록에 게시 시각이 없으면 수집 시각)
+            self._conn.execute(
+                """CREATE TABLE IF NOT EXISTS news (
+                    id INTEGER PRIMARY KEY,
+                    url TEXT NOT NULL UNIQUE,
+                    title TEXT NOT NULL,
+                    source TEXT NOT NULL,
+                    time TEXT NOT NULL,
+                    summary TEXT NOT NULL DEFAULT '',
+                    published TEXT NOT NULL,
+                    fetched_at REAL NOT NULL
+                )"""
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS news_published ON news (published)")
+            self._conn.execute(
+                """CREATE TABLE IF NOT EXISTS news_codes (
+                    code TEXT NOT NULL,
+                    news_id INTEGER NOT NULL,
+                    PRIMARY KEY (code, news_id)
+                ) WITHOUT ROWID"""
+            )
+            # news 테이블을 원본으로 하는 외부 콘텐츠 FTS5 색인 (트리거로 동기화).
+            # 이전 버전의 unicode61 색인이면 trigram으로 다시 만듦
+            fts_sql = self._conn.execute("SELECT sql FROM sqlite_master WHERE name = 'news_fts'").fetchone()
+            rebuild = fts_sql is not None and "trigram" not in fts_sql[0]
+            if rebuild:
+                self._conn.execute("DROP TABLE news_fts")
+            self._conn.execute(
+                """CREATE VIRTUAL TABLE IF NOT EXISTS news_fts USING fts5(
+                    title, summary, content='news', content_rowid='id',
+                    tokenize='trigram'
+                )"""
+            )
+            if rebuild:
+                self._conn.execute("INSERT INTO news_fts (news_fts) VALUES ('rebuild')")
+            self._conn.executescript(
+                """
+                CREATE TRIGGER IF NOT EXISTS news_ai AFTER INSERT ON news BEGIN
+                    INSERT INTO news_fts (rowid, title, summary) VALUES (new.id, new.title, new.summary);
+                END;
+                CREATE TRIGGER IF NOT EXISTS news_ad AFTER DELETE ON news BEGIN
+                    INSERT INTO news_fts (news_fts, rowid, title, summary) VALUES ('delete', old.id, old.title, old.summary);
+                END;
+                CREATE TRIGGER IF NOT EXISTS news_au AFTER UPDATE OF title, summary ON news BEGIN
+                    INSERT INTO news_fts (news_fts, rowid, title, summary) VALUES ('delete', old.id, old.title, old.summary);
+                    INSERT INTO news_fts (rowid, title, summary) VALUES (new.id, new.title, new.summary);
+                END;
+                """
+            )
+
+    def add(self, items: Iterable[NewsItem], code: Optional[str] = None) -> int:
+        """
+        기사 저장 (이미 있는 링크는 건너뛰고, 요약이 새로 생겼으면 채움). code가 있으면 종목과 연결
+
+        Returns:
+            새로 저장하거나 요약을 채운 기사 수
+        """
+        now = time.time()
+        fetched = datetime.fromtimestamp(now, KST).strftime("%Y-%m-%d %H:%M")
+        rows = [
+            (n.url, n.title, n.source, n.time, n.summary or "", n.published or fetched, now)
+            for n in items if n.url and n.title
+        ]
+        if not rows:
+            return 0
+        with self._lock, self._conn:
+            cursor = self._conn.executemany(
+                """INSERT INTO news (url, title, source, time, summary, published, fetched_at)
+                   VALUES (?, ?, ?, ?, ?, ?, ?)
+                   ON CONFLICT(url) DO UPDATE SET summary = excluded.summary
+                   WHERE news.summary = '' AND excluded.summary != ''""",
+                rows,
+            )
+            # 트리거(FTS 색인) 변경은 빼고 news 행 변경만 집계
+            added = cursor.rowcount
+            if code:
+                self._conn.executemany(
+                    "INSERT OR IGNORE INTO news_codes (code, news_id) SELECT ?, id FROM news WHERE url = ?",
+                    [(code, r[0]) for r in rows],
+                )
+        if now - self._pruned_at > PRUNE_INTERVAL:
+            self.prune()
+        return added
+
+    def search(
+        self,
+        q: str = "",
+        code: Optional[str] = None,
+        since: Optional[str] = None,
+        limit: int = 20,
+        match_any: bool = False,
+    ) -> List[NewsItem]:
+        """
+        기사 검색 (최신순)
+
+        Args:
+            q: 제목·요약 검색어 (단어마다 부분 문자열 검색, 모두 포함)
+            code: 종목 뉴스로 수집된 종목코드
+            since: 이 시각 이후 게시 ("YYYY-MM-DD" 또는 "YYYY-MM-DD HH:MM")
+            match_any: True면 q 일치 또는 code 연결 기사 (False면 둘 다 만족)
+        """
+        match = fts_query(q) if q else ""
+        short = _short_terms(q) if q else []
+        conditions, params = [], []
+        if match or short:
+            text_conditions = []
+            if match:
+                text_conditions.append("id IN (SELECT rowid FROM news_fts WHERE news_fts MATCH ?)")
+                params.append(match)
+            for term in short:
+                pattern = "%" + term.replace("_", "\\_") + "%"
+                text_conditions.append("(title LIKE ? ESCAPE '\\' OR summary LIKE ? ESCAPE '\\')")
+                params += [pattern, pattern]
+            conditions.append("(" + " AND ".join(text_conditions) + ")")
+        if code:
+            conditions.append("id IN (SELECT news_id FROM news_codes WHERE code = ?)")
+            params.append(code)
+        where = (" OR " if match_any else " AND ").join(conditions)
+        if since:
+            where = f"({where}) AND published >= ?" if where else "published >= ?"
+            params.append(since)
+        sql = "SELECT title, source, time, url, summary, published FROM news"
+        if where:
+            sql += f" WHERE {where}"
+        sql += " ORDER BY published DESC, id DESC LIMIT ?"
+        params.append(limit)
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        return [NewsItem(*row) for row in rows]
+
+    def prune(self, retention_days: Optional[int] = None) -> int:
+        """보관 기간이 지난 기사 삭제. 삭제한 기사 수"""
+        days = self.retention_days if retention_days is None else retention_days
+        cutoff = (datetime.now(KST) - timedelta(days=days)).strftime("%Y-%m-%d %H:%M")
+        with self._lock, self._conn:
+            self._conn.execute(
+                "DELETE FROM news_codes WHERE news_id IN (SELECT id FROM news WHERE published < ?)", (cutoff,)
+            )
+            deleted = self._conn.execute("DELETE FROM news WHERE published < ?", (cutoff,)).rowcount
+        self._pruned_at = time.time()
+        if deleted:
+            print(f"[Info] News archive pruned {deleted} articles older than {cutoff}")
+        return deleted
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM news").fetchone()[0]
+
+
+_store: Optional[NewsStore] = None
+_store_lock = threading.Lock()
+
+
+def get_news_store() -> NewsStore:
+    """싱글톤 저장소 (최초 호출 시 생성)"""
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                _store = NewsStore()
+    return _store
+
+
+def archive_news(items: Iterable[NewsItem], code: Optional[str] = None) -> int:
+    """크롤링한 기사를 아카이브에 저장 (실패해도 크롤링 결과에는 영향 없음)"""
+    try:
+        return get_news_store().add(items, code)
+    except Exception as e:
+        print(f"[Warning] News archive failed: {e}")
+        return 0
@@ -0,0 +1,150 @@
+# -*- coding: utf-8 -*-
+"""
+로컬 일봉(OHLCV) 저장소
+
+종목별 일봉을 SQLite(data/ohlcv.sqlite3)에 보관합니다.
+get_stock_ohlcv는 저장소에 없는 날짜 구간만 업스트림에서 받아 upsert하고,
+나머지는 로컬 데이터로 응답합니다. 장중에는 당일 봉만 다시 받아 덮어씁니다.
+"""
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+OHLCV_DB_PATH = os.getenv(
+    "OHLCV_DB_PATH",
+    os.path.join(os.path.dirname(__file__), "..", "data", "ohlcv.sqlite3"),
+)
+
+COLUMNS = ["date", "open", "high", "low", "close", "volume"]
+
+
+def _fill_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """COLUMNS 순서로 맞춤. 없는 시가·고가·저가는 종가로, 거래량은 0으로 채우고 날짜·종가 없는 봉은 버림"""
+    df = df.reindex(columns=COLUMNS).dropna(subset=["date", "close"])
+    for col in ("open", "high", "low"):
+        df[col] = df[col].fillna(df["close"])
+    df["volume"] = df["volume"].fillna(0.0)
+    return df
+
+
+class OHLCVStore:
+    """종목별 일봉 SQLite 저장소 (스레드 안전)"""
+
+    def __init__(self, path: str = OHLCV_DB_PATH):
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                """CREATE TABLE IF NOT EXISTS bars (
+                    code TEXT NOT NULL,
+                    date TEXT NOT NULL,
+                    open REAL, high REAL, low REAL, close REAL, volume REAL,
+                    PRIMARY KEY (code, date)
+                ) WITHOUT ROWID"""
+            )
+            # start_date: 업스트림에서 받아 둔 구간의 시작일 (이전 날짜는 다시 받아야 함)
+            self._conn.execute(
+                """CREATE TABLE IF NOT EXISTS sync (
+                    code TEXT PRIMARY KEY,
+                    start_date TEXT NOT NULL,
+                    synced_at REAL NOT NULL
+                )"""
+            )
+
+    def sync_state(self, code: str) -> Optional[Tuple[str, float]]:
+        """(보관 구간 시작일 YYYYMMDD, 마지막 동기화 epoch) 또는 None"""
+        with self._lock:
+            return self._conn.execute(
+                "SELECT start_date, synced_at FROM sync WHERE code = ?", (code,)
+            ).fetchone()
+
+    def last_bar(self, code: str) -> Optional[Tuple[str, float]]:
+        """가장 최근 봉 (날짜, 종가)"""
+        with self._lock:
+            return self._conn.execute(
+                "SELECT date, close FROM bars WHERE code = ? ORDER BY date DESC LIMIT 1", (code,)
+            ).fetchone()
+
+    def upsert(self, code: str, df: pd.DataFrame, start_date: str) -> None:
+        """봉 upsert 후 동기화 상태 기록 (start_date: 이번에 요청한 구간 시작일)"""
+        rows: Iterable[tuple] = (
+            (code, str(r.date), r.open, r.high, r.low, r.close, r.volume)
+            for r in _fill_columns(df).itertuples(index=False)
+        )
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO bars (code, date, open, high, low, close, volume) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+            self._conn.execute(
+                """INSERT INTO sync (code, start_date, synced_at) VALUES (?, ?, ?)
+                   ON CONFLICT(code) DO UPDATE SET
+                       start_date = MIN(start_date, excluded.start_date),
+                       synced_at = excluded.synced_at""",
+                (code, start_date, time.time()),
+            )
+
+    def load(self, code: str, start_date: str, days: int) -> pd.DataFrame:
+        """start_date 이후 봉 중 최근 days개 (오래된 순)"""
+        with self._lock:
+            rows = self._conn.execute(
+                """SELECT date, open, high, low, close, volume FROM (
+                       SELECT * FROM bars WHERE code = ? AND date >= ? ORDER BY date DESC LIMIT ?
+                   ) ORDER BY date""",
+                (code, start_date, days),
+            ).fetchall()
+        return pd.DataFrame(rows, columns=COLUMNS)
+
+    def load_closes(self, days: int, codes: Optional[List[str]] = None) -> Dict[str, np.ndarray]:
+        """종목별 최근 days개 종가 (오래된 순). codes가 없으면 저장된 전 종목"""
+        closes = {}
+        with self._lock:
+            if codes is None:
+                codes = [r[0] for r in self._conn.execute("SELECT code FROM sync ORDER BY code")]
+            # (code, date) 기본키 역순 탐색이라 종목당 days개 행만 읽음
+            for code in codes:
+                rows = self._conn.execute(
+                    "SELECT close FROM bars WHERE code = ? ORDER BY date DESC LIMIT ?", (code, days)
+                ).fetchall()
+                if rows:
+                    closes[code] = np.array([r[0] for r in reversed(rows)], dtype=float)
+        return closes
+
+    def last_dates(self) -> Dict[str, str]:
+        """종목별 마지막 봉 날짜 (YYYYMMDD)"""
+        with self._lock:
+            return dict(self._conn.execute("SELECT code, MAX(date) FROM bars GROUP BY code").fetchall())
+
+    def recent_dates(self, code: str, n: int) -> List[str]:
+        """종목의 최근 n개 봉 날짜 (최신순). 거래일 달력 대용"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT date FROM bars WHERE code = ? ORDER BY date DESC LIMIT ?", (code, n)
+            ).fetchall()
+        return [r[0] for r in rows]
+
+    def codes(self):
+        with self._lock:
+            return [r[0] for r in self._conn.execute("SELECT code FROM sync ORDER BY code")]
+
+
+_store: Optional[OHLCVStore] = None
+_store_lock = threading.Lock()
+
+
+def get_ohlcv_store() -> OHLCVStore:
+    """싱글톤 저장소 (최초 호출 시 생성)"""
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                _store = OHLCVStore()
+    return _store
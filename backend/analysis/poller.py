@@ -0,0 +1,201 @@
+# -*- coding: utf-8 -*-
+"""
+시세 백그라운드 폴러
+
+지수·원자재·비트코인·관심 종목 시세를 주기적으로 갱신해 메모리 시세판(QuoteBoard)에 올려둡니다.
+장중에는 관심 종목 분봉도 intraday_store 링 버퍼에 쌓습니다.
+폴러가 켜져 있으면 /api/market 라우트는 시세판만 읽고 요청 경로에서 업스트림을 호출하지 않습니다.
+
+환경변수:
+    MARKET_POLLER_ENABLED: true면 서버 시작 시 폴러 실행 (기본 false)
+    MARKET_WATCHLIST: 관심 종목 코드 (쉼표 구분)
+    POLL_INTERVAL_OPEN / POLL_INTERVAL_CLOSED: 장중/장외 갱신 주기 (초)
+    POLL_BATCH_SIZE: 관심 종목을 한 번에 동시 조회할 종목 수 (묶음마다 fetch_all 마감 적용)
+"""
+import os
+import threading
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from apscheduler.schedulers.background import BackgroundScheduler
+
+try:
+    from . import http_client
+    from .cache import SWR_MAX_STALE, is_krx_session, quote_ttl
+    from .crawler import (
+        IndexData,
+        get_all_indices,
+        get_btc_price,
+        get_commodities_and_world,
+        get_stock_price,
+    )
+    from .intraday import intraday_store
+except ImportError:
+    import http_client
+    from cache import SWR_MAX_STALE, is_krx_session, quote_ttl
+    from crawler import (
+        IndexData,
+        get_all_indices,
+        get_btc_price,
+        get_commodities_and_world,
+        get_stock_price,
+    )
+    from intraday import intraday_store
+
+MARKET_POLLER_ENABLED = os.getenv("MARKET_POLLER_ENABLED", "false").lower() == "true"
+POLL_INTERVAL_OPEN = float(os.getenv("POLL_INTERVAL_OPEN", "5"))
+POLL_INTERVAL_CLOSED = float(os.getenv("POLL_INTERVAL_CLOSED", "600"))
+POLL_BATCH_SIZE = int(os.getenv("POLL_BATCH_SIZE", "10"))
+
+
+def _parse_watchlist(raw: str) -> List[str]:
+    return [c.strip() for c in (raw or "").split(",") if c.strip()]
+
+
+def board_max_age() -> float:
+    """시세판 값을 그대로 내줄 수 있는 최대 데이터 나이 (초). 캐시 TTL + SWR_MAX_STALE과 같은 기준"""
+    return quote_ttl() + SWR_MAX_STALE
+
+
+class QuoteBoard:
+    """키 -> (값, 데이터 조회 시각) 메모리 스냅샷"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._items: Dict[str, Tuple[Any, float]] = {}
+
+    def put(self, key: str, value: Any, fetched_at: Optional[float] = None) -> None:
+        """값 저장. fetched_at은 값이 실제로 조회된 시각 epoch (없으면 지금)"""
+        with self._lock:
+            self._items[key] = (value, time.time() if fetched_at is None else fetched_at)
+
+    def get(self, key: str) -> Optional[Tuple[Any, float]]:
+        """(값, 조회 시각 epoch) 또는 None"""
+        return self._items.get(key)
+
+    def get_fresh(self, key: str, max_age: Optional[float] = None) -> Optional[Tuple[Any, float]]:
+        """조회한 지 max_age(없으면 board_max_age()) 이내인 (값, 조회 시각 epoch), 아니면 None"""
+        entry = self._items.get(key)
+        if entry is None:
+            return None
+        if time.time() - entry[1] > (board_max_age() if max_age is None else max_age):
+            return None
+        return entry
+
+    def keys(self) -> List[str]:
+        with self._lock:
+            return list(self._items.keys())
+
+
+def _batches(codes: List[str], size: int = POLL_BATCH_SIZE) -> List[List[str]]:
+    return [codes[i:i + size] for i in range(0, len(codes), max(1, size))]
+
+
+def _merge_indices(
+    prev: Optional[List[Tuple[IndexData, float]]], new: List[IndexData], now: float
+) -> List[Tuple[IndexData, float]]:
+    """
+    (항목, 조회 시각) 목록 갱신. 조회 실패(0값)한 항목은 직전 값과 그 값의 조회 시각을 유지
+
+    한 번도 조회에 성공하지 못한 항목의 조회 시각은 0입니다.
+    """
+    prev_by_name = {idx.name: (idx, at) for idx, at in prev or []}
+    return [
+        (idx, now) if idx.value > 0 else prev_by_name.get(idx.name, (idx, 0.0))
+        for idx in new
+    ]
+
+
+class MarketPoller:
+    """장 운영 시간에 맞춰 시세판을 갱신하는 백그라운드 서비스"""
+
+    def __init__(self, board: QuoteBoard, watchlist: List[str] = None):
+        self.board = board
+        self.watchlist = watchlist or []
+        self.last_refresh = 0.0
+        self.refresh_count = 0
+        # 그룹 키 -> [(항목, 조회 시각)]. 시세판에는 가장 오래된 항목의 조회 시각으로 올림
+        self._groups: Dict[str, List[Tuple[IndexData, float]]] = {}
+        self._scheduler: Optional[BackgroundScheduler] = None
+
+    def start(self) -> bool:
+        """폴러 시작 (이미 실행 중이면 False)"""
+        if self.is_running():
+            return False
+        self._scheduler = BackgroundScheduler(daemon=True)
+        self._scheduler.add_job(
+            self._tick,
+            "interval",
+            seconds=POLL_INTERVAL_OPEN,
+            next_run_time=datetime.now(),
+            max_instances=1,
+            coalesce=True,
+        )
+        self._scheduler.start()
+        print(f"[OK] Market poller started (watchlist={len(self.watchlist)}, "
+              f"interval={POLL_INTERVAL_OPEN}s open / {POLL_INTERVAL_CLOSED}s closed)")
+        return True
+
+    def stop(self) -> None:
+        if self._scheduler:
+            self._scheduler.shutdown(wait=False)
+            self._scheduler = None
+            print("[Server] Market poller stopped")
+
+    def is_running(self) -> bool:
+        return self._scheduler is not None and self._scheduler.running
+
+    def _tick(self) -> None:
+        """장외 시간에는 POLL_INTERVAL_CLOSED 간격으로만 갱신"""
+        interval = POLL_INTERVAL_OPEN if is_krx_session() else POLL_INTERVAL_CLOSED
+        if time.time() - self.last_refresh < interval:
+            return
+        try:
+            self.refresh()
+        except Exception as e:
+            print(f"[Error] Market poller refresh failed: {e}")
+
+    def refresh(self) -> None:
+        """지수·원자재·비트코인·관심 종목 시세(장중에는 분봉 포함)를 한 번 갱신"""
+        self._put_group("indices", get_all_indices())
+        self._put_group("commodities", get_commodities_and_world())
+
+        btc = get_btc_price()
+        if btc.value > 0:
+            self.board.put("btc", btc)
+
+        # 관심 종목이 많아도 호스트 요청 제한 안에서 마감을 맞추도록 묶음별로 조회
+        intraday = is_krx_session()
+        for batch in _batches(self.watchlist):
+            stocks = http_client.fetch_all({code: (lambda c=code: get_stock_price(c)) for code in batch})
+            for code, stock in stocks.items():
+                if stock:
+                    self.board.put(f"stock:{code}", stock)
+            # 장중에는 관심 종목 분봉도 링 버퍼에 이어 붙임 (종목별 INTRADAY_MIN_INTERVAL 간격)
+            if intraday:
+                http_client.fetch_all({f"minute:{code}": (lambda c=code: intraday_store.ingest(c)) for code in batch})
+
+        self.last_refresh = time.time()
+        self.refresh_count += 1
+
+    def _put_group(self, key: str, fetched: List[IndexData]) -> None:
+        """실패 항목은 직전 값을 유지하고, 그룹의 조회 시각은 가장 오래된 항목 기준으로 시세판에 올림"""
+        merged = self._groups[key] = _merge_indices(self._groups.get(key), fetched, time.time())
+        times = [at for idx, at in merged if at > 0]
+        if times:
+            self.board.put(key, [idx for idx, _ in merged], fetched_at=min(times))
+
+    def status(self) -> Dict[str, Any]:
+        return {
+            "running": self.is_running(),
+            "watchlist": self.watchlist,
+            "refreshCount": self.refresh_count,
+            "lastRefresh": datetime.fromtimestamp(self.last_refresh).strftime("%Y-%m-%d %H:%M:%S") if self.last_refresh else None,
+            "keys": self.board.keys(),
+        }
+
+
+# 싱글톤 인스턴스
+quote_board = QuoteBoard()
+market_poller = MarketPoller(quote_board, _parse_watchlist(os.getenv("MARKET_WATCHLIST", "")))
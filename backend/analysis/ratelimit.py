@@ -0,0 +1,180 @@
+# -*- coding: utf-8 -*-
+"""
+호스트별 요청 제한 및 서킷 브레이커
+
+업스트림 호스트마다 토큰 버킷으로 초당 요청 수를 제한하고,
+연속 실패한 호스트는 일정 시간 동안 요청을 보내지 않고 바로 실패시킵니다.
+
+환경변수:
+    HTTP_RATE_LIMIT / HTTP_RATE_BURST: 기본 초당 요청 수 / 버스트 허용량
+    HTTP_RATE_LIMITS: 호스트별 설정 (예: "api.coingecko.com=0.5:2,finance.naver.com=5:10")
+    CIRCUIT_FAILURE_THRESHOLD: 서킷을 여는 연속 실패 횟수
+    CIRCUIT_RESET_TIMEOUT: 서킷이 열린 뒤 다시 시도하기까지 대기 시간 (초)
+"""
+import os
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+
+HTTP_RATE_LIMIT = float(os.getenv("HTTP_RATE_LIMIT", "5"))
+HTTP_RATE_BURST = int(os.getenv("HTTP_RATE_BURST", "10"))
+CIRCUIT_FAILURE_THRESHOLD = int(os.getenv("CIRCUIT_FAILURE_THRESHOLD", "3"))
+CIRCUIT_RESET_TIMEOUT = float(os.getenv("CIRCUIT_RESET_TIMEOUT", "30"))
+
+
+def _parse_host_limits(raw: str) -> Dict[str, Tuple[float, int]]:
+    """'host=rate:burst,...' -> {host: (rate, burst)}"""
+    limits = {}
+    for item in (raw or "").split(","):
+        if "=" not in item:
+            continue
+        host, spec = item.split("=", 1)
+        rate, _, burst = spec.partition(":")
+        try:
+            limits[host.strip()] = (float(rate), int(burst or HTTP_RATE_BURST))
+        except ValueError:
+            print(f"[Warning] Invalid HTTP_RATE_LIMITS entry: {item}")
+    return limits
+
+
+HOST_LIMITS = _parse_host_limits(os.getenv("HTTP_RATE_LIMITS", ""))
+
+
+class CircuitOpenError(Exception):
+    """서킷이 열려 요청을 보내지 않음"""
+
+
+class RateLimitTimeout(Exception):
+    """허용된 대기 시간 안에 토큰을 받을 수 없음 (토큰은 예약하지 않음)"""
+
+
+class TokenBucket:
+    """초당 rate개씩 채워지고 최대 burst개까지 쌓이는 토큰 버킷"""
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+        self.waited = 0.0
+
+    def acquire(self, max_wait: Optional[float] = None) -> Optional[float]:
+        """
+        토큰 1개 획득 (없으면 채워질 때까지 대기). 대기한 시간(초) 반환
+
+        max_wait보다 오래 기다려야 하면 토큰을 예약하지 않고 None을 반환합니다.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            # 토큰이 음수가 되면 그만큼 미래 몫을 예약한 것이므로 채워질 때까지 대기
+            wait = (1 - self._tokens) / self.rate if self._tokens < 1 else 0.0
+            if max_wait is not None and wait > max_wait:
+                return None
+            self._tokens -= 1
+            self.waited += wait
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+
+class CircuitBreaker:
+    """연속 실패 횟수 기반 서킷 브레이커 (closed → open → half-open)"""
+
+    def __init__(self, failure_threshold: int, reset_timeout: float):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at = 0.0
+        self.short_circuited = 0
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        if self.failures < self.failure_threshold:
+            return "closed"
+        if time.monotonic() - self.opened_at >= self.reset_timeout:
+            return "half-open"
+        return "open"
+
+    def allow(self) -> bool:
+        """요청을 보내도 되는지 (half-open에서는 시험 요청 1개만 허용)"""
+        with self._lock:
+            state = self.state
+            if state == "closed":
+                return True
+            if state == "half-open" and not self._trial_in_flight:
+                self._trial_in_flight = True
+                return True
+            self.short_circuited += 1
+            return False
+
+    def record_success(self) -> None:
+        with self._lock:
+            self.failures = 0
+            self._trial_in_flight = False
+
+    def release(self) -> None:
+        """요청을 보내지 않고 끝난 경우 half-open 시험 기회만 반납 (실패로 집계하지 않음)"""
+        with self._lock:
+            self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self.failures += 1
+            self._trial_in_flight = False
+            if self.failures >= self.failure_threshold:
+                self.opened_at = time.monotonic()
+
+
+class HostGuard:
+    """호스트 하나의 토큰 버킷 + 서킷 브레이커"""
+
+    def __init__(self, host: str):
+        rate, burst = HOST_LIMITS.get(host, (HTTP_RATE_LIMIT, HTTP_RATE_BURST))
+        self.host = host
+        self.bucket = TokenBucket(rate, burst)
+        self.breaker = CircuitBreaker(CIRCUIT_FAILURE_THRESHOLD, CIRCUIT_RESET_TIMEOUT)
+
+    def before_request(self, max_wait: Optional[float] = None) -> None:
+        """
+        서킷이 열려 있으면 CircuitOpenError, 아니면 토큰을 받을 때까지 대기
+
+        max_wait 안에 토큰을 받을 수 없으면 RateLimitTimeout (실패로 집계하지 않음)
+        """
+        if not self.breaker.allow():
+            raise CircuitOpenError(f"circuit open for {self.host}")
+        if self.bucket.acquire(max_wait) is None:
+            self.breaker.release()
+            raise RateLimitTimeout(f"rate limit wait for {self.host} exceeds {max_wait:.3f}s")
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "rate": self.bucket.rate,
+            "burst": self.bucket.burst,
+            "waitedSeconds": round(self.bucket.waited, 3),
+            "circuit": self.breaker.state,
+            "failures": self.breaker.failures,
+            "shortCircuited": self.breaker.short_circuited,
+        }
+
+
+_guards: Dict[str, HostGuard] = {}
+_guards_lock = threading.Lock()
+
+
+def guard_for(host: str) -> HostGuard:
+    """호스트 이름(netloc)별 HostGuard (없으면 생성)"""
+    with _guards_lock:
+        guard = _guards.get(host)
+        if guard is None:
+            guard = _guards[host] = HostGuard(host)
+        return guard
+
+
+def guard_stats() -> Dict[str, Dict[str, Any]]:
+    with _guards_lock:
+        return {host: guard.stats() for host, guard in _guards.items()}
@@ -0,0 +1,311 @@
+# -*- coding: utf-8 -*-
+"""
+전 종목 기술적 지표 스크리너
+
+로컬 일봉 저장소에 있는 KOSPI/KOSDAQ 종목 전체를 벡터화 엔진으로 한 번에 계산해
+지표 컬럼(NumPy 배열) 스냅샷으로 보관하고, 조회는 이 컬럼에 불리언 마스크만 적용합니다.
+스냅샷은 feed_cache(stale-while-revalidate)로 시세 TTL마다 백그라운드에서 다시 만듭니다.
+
+전 종목 일봉 저장소는 서버가 평일 장 마감 뒤(SCREEN_SYNC_TIME) 매일 채우며,
+직접 채울 수도 있습니다 (호스트별 요청 제한을 지키며 수 분 소요):
+    cd backend
+    python -m analysis.screener --sync
+
+환경변수:
+    SCREEN_SYNC_ENABLED: false면 매일 전 종목 동기화를 예약하지 않음 (기본 true)
+    SCREEN_SYNC_TIME: 평일 동기화 시각 (한국 시간 HH:MM, 기본 16:10)
+"""
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional
+
+import numpy as np
+from apscheduler.schedulers.background import BackgroundScheduler
+
+try:
+    from .cache import KST, feed_cache, quote_ttl
+    from .indicator_engine import MIN_BARS, close_matrix, compute_indicator_arrays, detect_crosses
+    from .ohlcv_store import get_ohlcv_store
+    from .symbols import get_symbol_master
+    from .technical import ANALYZE_WORKERS, get_ma_status, get_stock_ohlcv
+except ImportError:
+    from cache import KST, feed_cache, quote_ttl
+    from indicator_engine import MIN_BARS, close_matrix, compute_indicator_arrays, detect_crosses
+    from ohlcv_store import get_ohlcv_store
+    from symbols import get_symbol_master
+    from technical import ANALYZE_WORKERS, get_ma_status, get_stock_ohlcv
+
+SCREEN_SYNC_ENABLED = os.getenv("SCREEN_SYNC_ENABLED", "true").lower() == "true"
+SCREEN_SYNC_TIME = os.getenv("SCREEN_SYNC_TIME", "16:10")
+SCREEN_DAYS = 150
+SCREEN_MARKETS = ("KOSPI", "KOSDAQ")
+# 정렬 가능한 컬럼 (API 파라미터 -> 스냅샷 컬럼)
+SORT_COLUMNS = {
+    "code": "code",
+    "price": "price",
+    "rsi": "rsi",
+    "bbWidth": "bb_width",
+    "ma20Gap": "ma20_gap",
+}
+BB_FILTERS = ("above_upper", "below_lower", "inside")
+
+
+@dataclass
+class ScreenSnapshot:
+    """전 종목 지표 컬럼 (모든 배열은 같은 순서·길이)"""
+    columns: Dict[str, np.ndarray]
+    built_at: float
+    elapsed_ms: float
+    # 대상 시장 종목 수와 그중 스냅샷에 든 종목 수, 마지막 봉이 오래돼 빠진 종목 수
+    coverage: Dict[str, int] = field(default_factory=dict)
+
+    def __len__(self) -> int:
+        return len(self.columns["code"])
+
+
+def build_snapshot(markets=SCREEN_MARKETS) -> ScreenSnapshot:
+    """저장소의 종목 중 markets에 속하고 120봉 이상인 종목으로 지표 스냅샷 생성"""
+    t0 = time.perf_counter()
+    master = get_symbol_master()
+    universe = sum(1 for s in master.by_code.values() if s.market in markets)
+    store = get_ohlcv_store()
+    last_dates = store.last_dates()
+    cutoff = _stale_cutoff(store, last_dates)
+    closes = store.load_closes(SCREEN_DAYS, [c for c, d in last_dates.items() if d >= cutoff])
+
+    codes, symbols, series = [], [], []
+    for code, values in closes.items():
+        symbol = master.get(code)
+        if symbol is None or symbol.market not in markets or len(values) < MIN_BARS:
+            continue
+        codes.append(code)
+        symbols.append(symbol)
+        series.append(values)
+    stale = len(last_dates) - len(closes)
+
+    matrix = close_matrix(series, SCREEN_DAYS)
+    arrays = compute_indicator_arrays(matrix)
+    crosses = detect_crosses(matrix, pairs=((5, 20),), codes=codes)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ma20_gap = (arrays["price"] / arrays["ma20"] - 1) * 100
+    columns = {
+        **arrays,
+        "code": np.asarray(codes, dtype=object),
+        "as_of": np.asarray([last_dates[c] for c in codes], dtype=object),
+        "name": np.asarray([s.name for s in symbols], dtype=object),
+        "market": np.asarray([s.market for s in symbols], dtype=object),
+        "sector": np.asarray([s.sector for s in symbols], dtype=object),
+        "ma_status": np.asarray([
+            get_ma_status(a, b, c, d) for a, b, c, d in zip(
+                arrays["ma5"].tolist(), arrays["ma20"].tolist(), arrays["ma60"].tolist(), arrays["ma120"].tolist())
+        ], dtype=object),
+        "ma20_gap": ma20_gap,
+        # 마지막 MA5/MA20 골든·데드크로스 이후 지난 봉 수 (없으면 -1)
+        "golden_bars_ago": crosses.bars_since("golden", (5, 20)),
+        "dead_bars_ago": crosses.bars_since("dead", (5, 20)),
+    }
+    elapsed_ms = round((time.perf_counter() - t0) * 1000, 1)
+    print(f"[OK] Screen snapshot built: {len(codes)}/{universe} symbols in {elapsed_ms}ms ({stale} stale skipped)")
+    if universe and len(codes) < universe // 2:
+        print(f"[Warning] Screen covers only {len(codes)}/{universe} symbols; run the universe sync")
+    coverage = {"universe": universe, "covered": len(codes), "stale": stale}
+    return ScreenSnapshot(columns, time.time(), elapsed_ms, coverage)
+
+
+def _stale_cutoff(store, last_dates: Dict[str, str]) -> str:
+    """
+    스냅샷에 넣을 마지막 봉 날짜 하한
+
+    가장 최근 거래일과 그 직전 거래일까지만 현재 시세로 봅니다 (당일 봉을 아직 받지 않은 종목 허용).
+    그보다 오래된 종목(거래정지·상장폐지 등)은 묵은 종가로 검색되지 않도록 제외합니다.
+    """
+    if not last_dates:
+        return ""
+    latest_code = max(last_dates, key=last_dates.get)
+    dates = store.recent_dates(latest_code, 2)
+    return dates[-1]
+
+
+def get_snapshot() -> ScreenSnapshot:
+    """스냅샷 (시세 TTL이 지나면 묵은 스냅샷으로 응답하고 백그라운드 재생성)"""
+    snapshot, _ = feed_cache.get_or_revalidate("screen:universe", build_snapshot, quote_ttl())
+    return snapshot
+
+
+def _round(value: float, digits: int = 2) -> Optional[float]:
+    return None if np.isnan(value) else round(float(value), digits)
+
+
+def _row(cols: Dict[str, np.ndarray], i: int) -> Dict[str, Any]:
+    return {
+        "code": cols["code"][i],
+        "name": cols["name"][i],
+        "market": cols["market"][i],
+        "asOf": cols["as_of"][i],
+        "sector": cols["sector"][i],
+        "price": _round(cols["price"][i]),
+        "rsi": _round(cols["rsi"][i]),
+        "bbUpper": _round(cols["bb_upper"][i]),
+        "bbMiddle": _round(cols["bb_middle"][i]),
+        "bbLower": _round(cols["bb_lower"][i]),
+        "bbWidth": _round(cols["bb_width"][i]),
+        "ma5": _round(cols["ma5"][i]),
+        "ma20": _round(cols["ma20"][i]),
+        "ma60": _round(cols["ma60"][i]),
+        "ma120": _round(cols["ma120"][i]),
+        "ma20Gap": _round(cols["ma20_gap"][i]),
+        "maStatus": cols["ma_status"][i],
+        "goldenCross": bool(cols["golden_cross"][i]),
+        "deadCross": bool(cols["dead_cross"][i]),
+        "goldenBarsAgo": int(cols["golden_bars_ago"][i]),
+        "deadBarsAgo": int(cols["dead_bars_ago"][i]),
+    }
+
+
+def screen(
+    snapshot: ScreenSnapshot,
+    rsi_min: Optional[float] = None,
+    rsi_max: Optional[float] = None,
+    golden_cross: Optional[bool] = None,
+    dead_cross: Optional[bool] = None,
+    golden_within: Optional[int] = None,
+    dead_within: Optional[int] = None,
+    bb: Optional[str] = None,
+    ma_status: Optional[str] = None,
+    market: Optional[str] = None,
+    price_min: Optional[float] = None,
+    price_max: Optional[float] = None,
+    sort: str = "code",
+    desc: bool = False,
+    page: int = 1,
+    page_size: int = 50,
+) -> Dict[str, Any]:
+    """
+    스냅샷 컬럼에 조건을 적용해 페이지 단위로 반환
+
+    예) RSI 30 미만 + 최근 5일 골든크로스: rsi_max=30, golden_cross=True
+        볼린저 상단 돌파: bb="above_upper"
+        최근 10봉 내 MA5/MA20 골든크로스: golden_within=10
+    """
+    if bb is not None and bb not in BB_FILTERS:
+        raise ValueError(f"bb must be one of {BB_FILTERS}")
+    if sort not in SORT_COLUMNS:
+        raise ValueError(f"sort must be one of {tuple(SORT_COLUMNS)}")
+
+    cols = snapshot.columns
+    mask = np.ones(len(snapshot), dtype=bool)
+    with np.errstate(invalid="ignore"):
+        if rsi_min is not None:
+            mask &= cols["rsi"] >= rsi_min
+        if rsi_max is not None:
+            mask &= cols["rsi"] < rsi_max
+        if price_min is not None:
+            mask &= cols["price"] >= price_min
+        if price_max is not None:
+            mask &= cols["price"] <= price_max
+        if bb == "above_upper":
+            mask &= cols["price"] > cols["bb_upper"]
+        elif bb == "below_lower":
+            mask &= cols["price"] < cols["bb_lower"]
+        elif bb == "inside":
+            mask &= (cols["price"] >= cols["bb_lower"]) & (cols["price"] <= cols["bb_upper"])
+    if golden_cross is not None:
+        mask &= cols["golden_cross"] == golden_cross
+    if dead_cross is not None:
+        mask &= cols["dead_cross"] == dead_cross
+    if golden_within is not None:
+        mask &= (cols["golden_bars_ago"] >= 0) & (cols["golden_bars_ago"] < golden_within)
+    if dead_within is not None:
+        mask &= (cols["dead_bars_ago"] >= 0) & (cols["dead_bars_ago"] < dead_within)
+    if ma_status:
+        mask &= cols["ma_status"] == ma_status
+    if market:
+        mask &= cols["market"] == market.upper()
+
+    matched = np.flatnonzero(mask)
+    keys = cols[SORT_COLUMNS[sort]][matched]
+    if sort == "code":
+        order = np.argsort(keys.astype(str), kind="stable")
+        if desc:
+            order = order[::-1]
+    else:
+        # NaN은 정렬 방향과 관계없이 맨 뒤
+        keys = np.where(np.isnan(keys), np.inf, -keys if desc else keys)
+        order = np.argsort(keys, kind="stable")
+    matched = matched[order]
+
+    start = (page - 1) * page_size
+    return {
+        "total": int(len(matched)),
+        "page": page,
+        "pageSize": page_size,
+        "universe": len(snapshot),
+        "coverage": snapshot.coverage,
+        "builtAt": time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(snapshot.built_at)),
+        "items": [_row(cols, i) for i in matched[start:start + page_size].tolist()],
+    }
+
+
+def sync_universe(markets=SCREEN_MARKETS, max_workers: int = ANALYZE_WORKERS) -> Dict[str, int]:
+    """종목 마스터의 markets 종목 일봉을 저장소에 채움. {"synced": n, "failed": m}"""
+    codes = [s.code for s in get_symbol_master().by_code.values() if s.market in markets]
+    with ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix="screen-sync") as pool:
+        ok = sum(1 for df in pool.map(lambda c: get_stock_ohlcv(c, SCREEN_DAYS), codes) if df is not None)
+    return {"synced": ok, "failed": len(codes) - ok}
+
+
+_sync_scheduler: Optional[BackgroundScheduler] = None
+
+
+def _scheduled_sync() -> None:
+    try:
+        t0 = time.perf_counter()
+        result = sync_universe()
+        print(f"[OK] Scheduled universe sync: {result} in {time.perf_counter() - t0:.0f}s")
+    except Exception as e:
+        print(f"[Error] Scheduled universe sync failed: {e}")
+
+
+def start_universe_sync() -> bool:
+    """평일 SCREEN_SYNC_TIME(한국 시간)마다 전 종목 일봉 동기화 예약 (꺼져 있거나 이미 예약했으면 False)"""
+    global _sync_scheduler
+    if not SCREEN_SYNC_ENABLED or _sync_scheduler is not None:
+        return False
+    hour, minute = (int(part) for part in SCREEN_SYNC_TIME.split(":"))
+    _sync_scheduler = BackgroundScheduler(daemon=True, timezone=KST)
+    _sync_scheduler.add_job(
+        _scheduled_sync, "cron", day_of_week="mon-fri", hour=hour, minute=minute,
+        max_instances=1, coalesce=True, misfire_grace_time=3600,
+    )
+    _sync_scheduler.start()
+    print(f"[OK] Universe sync scheduled (weekdays {SCREEN_SYNC_TIME} KST)")
+    return True
+
+
+def stop_universe_sync() -> None:
+    global _sync_scheduler
+    if _sync_scheduler is not None:
+        _sync_scheduler.shutdown(wait=False)
+        _sync_scheduler = None
+
+
+# 저장소 동기화 / 스크린 테스트
+if __name__ == "__main__":
+    import sys
+    sys.stdout.reconfigure(encoding='utf-8')
+
+    if "--sync" in sys.argv:
+        print(f"[OK] Universe sync: {sync_universe()}")
+
+    snap = build_snapshot()
+    for label, kwargs in [
+        ("RSI<30 & golden cross", {"rsi_max": 30, "golden_cross": True}),
+        ("above upper band", {"bb": "above_upper", "sort": "bbWidth", "desc": True}),
+    ]:
+        t0 = time.perf_counter()
+        result = screen(snap, **kwargs)
+        elapsed = (time.perf_counter() - t0) * 1000
+        print(f"  {label}: {result['total']} matches ({elapsed:.2f}ms) {[r['name'] for r in result['items'][:5]]}")
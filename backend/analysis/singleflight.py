@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+"""
+Single-flight 요청 병합 모듈
+
+같은 키로 동시에 들어온 호출은 먼저 시작된 한 번의 실행 결과를 함께 받습니다.
+대시보드 여러 개가 동시에 새로고침해도 동일한 업스트림 요청은 1회만 나갑니다.
+"""
+import threading
+import time
+from typing import Any, Callable, Dict, Hashable, Optional
+
+
+class WaitTimeout(TimeoutError):
+    """진행 중인 호출의 결과를 제한 시간 안에 받지 못함"""
+
+
+class _Call:
+    """진행 중인 호출"""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """키 단위로 진행 중인 호출을 공유하는 스레드 안전 그룹"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+        self.executed = 0
+        self.shared = 0
+
+    def do(
+        self,
+        key: Hashable,
+        fn: Callable[[], Any],
+        timeout: Optional[float] = None,
+        share_error: Callable[[BaseException], bool] = lambda e: True,
+    ) -> Any:
+        """
+        key로 진행 중인 호출이 있으면 그 결과를 기다렸다가 반환, 없으면 fn 실행
+
+        fn이 예외를 던지면 기다리던 호출자 모두에게 같은 예외가 전달됩니다.
+        share_error가 False인 예외(리더 자신의 마감 초과 등)는 전달하지 않고, 기다리던 호출자가 다시 시도합니다.
+
+        Args:
+            timeout: 다른 호출의 결과를 기다릴 최대 시간 (초). 넘기면 WaitTimeout
+        """
+        until = None if timeout is None else time.monotonic() + timeout
+        while True:
+            with self._lock:
+                call = self._calls.get(key)
+                if call is not None:
+                    self.shared += 1
+                    leader = False
+                else:
+                    call = _Call()
+                    self._calls[key] = call
+                    self.executed += 1
+                    leader = True
+
+            if leader:
+                break
+            if not call.done.wait(None if until is None else max(0.0, until - time.monotonic())):
+                raise WaitTimeout(f"timed out waiting for in-flight call {key!r}")
+            if call.error is None:
+                return call.result
+            if share_error(call.error):
+                raise call.error
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            call.done.set()
+
+        if call.error is not None:
+            raise call.error
+        return call.result
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"executed": self.executed, "shared": self.shared, "inFlight": len(self._calls)}
@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+"""
+네이버 금융 siseJson 응답 파서
+
+siseJson.naver 응답은 JSON과 비슷하지만 헤더 행은 작은따옴표, 날짜는 큰따옴표를 쓰는 형식입니다.
+
+    [['날짜', '시가', '고가', '저가', '종가', '거래량', '외국인소진율'],
+    ["20240102", 78200, 79800, 78200, 79600, 17142847, 53.3],
+    ...
+    ]
+
+헤더 행만 따로 읽고, 나머지 본문은 괄호·따옴표·쉼표를 공백으로 바꿔 나눈 뒤
+np.array(dtype=float)로 한 번에 숫자 배열로 읽어 (행 수, 열 수)로 reshape합니다.
+행마다 파이썬 리스트를 만드는 ast.literal_eval보다 긴 기간 응답에서 훨씬 빠릅니다.
+"""
+from typing import Dict
+
+import numpy as np
+
+# 헤더(한글) -> 컬럼명
+COLUMN_MAP = {
+    "날짜": "date",
+    "시가": "open",
+    "고가": "high",
+    "저가": "low",
+    "종가": "close",
+    "거래량": "volume",
+}
+
+_SEPARATORS = str.maketrans({c: " " for c in "[]\"',\t\r\n"})
+
+
+class SiseParseError(ValueError):
+    """siseJson 본문 형식 오류 (호출 측은 범용 파서로 재시도)"""
+
+
+def _bad_row_message(tokens, width: int) -> str:
+    """숫자로 읽을 수 없는 첫 값이 든 데이터 행 (0부터)"""
+    for i, token in enumerate(tokens):
+        try:
+            float(token)
+        except ValueError:
+            row = i // width
+            return f"siseJson row {row} has non-numeric value {token!r}: {tokens[row * width:(row + 1) * width]}"
+    return "siseJson body has non-numeric values"
+
+
+def parse_sise_json(text: str) -> Dict[str, np.ndarray]:
+    """
+    siseJson 본문 -> 컬럼별 NumPy 배열 (날짜 오름차순)
+
+    Returns:
+        {"date": "YYYYMMDD"(분봉은 "YYYYMMDDHHMM") 문자열 배열, "open"/"high"/"low"/"close"/"volume": float64 배열}
+        데이터 행이 없으면 길이 0 배열
+
+    Raises:
+        SiseParseError: 형식이 다르거나 숫자가 아닌 값이 섞인 경우 (ValueError 하위 클래스, 문제 행 포함)
+    """
+    start = text.find("[[")
+    end = text.find("]", start)
+    if start < 0 or end < 0:
+        raise SiseParseError("siseJson header row not found")
+
+    header = [h.strip().strip("'\"") for h in text[start + 2:end].split(",")]
+    index = {COLUMN_MAP[h]: i for i, h in enumerate(header) if h in COLUMN_MAP}
+    if "date" not in index or "close" not in index:
+        raise SiseParseError(f"unexpected siseJson header: {header}")
+
+    tokens = text[end + 1:].translate(_SEPARATORS).split()
+    width = len(header)
+    if len(tokens) % width:
+        raise SiseParseError(f"siseJson body has {len(tokens)} values for {width} columns")
+    try:
+        values = np.array(tokens, dtype=float)
+    except ValueError:
+        raise SiseParseError(_bad_row_message(tokens, width)) from None
+
+    table = values.reshape(-1, width)
+    dates = table[:, index["date"]].astype(np.int64)
+    order = None if np.all(dates[1:] >= dates[:-1]) else np.argsort(dates, kind="stable")
+
+    # 일봉은 YYYYMMDD, 분봉은 YYYYMMDDHHMM
+    columns = {"date": dates.astype(str)}
+    for name in ("open", "high", "low", "close", "volume"):
+        if name in index:
+            columns[name] = table[:, index[name]]
+    if order is not None:
+        columns = {name: col[order] for name, col in columns.items()}
+    return columns
@@ -0,0 +1,331 @@
+# -*- coding: utf-8 -*-
+"""
+스트리밍(증분) 기술적 지표
+
+과거 일봉으로 한 번 초기화한 뒤 새 봉(update)이나 장중 체결가(update_last)가 들어올 때마다
+상수 시간에 지표를 갱신합니다. 매 틱마다 150봉 전체를 다시 계산하지 않아도 됩니다.
+계산 규칙은 technical.py의 pandas 구현과 같습니다 (RSI는 단순 이동평균, 표준편차는 ddof=1).
+값이 아직 계산되지 않는 구간(봉 부족)은 NaN입니다.
+"""
+import math
+from collections import deque
+from typing import Iterable, Optional
+
+import pandas as pd
+
+try:
+    from .technical import (
+        TechnicalIndicators, _stock_name, get_bb_status, get_ma_status, get_rsi_status, get_trend,
+    )
+except ImportError:
+    from technical import (
+        TechnicalIndicators, _stock_name, get_bb_status, get_ma_status, get_rsi_status, get_trend,
+    )
+
+NAN = float("nan")
+# 누적 합의 부동소수점 오차가 쌓이지 않도록 이 횟수마다 창 전체로 합을 다시 계산 (분할 상환 O(1))
+RESYNC_EVERY = 1000
+
+
+class RollingWindow:
+    """고정 길이 창의 합·제곱합을 유지하는 버퍼 (append / replace_last 모두 O(1))"""
+
+    def __init__(self, size: int):
+        self.size = size
+        self._buf: deque = deque(maxlen=size)
+        self._sum = 0.0
+        self._sumsq = 0.0
+        self._ops = 0
+
+    def __len__(self) -> int:
+        return len(self._buf)
+
+    @property
+    def full(self) -> bool:
+        return len(self._buf) == self.size
+
+    def append(self, x: float) -> None:
+        if self.full:
+            old = self._buf[0]
+            self._sum -= old
+            self._sumsq -= old * old
+        self._buf.append(x)
+        self._sum += x
+        self._sumsq += x * x
+        self._tick()
+
+    def replace_last(self, x: float) -> None:
+        if not self._buf:
+            self.append(x)
+            return
+        old = self._buf[-1]
+        self._buf[-1] = x
+        self._sum += x - old
+        self._sumsq += x * x - old * old
+        self._tick()
+
+    def _tick(self) -> None:
+        self._ops += 1
+        if self._ops >= RESYNC_EVERY:
+            self._ops = 0
+            self._sum = math.fsum(self._buf)
+            self._sumsq = math.fsum(v * v for v in self._buf)
+
+    def mean(self) -> float:
+        return self._sum / self.size if self.full else NAN
+
+    def std(self) -> float:
+        """표본 표준편차 (ddof=1)"""
+        if not self.full or self.size < 2:
+            return NAN
+        var = (self._sumsq - self._sum * self._sum / self.size) / (self.size - 1)
+        return math.sqrt(var) if var > 0 else 0.0
+
+
+class StreamingSMA:
+    """단순 이동평균"""
+
+    def __init__(self, window: int):
+        self.window = RollingWindow(window)
+
+    def seed(self, closes: Iterable[float]) -> "StreamingSMA":
+        for close in closes:
+            self.update(close)
+        return self
+
+    def update(self, close: float) -> None:
+        """새 봉 추가"""
+        self.window.append(close)
+
+    def update_last(self, close: float) -> None:
+        """마지막(미완성) 봉 가격 교체"""
+        self.window.replace_last(close)
+
+    @property
+    def value(self) -> float:
+        return self.window.mean()
+
+
+class StreamingBollinger:
+    """볼린저밴드 (이동평균 ± std_dev × 표본 표준편차)"""
+
+    def __init__(self, period: int = 20, std_dev: float = 2.0):
+        self.window = RollingWindow(period)
+        self.std_dev = std_dev
+
+    def seed(self, closes: Iterable[float]) -> "StreamingBollinger":
+        for close in closes:
+            self.update(close)
+        return self
+
+    def update(self, close: float) -> None:
+        self.window.append(close)
+
+    def update_last(self, close: float) -> None:
+        self.window.replace_last(close)
+
+    @property
+    def middle(self) -> float:
+        return self.window.mean()
+
+    @property
+    def upper(self) -> float:
+        return self.middle + self.window.std() * self.std_dev
+
+    @property
+    def lower(self) -> float:
+        return self.middle - self.window.std() * self.std_dev
+
+    @property
+    def width(self) -> float:
+        """밴드폭 (%)"""
+        middle = self.middle
+        if not middle:
+            return NAN
+        return (self.upper - self.lower) / middle * 100
+
+
+class StreamingRSI:
+    """RSI (calculate_rsi와 같은 단순 이동평균 방식)"""
+
+    def __init__(self, period: int = 14):
+        self.gains = RollingWindow(period)
+        self.losses = RollingWindow(period)
+        self._prev: Optional[float] = None  # 마지막 봉 직전 종가
+        self._last: Optional[float] = None
+
+    def seed(self, closes: Iterable[float]) -> "StreamingRSI":
+        for close in closes:
+            self.update(close)
+        return self
+
+    def _delta(self, base: Optional[float], close: float) -> float:
+        # 첫 봉의 변화량은 pandas diff()처럼 없음 -> 상승/하락 0
+        return 0.0 if base is None else close - base
+
+    def update(self, close: float) -> None:
+        delta = self._delta(self._last, close)
+        self.gains.append(max(delta, 0.0))
+        self.losses.append(max(-delta, 0.0))
+        self._prev, self._last = self._last, close
+
+    def update_last(self, close: float) -> None:
+        if self._last is None:
+            self.update(close)
+            return
+        delta = self._delta(self._prev, close)
+        self.gains.replace_last(max(delta, 0.0))
+        self.losses.replace_last(max(-delta, 0.0))
+        self._last = close
+
+    @property
+    def value(self) -> float:
+        avg_gain, avg_loss = self.gains.mean(), self.losses.mean()
+        if math.isnan(avg_gain) or (avg_gain == 0 and avg_loss == 0):
+            return NAN
+        if avg_loss == 0:
+            return 100.0
+        return 100 - 100 / (1 + avg_gain / avg_loss)
+
+
+class MACross:
+    """단기/장기 이동평균 교차 감지 (check_cross와 같이 최근 lookback개 지점 기준)"""
+
+    def __init__(self, short: int = 5, long: int = 20, lookback: int = 5):
+        self.short = StreamingSMA(short)
+        self.long = StreamingSMA(long)
+        self._diffs: deque = deque(maxlen=lookback)
+
+    def seed(self, closes: Iterable[float]) -> "MACross":
+        for close in closes:
+            self.update(close)
+        return self
+
+    def update(self, close: float) -> None:
+        self.short.update(close)
+        self.long.update(close)
+        self._diffs.append(self.short.value - self.long.value)
+
+    def update_last(self, close: float) -> None:
+        if not self._diffs:
+            self.update(close)
+            return
+        self.short.update_last(close)
+        self.long.update_last(close)
+        self._diffs[-1] = self.short.value - self.long.value
+
+    def _crossed(self, sign: int) -> bool:
+        diffs = self._diffs
+        return any(
+            diffs[i - 1] * sign < 0 < diffs[i] * sign
+            for i in range(1, len(diffs))
+        )
+
+    @property
+    def golden_cross(self) -> bool:
+        return self._crossed(1)
+
+    @property
+    def dead_cross(self) -> bool:
+        return self._crossed(-1)
+
+
+class IndicatorState:
+    """
+    종목 하나의 증분 지표 묶음 (RSI, 볼린저밴드, MA5/20/60/120, 골든/데드크로스)
+
+    사용 예:
+        state = IndicatorState.from_ohlcv("005930", df)   # 과거 일봉으로 초기화
+        state.on_price("20240102", 71200)                  # 장중 체결가 (당일 봉이 없으면 새 봉 추가)
+        state.on_price("20240102", 71500)                  # 같은 날 체결가는 당일 봉 갱신
+        indicators = state.snapshot()
+    """
+
+    def __init__(self, code: str, name: Optional[str] = None):
+        self.code = code
+        self.name = name or _stock_name(code)
+        self.rsi = StreamingRSI(14)
+        self.bb = StreamingBollinger(20, 2.0)
+        self.cross = MACross(5, 20)
+        self.ma60 = StreamingSMA(60)
+        self.ma120 = StreamingSMA(120)
+        self.price = NAN
+        self.bars = 0
+        # 마지막 봉 날짜 (YYYYMMDD). 날짜 없이 update로만 채웠으면 None
+        self.last_date: Optional[str] = None
+
+    @classmethod
+    def from_ohlcv(cls, code: str, df: pd.DataFrame, name: Optional[str] = None) -> "IndicatorState":
+        state = cls(code, name).seed(df["close"].tolist())
+        if len(df) and "date" in df:
+            state.last_date = str(df["date"].iloc[-1])
+        return state
+
+    def seed(self, closes: Iterable[float]) -> "IndicatorState":
+        for close in closes:
+            self.update(close)
+        return self
+
+    def update(self, close: float) -> None:
+        """새 봉 종가 추가"""
+        close = float(close)
+        for ind in (self.rsi, self.bb, self.cross, self.ma60, self.ma120):
+            ind.update(close)
+        self.price = close
+        self.bars += 1
+
+    def update_last(self, close: float) -> None:
+        """마지막 봉(장중 미완성 봉) 가격 갱신"""
+        if not self.bars:
+            self.update(close)
+            return
+        close = float(close)
+        for ind in (self.rsi, self.bb, self.cross, self.ma60, self.ma120):
+            ind.update_last(close)
+        self.price = close
+
+    def on_price(self, date: str, close: float) -> None:
+        """
+        체결가 반영 (date: YYYYMMDD)
+
+        마지막 봉이 같은 날짜면 그 봉을 갱신하고, 아니면(당일 봉이 아직 저장소에 없으면) 새 봉으로 추가합니다.
+        전일 봉 종가를 당일 체결가로 덮어쓰지 않도록 장중 가격은 이 메서드로 넣어야 합니다.
+        """
+        date = str(date)
+        if self.last_date == date:
+            self.update_last(close)
+        else:
+            self.update(close)
+            self.last_date = date
+
+    @property
+    def ready(self) -> bool:
+        """analyze_stock과 같은 최소 120봉 확보 여부"""
+        return self.bars >= 120
+
+    def snapshot(self) -> TechnicalIndicators:
+        """현재 상태를 TechnicalIndicators로 반환 (analyze_stock과 같은 반올림·상태 판단)"""
+        price, rsi = self.price, self.rsi.value
+        upper, middle, lower = self.bb.upper, self.bb.middle, self.bb.lower
+        ma5, ma20 = self.cross.short.value, self.cross.long.value
+        ma60, ma120 = self.ma60.value, self.ma120.value
+        return TechnicalIndicators(
+            code=self.code,
+            name=self.name,
+            current_price=price,
+            rsi=round(rsi, 2),
+            rsi_status=get_rsi_status(rsi),
+            bb_upper=round(upper, 2),
+            bb_middle=round(middle, 2),
+            bb_lower=round(lower, 2),
+            bb_status=get_bb_status(price, upper, middle, lower),
+            bb_width=round(self.bb.width, 2),
+            ma5=round(ma5, 2),
+            ma20=round(ma20, 2),
+            ma60=round(ma60, 2),
+            ma120=round(ma120, 2),
+            ma_status=get_ma_status(ma5, ma20, ma60, ma120),
+            trend=get_trend(price, ma20, ma60, rsi),
+            golden_cross=self.cross.golden_cross,
+            dead_cross=self.cross.dead_cross,
+        )
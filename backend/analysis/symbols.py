@@ -0,0 +1,219 @@
+# -*- coding: utf-8 -*-
+"""
+종목 마스터 모듈
+
+KOSPI/KOSDAQ/ETF 종목 목록을 로컬 파일(data/symbols.json)로 보관하고,
+메모리에 코드 해시 인덱스(코드 -> 종목명·시장·업종)와 이름 접두어 트라이를 만들어
+네트워크 없이 종목명 조회·자동완성을 처리합니다.
+
+마스터 파일 갱신:
+    cd backend
+    python -m analysis.symbols --refresh
+"""
+import json
+import os
+import threading
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+try:
+    from . import http_client
+except ImportError:
+    import http_client
+
+SYMBOLS_PATH = os.path.join(os.path.dirname(__file__), "..", "data", "symbols.json")
+
+HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    "Accept": "application/json",
+}
+
+# 마스터 파일이 없을 때 쓰는 기본 종목
+SEED_SYMBOLS = [
+    ("069500", "KODEX 200", "ETF"),
+    ("229200", "KODEX 코스닥150", "ETF"),
+    ("233740", "KODEX 코스닥150레버리지", "ETF"),
+    ("005930", "삼성전자", "KOSPI"),
+    ("000660", "SK하이닉스", "KOSPI"),
+    ("373220", "LG에너지솔루션", "KOSPI"),
+]
+
+# 트라이 노드마다 보관할 최대 후보 수 (자동완성 상한)
+MAX_SUGGESTIONS = 20
+
+
+@dataclass
+class SymbolInfo:
+    """종목 마스터 항목"""
+    code: str
+    name: str
+    market: str  # KOSPI/KOSDAQ/ETF
+    sector: str = ""
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+def _normalize(text: str) -> str:
+    """검색 키 정규화 (소문자, 공백 제거)"""
+    return "".join(text.lower().split())
+
+
+class _TrieNode:
+    __slots__ = ("children", "items")
+
+    def __init__(self):
+        self.children: Dict[str, "_TrieNode"] = {}
+        self.items: List[SymbolInfo] = []
+
+
+class SymbolMaster:
+    """코드 해시 인덱스 + 이름/코드 접두어 트라이"""
+
+    def __init__(self, symbols: List[SymbolInfo] = None):
+        self.by_code: Dict[str, SymbolInfo] = {}
+        self._root = _TrieNode()
+        self.updated_at: Optional[str] = None
+        for s in symbols or []:
+            self.add(s)
+
+    def __len__(self) -> int:
+        return len(self.by_code)
+
+    def add(self, symbol: SymbolInfo) -> None:
+        if symbol.code in self.by_code:
+            return
+        self.by_code[symbol.code] = symbol
+        self._insert(_normalize(symbol.name), symbol)
+        self._insert(symbol.code, symbol)
+
+    def _insert(self, key: str, symbol: SymbolInfo) -> None:
+        # 각 노드에 후보를 미리 담아 두어 조회는 접두어 길이만큼만 따라감
+        node = self._root
+        for ch in key:
+            node = node.children.setdefault(ch, _TrieNode())
+            if len(node.items) < MAX_SUGGESTIONS and not any(s is symbol for s in node.items):
+                node.items.append(symbol)
+
+    def get(self, code: str) -> Optional[SymbolInfo]:
+        return self.by_code.get(code)
+
+    def name_of(self, code: str) -> Optional[str]:
+        symbol = self.by_code.get(code)
+        return symbol.name if symbol else None
+
+    def search(self, query: str, limit: int = 10) -> List[SymbolInfo]:
+        """종목명 또는 코드 접두어 검색 (정확히 일치하는 코드가 있으면 맨 앞)"""
+        key = _normalize(query or "")
+        if not key:
+            return []
+        node = self._root
+        for ch in key:
+            node = node.children.get(ch)
+            if node is None:
+                return []
+        exact = self.by_code.get(key.upper())
+        if exact is None:
+            return node.items[:limit]
+        return [exact] + [s for s in node.items if s is not exact][:limit - 1]
+
+
+def load_symbol_master(path: str = SYMBOLS_PATH) -> SymbolMaster:
+    """마스터 파일 로드 (없거나 깨졌으면 기본 종목만)"""
+    symbols: List[SymbolInfo] = []
+    updated_at = None
+    if os.path.exists(path):
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            updated_at = data.get("updatedAt")
+            symbols = [SymbolInfo(**s) for s in data.get("symbols", [])]
+        except Exception as e:
+            print(f"[Warning] Symbol master load failed: {e}")
+    if not symbols:
+        symbols = [SymbolInfo(code, name, market) for code, name, market in SEED_SYMBOLS]
+    master = SymbolMaster(symbols)
+    master.updated_at = updated_at
+    return master
+
+
+def _fetch_market_symbols(market: str) -> List[SymbolInfo]:
+    """네이버 모바일 API에서 시장(KOSPI/KOSDAQ) 전체 종목 조회"""
+    symbols = []
+    page = 1
+    while True:
+        url = f"https://m.stock.naver.com/api/stocks/marketValue/{market}"
+        response = http_client.get(url, params={"page": page, "pageSize": 100}, headers=HEADERS)
+        response.raise_for_status()
+        data = response.json()
+        stocks = data.get("stocks") or []
+        for s in stocks:
+            sector = (s.get("industryCodeType") or {}).get("industryGroupKor", "")
+            symbols.append(SymbolInfo(s.get("itemCode", ""), s.get("stockName", ""), market, sector))
+        if not stocks or page * 100 >= int(data.get("totalCount") or 0):
+            break
+        page += 1
+    return [s for s in symbols if s.code and s.name]
+
+
+def _fetch_etf_symbols() -> List[SymbolInfo]:
+    """네이버 금융 ETF 목록 조회"""
+    url = "https://finance.naver.com/api/sise/etfItemList.nhn"
+    response = http_client.get(url, headers=HEADERS)
+    response.raise_for_status()
+    items = (response.json().get("result") or {}).get("etfItemList") or []
+    return [SymbolInfo(i["itemcode"], i["itemname"], "ETF") for i in items if i.get("itemcode") and i.get("itemname")]
+
+
+def refresh_symbol_master(path: str = SYMBOLS_PATH) -> int:
+    """KOSPI·KOSDAQ·ETF 목록을 내려받아 마스터 파일 저장. 저장한 종목 수 반환"""
+    symbols = _fetch_market_symbols("KOSPI") + _fetch_market_symbols("KOSDAQ") + _fetch_etf_symbols()
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({
+            "updatedAt": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "symbols": [s.to_dict() for s in symbols],
+        }, f, ensure_ascii=False)
+    reload_symbol_master(path)
+    return len(symbols)
+
+
+_master: Optional[SymbolMaster] = None
+_master_lock = threading.Lock()
+
+
+def get_symbol_master() -> SymbolMaster:
+    """싱글톤 종목 마스터 (최초 호출 시 파일에서 로드)"""
+    global _master
+    if _master is None:
+        with _master_lock:
+            if _master is None:
+                _master = load_symbol_master()
+    return _master
+
+
+def reload_symbol_master(path: str = SYMBOLS_PATH) -> SymbolMaster:
+    global _master
+    master = load_symbol_master(path)
+    with _master_lock:
+        _master = master
+    return master
+
+
+# 마스터 갱신 / 검색 테스트
+if __name__ == "__main__":
+    import sys
+    import time
+    sys.stdout.reconfigure(encoding='utf-8')
+
+    if "--refresh" in sys.argv:
+        print(f"[OK] Symbol master saved: {refresh_symbol_master()} symbols")
+
+    master = get_symbol_master()
+    print(f"[Symbol Master] {len(master)} symbols (updated: {master.updated_at})")
+    for q in ["삼성", "kodex", "0059"]:
+        t0 = time.perf_counter()
+        hits = master.search(q)
+        elapsed = (time.perf_counter() - t0) * 1000
+        print(f"  '{q}' -> {[s.name for s in hits]} ({elapsed:.3f}ms)")
@@ -4,20 +4,39 @@
 
 RSI, 볼린저밴드, 이동평균선 등 기술적 지표를 계산합니다.
 """
-import requests
+import os
 import pandas as pd
 import numpy as np
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Any, Optional
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, field, replace
 from datetime import datetime, timedelta
 import time
 
+try:
+    from . import http_client
+    from .cache import indicator_memo, quote_ttl
+    from .ohlcv_store import get_ohlcv_store
+    from .sise_parser import COLUMN_MAP, SiseParseError, parse_sise_json
+    from .symbols import get_symbol_master
+except ImportError:
+    import http_client
+    from cache import indicator_memo, quote_ttl
+    from ohlcv_store import get_ohlcv_store
+    from sise_parser import COLUMN_MAP, SiseParseError, parse_sise_json
+    from symbols import get_symbol_master
+
 
 HEADERS = {
     "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
     "Referer": "https://finance.naver.com/",
 }
 
+# 여러 종목 분석 시 동시에 처리할 최대 종목 수 (1이면 순차). 호스트별 요청 제한은 http_client가 적용
+ANALYZE_WORKERS = int(os.getenv("ANALYZE_WORKERS", "8"))
+
+OHLCV_COLUMNS = ["date", "open", "high", "low", "close", "volume"]
+
 # 분석 대상 종목
 DEFAULT_STOCKS = {
     # 지수 ETF
@@ -30,6 +49,11 @@ DEFAULT_STOCKS = {
 }
 
 
+def _stock_name(code: str) -> str:
+    """종목코드 -> 종목명 (DEFAULT_STOCKS → 종목 마스터 → 코드 그대로)"""
+    return DEFAULT_STOCKS.get(code) or get_symbol_master().name_of(code) or code
+
+
 @dataclass
 class TechnicalIndicators:
     """기술적 지표 데이터"""
@@ -60,9 +84,56 @@ class TechnicalIndicators:
         return asdict(self)
 
 
+@dataclass
+class StockAnalysisResult:
+    """종목 하나의 분석 결과 (소요 시간, 실패 사유 포함)"""
+    code: str
+    name: str
+    indicators: Optional[TechnicalIndicators]
+    elapsed_ms: float
+    error: Optional[str] = None
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "code": self.code,
+            "name": self.name,
+            "elapsedMs": self.elapsed_ms,
+            "error": self.error,
+            "indicators": self.indicators.to_dict() if self.indicators else None,
+        }
+
+
+@dataclass
+class AnalysisReport:
+    """여러 종목 분석 리포트 (results는 입력 순서)"""
+    results: List[StockAnalysisResult] = field(default_factory=list)
+    elapsed_ms: float = 0.0
+    workers: int = 1
+    
+    @property
+    def indicators(self) -> List[TechnicalIndicators]:
+        return [r.indicators for r in self.results if r.indicators]
+    
+    @property
+    def failures(self) -> List[StockAnalysisResult]:
+        return [r for r in self.results if r.indicators is None]
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "elapsedMs": self.elapsed_ms,
+            "workers": self.workers,
+            "succeeded": len(self.results) - len(self.failures),
+            "failed": len(self.failures),
+            "results": [r.to_dict() for r in self.results],
+        }
+
+
 def get_stock_ohlcv(code: str, days: int = 150) -> Optional[pd.DataFrame]:
     """
-    네이버 금융에서 일봉 데이터 가져오기
+    일봉 데이터 가져오기 (로컬 저장소 우선)
+    
+    저장소가 요청 구간을 이미 갖고 있고 최근(시세 TTL 이내)에 동기화됐으면 네트워크 없이 응답합니다.
+    아니면 마지막 저장 봉부터 오늘까지만 네이버 금융에서 받아 upsert합니다(당일 봉 갱신 포함).
     
     Args:
         code: 종목코드
@@ -71,11 +142,55 @@ def get_stock_ohlcv(code: str, days: int = 150) -> Optional[pd.DataFrame]:
     Returns:
         DataFrame with columns: date, open, high, low, close, volume
     """
+    end_date, start_date = _ohlcv_range(days)
+    start_key = start_date.strftime("%Y%m%d")
+    
     try:
-        # 날짜 계산
-        end_date = datetime.now()
-        start_date = end_date - timedelta(days=days + 30)  # 여유분
+        store = get_ohlcv_store()
+        state = store.sync_state(code)
+        if not _is_store_fresh(state, start_key):
+            covered = state is not None and state[0] <= start_key
+            fetch_from = start_date
+            last = store.last_bar(code) if covered else None
+            if last:
+                # 마지막 저장 봉(장중이면 미완성 봉)부터 다시 받아 덮어씀
+                fetch_from = datetime.strptime(last[0], "%Y%m%d")
+            fetched = _fetch_ohlcv(code, fetch_from, end_date)
+            if fetched is not None:
+                store.upsert(code, fetched, start_key)
+            elif state is None:
+                return None
         
+        df = store.load(code, start_key, days)
+        if df.empty:
+            print(f"[Warning] No OHLCV data for {code}")
+            return None
+        return df
+    
+    except Exception as e:
+        print(f"[Error] Failed to get OHLCV for {code}: {e}")
+        return None
+
+
+def _ohlcv_range(days: int):
+    """(종료일, 시작일) - 시작일은 휴장일 여유분 30일 포함"""
+    end_date = datetime.now()
+    return end_date, end_date - timedelta(days=days + 30)
+
+
+def _is_store_fresh(state, start_key: str) -> bool:
+    """저장소가 start_key부터 보관하고 있고 시세 TTL 이내에 동기화됐는지"""
+    return state is not None and state[0] <= start_key and time.time() - state[1] < quote_ttl()
+
+
+def _fetch_ohlcv(code: str, start_date: datetime, end_date: datetime) -> Optional[pd.DataFrame]:
+    """
+    네이버 금융 siseJson에서 [start_date, end_date] 일봉 조회
+    
+    Returns:
+        날짜 오름차순 DataFrame (조회 결과가 없으면 빈 DataFrame, 실패 시 None)
+    """
+    try:
         url = "https://api.finance.naver.com/siseJson.naver"
         params = {
             "symbol": code,
@@ -85,70 +200,59 @@ def get_stock_ohlcv(code: str, days: int = 150) -> Optional[pd.DataFrame]:
             "timeframe": "day"
         }
         
-        response = requests.get(url, params=params, headers=HEADERS, timeout=10)
+        response = http_client.get(url, params=params, headers=HEADERS)
         response.raise_for_status()
         
-        # 응답 파싱 (JSON 형식이지만 따옴표가 없는 형태)
-        text = response.text.strip()
-        # 줄바꿈, 탭 정리
-        text = text.replace("\n", "").replace("\t", "")
-        
-        # eval로 파싱 (주의: 신뢰할 수 있는 소스에서만 사용)
-        import ast
         try:
-            data = ast.literal_eval(text)
-        except:
-            # 대안: JSON으로 변환 시도
-            import json
-            import re
-            # 작은따옴표를 큰따옴표로 변환
-            text = re.sub(r"'", '"', text)
-            data = json.loads(text)
-        
-        if not data or len(data) < 2:
-            print(f"[Warning] No OHLCV data for {code}")
-            return None
-        
-        # 첫 행은 컬럼명
-        columns = data[0]
-        rows = data[1:]
-        
-        df = pd.DataFrame(rows, columns=columns)
+            columns = parse_sise_json(response.text)
+        except SiseParseError as e:
+            # 예상과 다른 형식이면 느린 범용 파서로 재시도
+            print(f"[Warning] Fast siseJson parse failed for {code}, falling back: {e}")
+            return _parse_sise_legacy(response.text)
         
-        # 컬럼명 정리 (한글 -> 영문)
-        column_map = {
-            "날짜": "date",
-            "시가": "open",
-            "고가": "high",
-            "저가": "low",
-            "종가": "close",
-            "거래량": "volume",
-        }
-        df = df.rename(columns=column_map)
-        
-        # 필요한 컬럼만 선택
-        required_cols = ["date", "open", "high", "low", "close", "volume"]
-        available_cols = [c for c in required_cols if c in df.columns]
-        df = df[available_cols]
-        
-        # 데이터 타입 변환
-        for col in ["open", "high", "low", "close", "volume"]:
-            if col in df.columns:
-                df[col] = pd.to_numeric(df[col], errors="coerce")
-        
-        # 날짜 정렬 (오래된 순)
-        df = df.sort_values("date").reset_index(drop=True)
-        
-        # 최근 days일만
-        df = df.tail(days).reset_index(drop=True)
-        
-        return df
+        return pd.DataFrame(columns, columns=[c for c in OHLCV_COLUMNS if c in columns])
         
     except Exception as e:
-        print(f"[Error] Failed to get OHLCV for {code}: {e}")
+        print(f"[Error] Failed to fetch OHLCV for {code}: {e}")
         return None
 
 
+def _parse_sise_legacy(text: str) -> pd.DataFrame:
+    """siseJson 범용 파서 (literal_eval, 실패 시 따옴표 치환 후 JSON)"""
+    # 줄바꿈, 탭 정리
+    text = text.strip().replace("\n", "").replace("\t", "")
+    
+    # eval로 파싱 (주의: 신뢰할 수 있는 소스에서만 사용)
+    import ast
+    try:
+        data = ast.literal_eval(text)
+    except:
+        # 대안: JSON으로 변환 시도
+        import json
+        import re
+        # 작은따옴표를 큰따옴표로 변환
+        text = re.sub(r"'", '"', text)
+        data = json.loads(text)
+    
+    if not data or len(data) < 2:
+        return pd.DataFrame(columns=OHLCV_COLUMNS)
+    
+    # 첫 행은 컬럼명
+    df = pd.DataFrame(data[1:], columns=data[0])
+    
+    # 컬럼명 정리 (한글 -> 영문), 필요한 컬럼만 선택
+    df = df.rename(columns=COLUMN_MAP)
+    df = df[[c for c in OHLCV_COLUMNS if c in df.columns]]
+    
+    # 데이터 타입 변환
+    for col in OHLCV_COLUMNS[1:]:
+        if col in df.columns:
+            df[col] = pd.to_numeric(df[col], errors="coerce")
+    
+    # 날짜 정렬 (오래된 순)
+    return df.sort_values("date").reset_index(drop=True)
+
+
 def calculate_rsi(df: pd.DataFrame, period: int = 14) -> pd.Series:
     """RSI (Relative Strength Index) 계산"""
     delta = df["close"].diff()
@@ -248,22 +352,13 @@ def get_trend(price: float, ma20: float, ma60: float, rsi: float) -> str:
 
 def check_cross(ma_short: pd.Series, ma_long: pd.Series) -> Dict[str, bool]:
     """골든크로스/데드크로스 확인 (최근 5일 내)"""
-    recent_short = ma_short.tail(5)
-    recent_long = ma_long.tail(5)
-    
-    golden_cross = False
-    dead_cross = False
-    
-    for i in range(1, len(recent_short)):
-        prev_diff = recent_short.iloc[i-1] - recent_long.iloc[i-1]
-        curr_diff = recent_short.iloc[i] - recent_long.iloc[i]
-        
-        if prev_diff < 0 and curr_diff > 0:
-            golden_cross = True
-        elif prev_diff > 0 and curr_diff < 0:
-            dead_cross = True
+    diff = (ma_short.tail(5).to_numpy() - ma_long.tail(5).to_numpy())
+    prev, curr = diff[:-1], diff[1:]
     
-    return {"golden_cross": golden_cross, "dead_cross": dead_cross}
+    return {
+        "golden_cross": bool(((prev < 0) & (curr > 0)).any()),
+        "dead_cross": bool(((prev > 0) & (curr < 0)).any()),
+    }
 
 
 def analyze_stock(code: str, name: str = None) -> Optional[TechnicalIndicators]:
@@ -272,13 +367,21 @@ def analyze_stock(code: str, name: str = None) -> Optional[TechnicalIndicators]:
     
     Args:
         code: 종목코드
-        name: 종목명 (없으면 DEFAULT_STOCKS에서 조회)
+        name: 종목명 (없으면 DEFAULT_STOCKS, 종목 마스터 순으로 조회)
     
     Returns:
         TechnicalIndicators 객체
     """
     if name is None:
-        name = DEFAULT_STOCKS.get(code, code)
+        name = _stock_name(code)
+    
+    # 저장소가 최신이면 일봉을 읽지 않고 마지막 봉만으로 메모 조회
+    store = get_ohlcv_store()
+    if _is_store_fresh(store.sync_state(code), _ohlcv_range(150)[1].strftime("%Y%m%d")):
+        last = store.last_bar(code)
+        memo = indicator_memo.get((code, last[0], last[1])) if last else None
+        if memo is not None:
+            return memo if memo.name == name else replace(memo, name=name)
     
     # 일봉 데이터 가져오기
     df = get_stock_ohlcv(code)
@@ -286,6 +389,17 @@ def analyze_stock(code: str, name: str = None) -> Optional[TechnicalIndicators]:
         print(f"[Warning] Insufficient data for {code}")
         return None
     
+    # 마지막 봉(날짜·종가)이 같으면 지표도 같으므로 재계산 생략
+    key = (code, df["date"].iloc[-1], float(df["close"].iloc[-1]))
+    memo = indicator_memo.get(key)
+    if memo is None:
+        memo = indicators_from_ohlcv(code, name, df)
+        indicator_memo.set(key, memo, float("inf"))
+    return memo if memo.name == name else replace(memo, name=name)
+
+
+def indicators_from_ohlcv(code: str, name: str, df: pd.DataFrame) -> TechnicalIndicators:
+    """일봉 DataFrame(120봉 이상)으로 기술적 지표 계산"""
     # 현재가
     current_price = df["close"].iloc[-1]
     
@@ -338,32 +452,65 @@ def analyze_stock(code: str, name: str = None) -> Optional[TechnicalIndicators]:
     )
 
 
-def analyze_multiple_stocks(codes: List[str] = None) -> List[TechnicalIndicators]:
+def _analyze_timed(code: str) -> StockAnalysisResult:
+    """analyze_stock + 소요 시간·실패 사유 기록"""
+    name = _stock_name(code)
+    t0 = time.perf_counter()
+    indicators, error = None, None
+    try:
+        indicators = analyze_stock(code, name)
+        if indicators is None:
+            error = "일봉 조회 실패 또는 데이터 부족 (120봉 미만)"
+    except Exception as e:
+        error = str(e)
+    elapsed_ms = round((time.perf_counter() - t0) * 1000, 1)
+    return StockAnalysisResult(code, name, indicators, elapsed_ms, error)
+
+
+def analyze_stocks_report(codes: List[str] = None, max_workers: int = ANALYZE_WORKERS) -> AnalysisReport:
     """
-    여러 종목 기술적 분석
+    여러 종목 기술적 분석 리포트
+    
+    최대 max_workers개 종목을 동시에 분석합니다. 업스트림 호출은 http_client의
+    호스트별 요청 제한·서킷 브레이커를 거치므로 동시성을 높여도 호스트 한도를 넘지 않습니다.
     
     Args:
         codes: 종목코드 리스트 (없으면 DEFAULT_STOCKS 사용)
+        max_workers: 동시에 분석할 최대 종목 수 (1이면 순차)
     
     Returns:
-        TechnicalIndicators 리스트
+        AnalysisReport (입력 순서, 종목별 소요 시간·실패 사유 포함)
     """
     if codes is None:
         codes = list(DEFAULT_STOCKS.keys())
+    workers = max(1, min(max_workers, len(codes)))
     
-    results = []
-    for code in codes:
-        name = DEFAULT_STOCKS.get(code, code)
-        print(f"[Info] Analyzing {name} ({code})...")
-        
-        indicators = analyze_stock(code, name)
-        if indicators:
-            results.append(indicators)
-        
-        # Rate limiting
-        time.sleep(0.5)
+    t0 = time.perf_counter()
+    if workers == 1:
+        results = [_analyze_timed(code) for code in codes]
+    else:
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="analyze") as pool:
+            results = list(pool.map(_analyze_timed, codes))
+    
+    report = AnalysisReport(results, round((time.perf_counter() - t0) * 1000, 1), workers)
+    for r in report.failures:
+        print(f"[Warning] Analysis failed for {r.name} ({r.code}): {r.error}")
+    print(f"[Info] Analyzed {len(results) - len(report.failures)}/{len(results)} stocks in {report.elapsed_ms}ms (workers={workers})")
+    return report
+
+
+def analyze_multiple_stocks(codes: List[str] = None, max_workers: int = ANALYZE_WORKERS) -> List[TechnicalIndicators]:
+    """
+    여러 종목 기술적 분석
+    
+    Args:
+        codes: 종목코드 리스트 (없으면 DEFAULT_STOCKS 사용)
+        max_workers: 동시에 분석할 최대 종목 수 (1이면 순차)
     
-    return results
+    Returns:
+        TechnicalIndicators 리스트 (입력 순서, 실패 종목 제외)
+    """
+    return analyze_stocks_report(codes, max_workers).indicators
 
 
 def get_market_technical_summary(indicators: List[TechnicalIndicators]) -> Dict[str, Any]:
@@ -429,12 +576,13 @@ def get_market_technical_summary(indicators: List[TechnicalIndicators]) -> Dict[
     }
 
 
-def format_technical_for_prompt(indicators: List[TechnicalIndicators]) -> str:
+def format_technical_for_prompt(indicators: List[TechnicalIndicators], timeframes: List[str] = None) -> str:
     """
     GPT 프롬프트용 기술적 지표 텍스트 생성
     
     Args:
         indicators: TechnicalIndicators 리스트
+        timeframes: 함께 넣을 상위 주기 ("weekly", "monthly"). 로컬 일봉을 리샘플링하므로 추가 호출 없음
     
     Returns:
         프롬프트에 포함할 텍스트
@@ -465,6 +613,20 @@ def format_technical_for_prompt(indicators: List[TechnicalIndicators]) -> str:
             f"볼린저 {ind.bb_status}, 이평선 {ind.ma_status}, 추세 {ind.trend}"
         )
     
+    if timeframes:
+        # timeframes 모듈이 이 모듈을 import하므로 순환 import를 피해 함수 안에서 import
+        try:
+            from .timeframes import analyze_timeframes, format_timeframes_for_prompt
+        except ImportError:
+            from timeframes import analyze_timeframes, format_timeframes_for_prompt
+        try:
+            by_code = analyze_timeframes([i.code for i in indicators], timeframes, {i.code: i.name for i in indicators})
+            text = format_timeframes_for_prompt(by_code)
+            if text:
+                lines.append(text)
+        except Exception as e:
+            print(f"[Warning] Timeframe indicators failed: {e}")
+    
     return "\n".join(lines)
 
 
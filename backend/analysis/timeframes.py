@@ -0,0 +1,230 @@
+# -*- coding: utf-8 -*-
+"""
+주봉·월봉 기술적 지표
+
+로컬 일봉 저장소의 일봉을 주봉/월봉으로 리샘플링해 RSI와 이동평균 배열을 계산합니다.
+업스트림에 주봉·월봉을 따로 요청하지 않으며, 여러 종목의 리샘플링은
+전 종목 일봉을 이어 붙인 배열에 reduceat을 한 번씩 적용해 처리합니다.
+결과는 (종목, 주기, 마지막 일봉)별로 indicator_memo에 캐시됩니다.
+"""
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+try:
+    from .cache import indicator_memo
+    from .technical import ANALYZE_WORKERS, _stock_name, calculate_rsi, get_rsi_status, get_stock_ohlcv
+except ImportError:
+    from cache import indicator_memo
+    from technical import ANALYZE_WORKERS, _stock_name, calculate_rsi, get_rsi_status, get_stock_ohlcv
+
+# 주기별 이동평균 기간 (단기, 중기, 장기)
+TIMEFRAME_MAS = {
+    "weekly": (5, 13, 26),
+    "monthly": (3, 6, 12),
+}
+TIMEFRAMES = tuple(TIMEFRAME_MAS)
+TIMEFRAME_LABELS = {"weekly": "주봉", "monthly": "월봉"}
+RSI_PERIOD = 14
+# 주기별 봉 하나의 최대 달력 일수
+PERIOD_DAYS = {"weekly": 7, "monthly": 31}
+# get_stock_ohlcv에 넘길 주기별 일수. RSI(14)는 15개, 가장 긴 이평은 그 기간만큼의 완성된 봉이 필요하고,
+# 앞쪽 미완성 봉(버림)과 진행 중인 봉까지 2개를 더 받음 (월봉 약 18개월, 주봉 약 4개월).
+# 실제 조회 구간은 여기에 휴장 여유 30일이 더해짐
+DAILY_HISTORY = {
+    tf: (max(RSI_PERIOD + 1, max(mas)) + 2) * PERIOD_DAYS[tf] for tf, mas in TIMEFRAME_MAS.items()
+}
+
+OHLCV_FIELDS = ("open", "high", "low", "close", "volume")
+
+
+@dataclass
+class TimeframeIndicators:
+    """주봉/월봉 기준 지표"""
+    code: str
+    name: str
+    timeframe: str  # weekly/monthly
+    date: str  # 마지막 봉에 포함된 마지막 거래일
+    bars: int
+    close: float
+    rsi: Optional[float]
+    rsi_status: str
+    mas: Dict[str, Optional[float]] = field(default_factory=dict)
+    ma_status: str = "데이터 부족"  # 정배열/역배열/혼조
+    trend: str = "횡보"  # 상승/하락/횡보 (종가와 중기 이평 비교)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+def _period_keys(dates: np.ndarray, timeframe: str) -> np.ndarray:
+    """YYYYMMDD 문자열 -> 주(월요일 기준 일수) 또는 월 번호"""
+    days = pd.to_datetime(pd.Series(dates), format="%Y%m%d").to_numpy().astype("datetime64[D]")
+    if timeframe == "monthly":
+        return days.astype("datetime64[M]").astype(np.int64)
+    d = days.astype(np.int64)
+    # 1970-01-01은 목요일 -> (d + 3) % 7 이 월요일 기준 요일
+    return d - (d + 3) % 7
+
+
+def _first_bar_complete(first_date: str, timeframe: str) -> bool:
+    """첫 일봉이 그 주·월의 첫 평일이면 첫 봉은 완성된 봉 (휴장일로 시작하는 달은 보수적으로 미완성 처리)"""
+    day = pd.Timestamp(first_date)
+    start = day.replace(day=1) if timeframe == "monthly" else day - pd.Timedelta(days=day.weekday())
+    return int(np.busday_count(start.date(), day.date())) == 0
+
+
+def resample_ohlcv(frames: Dict[str, pd.DataFrame], timeframe: str) -> Dict[str, pd.DataFrame]:
+    """
+    여러 종목 일봉 -> 주봉/월봉 (시가 첫값, 고가 최대, 저가 최소, 종가 마지막, 거래량 합)
+
+    모든 종목 일봉을 하나의 배열로 이어 붙이고 (종목, 기간) 경계마다 reduceat으로 집계합니다.
+    """
+    if timeframe not in TIMEFRAME_MAS:
+        raise ValueError(f"timeframe must be one of {TIMEFRAMES}")
+    codes = [c for c, df in frames.items() if df is not None and not df.empty]
+    if not codes:
+        return {}
+
+    lengths = np.array([len(frames[c]) for c in codes])
+    symbol = np.repeat(np.arange(len(codes)), lengths)
+    dates = np.concatenate([frames[c]["date"].astype(str).to_numpy() for c in codes])
+    cols = {f: np.concatenate([frames[c][f].to_numpy(dtype=float) for c in codes]) for f in OHLCV_FIELDS}
+
+    period = _period_keys(dates, timeframe)
+    boundary = np.flatnonzero((np.diff(symbol) != 0) | (np.diff(period) != 0)) + 1
+    starts = np.concatenate(([0], boundary))
+    ends = np.concatenate((boundary, [len(symbol)])) - 1
+
+    bars = {
+        "date": dates[ends],
+        "open": cols["open"][starts],
+        "high": np.maximum.reduceat(cols["high"], starts),
+        "low": np.minimum.reduceat(cols["low"], starts),
+        "close": cols["close"][ends],
+        "volume": np.add.reduceat(cols["volume"], starts),
+    }
+    owner = symbol[starts]
+    split = np.flatnonzero(np.diff(owner)) + 1
+    pieces = {name: np.split(values, split) for name, values in bars.items()}
+    return {
+        code: pd.DataFrame({name: pieces[name][i] for name in bars})
+        for i, code in enumerate(codes)
+    }
+
+
+def _ma_status(short: float, mid: float, long: float) -> str:
+    if any(pd.isna(v) for v in (short, mid, long)):
+        return "데이터 부족"
+    if short > mid > long:
+        return "정배열"
+    if short < mid < long:
+        return "역배열"
+    return "혼조"
+
+
+def _round(value: float) -> Optional[float]:
+    return None if pd.isna(value) else round(float(value), 2)
+
+
+def timeframe_indicators(code: str, name: str, bars: pd.DataFrame, timeframe: str) -> TimeframeIndicators:
+    """리샘플링된 봉으로 RSI·이동평균 배열 계산"""
+    close = bars["close"]
+    rsi = calculate_rsi(bars, RSI_PERIOD).iloc[-1] if len(bars) > RSI_PERIOD else float("nan")
+    windows = TIMEFRAME_MAS[timeframe]
+    mas = {w: close.rolling(window=w).mean().iloc[-1] for w in windows}
+    last = float(close.iloc[-1])
+    mid = mas[windows[1]]
+    # get_trend와 같은 기준 (RSI가 아직 없으면 종가와 중기 이평만 비교)
+    trend = "횡보"
+    if not pd.isna(mid):
+        if last > mid and (pd.isna(rsi) or rsi > 50):
+            trend = "상승"
+        elif last < mid and (pd.isna(rsi) or rsi < 50):
+            trend = "하락"
+    return TimeframeIndicators(
+        code=code,
+        name=name,
+        timeframe=timeframe,
+        date=str(bars["date"].iloc[-1]),
+        bars=len(bars),
+        close=last,
+        rsi=_round(rsi),
+        rsi_status=get_rsi_status(rsi) if not pd.isna(rsi) else "데이터 부족",
+        mas={f"ma{w}": _round(v) for w, v in mas.items()},
+        ma_status=_ma_status(*mas.values()),
+        trend=trend,
+    )
+
+
+def analyze_timeframes(
+    codes: Sequence[str],
+    timeframes: Sequence[str] = TIMEFRAMES,
+    names: Optional[Dict[str, str]] = None,
+) -> Dict[str, Dict[str, TimeframeIndicators]]:
+    """
+    종목별 주봉/월봉 지표 {code: {timeframe: TimeframeIndicators}}
+
+    일봉은 로컬 저장소에서 여러 종목을 동시에 읽고(요청한 주기에 필요한 만큼만),
+    마지막 일봉이 같으면 캐시된 결과를 그대로 씁니다.
+    """
+    timeframes = [tf for tf in timeframes if tf in TIMEFRAME_MAS]
+    names = names or {}
+    results: Dict[str, Dict[str, TimeframeIndicators]] = {}
+    pending: Dict[str, Dict[str, Any]] = {tf: {} for tf in timeframes}
+    if not timeframes:
+        return results
+
+    codes = list(dict.fromkeys(codes))
+    days = max(DAILY_HISTORY[tf] for tf in timeframes)
+    with ThreadPoolExecutor(max_workers=max(1, min(ANALYZE_WORKERS, len(codes) or 1)),
+                            thread_name_prefix="timeframes") as pool:
+        frames = list(pool.map(lambda c: get_stock_ohlcv(c, days), codes))
+
+    for code, df in zip(codes, frames):
+        if df is None or df.empty:
+            continue
+        last_date, last_close = df["date"].iloc[-1], float(df["close"].iloc[-1])
+        results[code] = {}
+        for tf in timeframes:
+            key = ("tf", code, tf, last_date, last_close)
+            cached = indicator_memo.get(key)
+            if cached is not None:
+                results[code][tf] = cached
+            else:
+                pending[tf][code] = (df, key)
+
+    for tf, items in pending.items():
+        if not items:
+            continue
+        resampled = resample_ohlcv({code: df for code, (df, _) in items.items()}, tf)
+        for code, bars in resampled.items():
+            # 조회 구간이 주·월 중간에서 시작하면 첫 봉은 일부 거래일만 담긴 미완성 봉
+            if not _first_bar_complete(str(items[code][0]["date"].iloc[0]), tf):
+                bars = bars.iloc[1:].reset_index(drop=True)
+            if bars.empty:
+                continue
+            ind = timeframe_indicators(code, names.get(code) or _stock_name(code), bars, tf)
+            indicator_memo.set(items[code][1], ind, float("inf"))
+            results[code][tf] = ind
+    return results
+
+
+def format_timeframes_for_prompt(by_code: Dict[str, Dict[str, TimeframeIndicators]]) -> str:
+    """프롬프트용 주봉/월봉 요약"""
+    lines = []
+    for per_tf in by_code.values():
+        parts = [
+            f"{TIMEFRAME_LABELS[tf]} RSI {ind.rsi if ind.rsi is not None else '-'}({ind.rsi_status}), "
+            f"이평선 {ind.ma_status}, 추세 {ind.trend}"
+            for tf, ind in per_tf.items()
+        ]
+        if parts:
+            name = next(iter(per_tf.values())).name
+            lines.append(f"- {name}: " + " / ".join(parts))
+    if not lines:
+        return ""
+    return "\n### 주봉·월봉 관점\n" + "\n".join(lines)
@@ -8,11 +8,20 @@ import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "../.."))
 
 import logging
-from fastapi import APIRouter, HTTPException, Request
+import time
+from datetime import datetime
+from fastapi import APIRouter, HTTPException, Query, Request
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import StreamingResponse, Response
 from typing import List, Dict, Any, Optional, Tuple
 
 from analysis.market import MarketAnalyzer, market_analyzer
+from analysis.technical import ANALYZE_WORKERS, analyze_stocks_report
+from analysis import screener
+from analysis.indicator_engine import DEFAULT_CROSS_PAIRS, get_cross_events
+from analysis.timeframes import TIMEFRAMES, analyze_timeframes
+from analysis.news import market_news_ingester
+from analysis.news_store import get_news_store
 
 logger = logging.getLogger(__name__)
 
@@ -46,24 +55,147 @@ def _normalize_holdings(holdings: List[Any]) -> Tuple[List[str], Dict[str, str]]
     return codes, names
 
 
+def _parse_timeframes(raw: Any) -> Optional[List[str]]:
+    """"weekly,monthly" 또는 ["weekly", ...] -> 지원하는 주기만 (없으면 None)"""
+    if isinstance(raw, str):
+        raw = raw.split(",")
+    if not isinstance(raw, list):
+        return None
+    timeframes = [t.strip() for t in raw if isinstance(t, str) and t.strip() in TIMEFRAMES]
+    return list(dict.fromkeys(timeframes)) or None
+
+
 @router.get("/news")
 async def get_news() -> List[Dict[str, Any]]:
+    """시황 헤드라인 (실시간 속보 링에서 읽음, ageSeconds는 마지막 목록 수집 후 경과 시간)"""
     try:
-        return market_analyzer.get_news(limit=15)
+        # 링은 NEWS_INGEST_INTERVAL마다만 목록을 다시 받으므로 따로 캐시하지 않음
+        news = await run_in_threadpool(market_analyzer.get_news, 15)
+        ingested_at = market_news_ingester.ingested_at
+        age = time.monotonic() - ingested_at if ingested_at else 0.0
+        return [{**n, "ageSeconds": round(age, 1)} for n in news]
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @router.get("/news/stock/{code}")
 async def get_stock_news(code: str) -> List[Dict[str, Any]]:
+    """종목 뉴스 (시황 분석과 같은 종목별 캐시 사용)"""
     try:
         from analysis.news import news_crawler
-        news = news_crawler.get_stock_news(code, limit=10)
+        news = await run_in_threadpool(news_crawler.get_stock_news, code, limit=10)
         return [n.to_dict() for n in news]
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.get("/news/search")
+async def search_news(
+    q: str = Query("", description="제목·요약 검색어 (단어마다 접두어 일치, 모두 포함)"),
+    code: Optional[str] = Query(None, description="종목 뉴스로 수집된 종목코드"),
+    since: Optional[str] = Query(None, description="이 시각 이후 게시 (YYYY-MM-DD 또는 YYYY-MM-DD HH:MM)"),
+    limit: int = Query(20, ge=1, le=100),
+) -> List[Dict[str, Any]]:
+    """로컬 뉴스 아카이브 전문 검색 (최신순)"""
+    if since:
+        try:
+            since = datetime.strptime(since, "%Y-%m-%d %H:%M" if " " in since else "%Y-%m-%d").strftime("%Y-%m-%d %H:%M")
+        except ValueError:
+            raise HTTPException(status_code=400, detail="since는 YYYY-MM-DD 또는 YYYY-MM-DD HH:MM 형식이어야 합니다")
+    try:
+        items = await run_in_threadpool(get_news_store().search, q, code, since, limit)
+        return [n.to_dict() for n in items]
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/technical")
+async def get_technical_report(
+    codes: str = Query("", description="쉼표로 구분한 종목코드 (없으면 기본 종목)"),
+    workers: int = Query(ANALYZE_WORKERS, ge=1, le=32),
+    timeframes: Optional[str] = Query(None, description="추가 주기 (weekly,monthly). 로컬 일봉을 리샘플링"),
+) -> Dict[str, Any]:
+    """여러 종목 기술적 지표 (입력 순서, 종목별 소요 시간·실패 사유 포함)"""
+    code_list = list(dict.fromkeys(c.strip() for c in codes.split(",") if c.strip()))
+    if len(code_list) > 100:
+        raise HTTPException(status_code=400, detail="codes는 최대 100개까지 가능합니다")
+    tf = _parse_timeframes(timeframes)
+    try:
+        report = await run_in_threadpool(analyze_stocks_report, code_list or None, workers)
+        out = report.to_dict()
+        if tf:
+            by_code = await run_in_threadpool(analyze_timeframes, [r.code for r in report.results if r.indicators], tf)
+            for item in out["results"]:
+                item["timeframes"] = {k: v.to_dict() for k, v in by_code.get(item["code"], {}).items()}
+        return out
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/crosses/{code}")
+async def get_crosses(
+    code: str,
+    days: int = Query(500, ge=30, le=3000),
+    pairs: str = Query(",".join(f"{s}-{l}" for s, l in DEFAULT_CROSS_PAIRS), description="단기-장기 MA 쌍 (쉼표 구분)"),
+    kind: Optional[str] = Query(None, alias="type", description="golden / dead"),
+    within: Optional[int] = Query(None, ge=1, description="최근 N봉 이내"),
+) -> Dict[str, Any]:
+    """종목의 최근 days개 봉에서 발생한 이동평균 골든/데드크로스 이벤트"""
+    try:
+        pair_list = tuple(tuple(int(w) for w in p.split("-")) for p in pairs.split(",") if p.strip())
+        if not pair_list or any(len(p) != 2 or not 1 <= p[0] < p[1] for p in pair_list):
+            raise ValueError
+    except ValueError:
+        raise HTTPException(status_code=400, detail="pairs 형식: 5-20,20-60 (1 이상, 단기<장기)")
+    if kind is not None and kind not in ("golden", "dead"):
+        raise HTTPException(status_code=400, detail="type은 golden 또는 dead")
+    
+    events = await run_in_threadpool(get_cross_events, code, days, pair_list)
+    if events is None:
+        raise HTTPException(status_code=404, detail=f"일봉 데이터 없음: {code}")
+    return {"code": code, "bars": events.days, "events": events.query(kind=kind, within=within)}
+
+
+@router.get("/screen")
+async def screen_stocks(
+    rsi_min: Optional[float] = Query(None, ge=0, le=100, alias="rsiMin"),
+    rsi_max: Optional[float] = Query(None, ge=0, le=100, alias="rsiMax"),
+    golden_cross: Optional[bool] = Query(None, alias="goldenCross", description="최근 5일 내 MA5/MA20 골든크로스"),
+    dead_cross: Optional[bool] = Query(None, alias="deadCross", description="최근 5일 내 MA5/MA20 데드크로스"),
+    golden_within: Optional[int] = Query(None, ge=1, le=150, alias="goldenWithin", description="최근 N봉 내 MA5/MA20 골든크로스"),
+    dead_within: Optional[int] = Query(None, ge=1, le=150, alias="deadWithin", description="최근 N봉 내 MA5/MA20 데드크로스"),
+    bb: Optional[str] = Query(None, description="above_upper / below_lower / inside"),
+    ma_status: Optional[str] = Query(None, alias="maStatus", description="정배열/역배열/단기상승/단기하락/혼조"),
+    market: Optional[str] = Query(None, description="KOSPI / KOSDAQ"),
+    price_min: Optional[float] = Query(None, ge=0, alias="priceMin"),
+    price_max: Optional[float] = Query(None, ge=0, alias="priceMax"),
+    sort: str = Query("code", description="code / price / rsi / bbWidth / ma20Gap"),
+    desc: bool = False,
+    page: int = Query(1, ge=1),
+    page_size: int = Query(50, ge=1, le=200, alias="pageSize"),
+) -> Dict[str, Any]:
+    """
+    전 종목 기술적 지표 스크리너 (로컬 일봉 저장소 기준, 미리 계산한 지표 컬럼에서 조회)
+    
+    예) /screen?rsiMax=30&goldenCross=true, /screen?bb=above_upper&sort=bbWidth&desc=true
+    """
+    try:
+        snapshot = await run_in_threadpool(screener.get_snapshot)
+        return screener.screen(
+            snapshot,
+            rsi_min=rsi_min, rsi_max=rsi_max,
+            golden_cross=golden_cross, dead_cross=dead_cross,
+            golden_within=golden_within, dead_within=dead_within,
+            bb=bb, ma_status=ma_status, market=market,
+            price_min=price_min, price_max=price_max,
+            sort=sort, desc=desc, page=page, page_size=page_size,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 @router.api_route("/generate", methods=["OPTIONS"])
 async def generate_options():
     return Response(status_code=200)
@@ -71,7 +203,7 @@ async def generate_options():
 
 @router.post("/generate")
 async def generate_analysis(request: Request) -> Dict[str, Any]:
-    """body: { holdings: [ code 또는 { code, name } ] }. 수동 파싱으로 422 방지."""
+    """body: { holdings: [ code 또는 { code, name } ], timeframes?: ["weekly", "monthly"] }. 수동 파싱으로 422 방지."""
     try:
         body = await request.json()
     except Exception:
@@ -80,15 +212,21 @@ async def generate_analysis(request: Request) -> Dict[str, Any]:
     if not isinstance(holdings_raw, list):
         holdings_raw = []
     codes, holdings_names = _normalize_holdings(holdings_raw)
+    timeframes = _parse_timeframes(body.get("timeframes") if isinstance(body, dict) else None)
     try:
         analyzer = get_analyzer()
-        analysis = analyzer.generate_analysis(user_holdings=codes if codes else None, holdings_names=holdings_names or None)
+        analysis = await run_in_threadpool(
+            analyzer.generate_analysis,
+            user_holdings=codes if codes else None,
+            holdings_names=holdings_names or None,
+            timeframes=timeframes,
+        )
         return analysis.to_dict()
     except Exception as e:
         logger.exception("generate_analysis failed: %s", e)
         try:
             analyzer = get_analyzer()
-            indices, news, technical_indicators, _ = analyzer._collect_market_data(codes if codes else None)
+            indices, news, technical_indicators, _ = await run_in_threadpool(analyzer._collect_market_data, codes if codes else None)
             mock = analyzer._generate_mock_analysis(indices, news, technical_indicators, codes if codes else None)
             out = mock.to_dict()
             out["isMock"] = True
@@ -104,10 +242,11 @@ async def stream_options():
 
 
 @router.get("/generate/stream")
-async def generate_analysis_stream(holdings: Optional[str] = None):
-    """holdings=code1:이름1,code2:이름2 또는 code1,code2"""
+async def generate_analysis_stream(holdings: Optional[str] = None, timeframes: Optional[str] = None):
+    """holdings=code1:이름1,code2:이름2 또는 code1,code2, timeframes=weekly,monthly"""
+    tf = _parse_timeframes(timeframes)
     if not holdings:
-        return _stream_response(None, None)
+        return _stream_response(None, None, tf)
     parts = [p.strip() for p in holdings.split(",") if p.strip()]
     codes = []
     names = {}
@@ -122,14 +261,15 @@ async def generate_analysis_stream(holdings: Optional[str] = None):
             if p:
                 codes.append(p)
                 names[p] = p
-    return _stream_response(codes if codes else None, names if names else None)
+    return _stream_response(codes if codes else None, names if names else None, tf)
 
 
-def _stream_response(holdings_list: Optional[List[str]], holdings_names: Optional[Dict[str, str]]):
+def _stream_response(holdings_list: Optional[List[str]], holdings_names: Optional[Dict[str, str]], timeframes: Optional[List[str]] = None):
+    # 동기 제너레이터는 StreamingResponse가 스레드풀에서 순회하므로 이벤트 루프를 막지 않음
     try:
         analyzer = get_analyzer()
         return StreamingResponse(
-            analyzer.generate_analysis_stream(holdings_list, holdings_names=holdings_names),
+            analyzer.generate_analysis_stream(holdings_list, holdings_names=holdings_names, timeframes=timeframes),
             media_type="text/event-stream",
             headers={
                 "Cache-Control": "no-cache",
@@ -144,7 +284,7 @@ def _stream_response(holdings_list: Optional[List[str]], holdings_names: Optiona
 @router.get("/indices")
 async def get_indices_for_analysis() -> List[Dict[str, Any]]:
     try:
-        indices = market_analyzer.get_market_indices()
+        indices = await run_in_threadpool(market_analyzer.get_market_indices)
         return [
             {"name": idx.name, "value": idx.value, "change": idx.change, "changePercent": idx.change_percent}
             for idx in indices
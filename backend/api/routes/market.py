@@ -8,29 +8,75 @@ import os
 # 부모 디렉토리를 path에 추가
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "../.."))
 
-from fastapi import APIRouter, HTTPException
-from typing import List, Dict, Any
+from fastapi import APIRouter, HTTPException, Query
+from fastapi.concurrency import run_in_threadpool
+from typing import Any, Callable, Dict, List, Tuple
 from datetime import datetime, time
+import re
+import time as time_module
 
-from analysis.crawler import get_all_indices, get_stock_price, get_commodities_and_world
+from analysis.crawler import get_all_indices, get_stock_price, get_stock_prices, get_commodities_and_world
+from analysis.cache import feed_cache, indicator_memo, news_cache, quote_cache, quote_ttl
+from analysis import http_client
+from analysis.ratelimit import guard_stats
+from analysis.poller import market_poller, quote_board
+from analysis.symbols import get_symbol_master
+from analysis.intraday import intraday_store
 
 router = APIRouter()
 
+# /stocks 한 번에 조회할 수 있는 최대 종목 수
+MAX_BATCH_CODES = 100
+
+_STOCK_CODE = re.compile(r"\d{6}")
+
+
+def _from_board(key: str):
+    """폴러가 실행 중이면 시세판 스냅샷 값 반환 (없거나 너무 오래됐으면 None → 직접 조회)"""
+    if not market_poller.is_running():
+        return None
+    entry = quote_board.get_fresh(key)
+    return entry[0] if entry else None
+
+
+def _has_valid_index(items) -> bool:
+    return bool(items) and any(i.value > 0 for i in items)
+
+
+async def _load_index_group(key: str, loader: Callable[[], List[Any]]) -> Tuple[List[Any], float]:
+    """
+    시세판 → stale-while-revalidate 캐시 순으로 조회. (IndexData 리스트, 데이터 나이 초)
+
+    시세판 값도 캐시와 같은 최대 묵은 시간을 넘기면 쓰지 않습니다.
+    """
+    if market_poller.is_running():
+        entry = quote_board.get_fresh(key)
+        if entry:
+            return entry[0], time_module.time() - entry[1]
+    return await run_in_threadpool(
+        feed_cache.get_or_revalidate, key, loader, quote_ttl(), cacheable=_has_valid_index
+    )
+
+
+def _index_rows(items, age: float) -> List[Dict[str, Any]]:
+    return [
+        {
+            "name": item.name,
+            "value": item.value,
+            "change": item.change,
+            "changePercent": item.change_percent,
+            "ageSeconds": round(age, 1),
+        }
+        for item in items
+    ]
+
 
 @router.get("/indices")
 async def get_indices() -> List[Dict[str, Any]]:
-    """주요 지수 조회"""
+    """주요 지수 조회 (ageSeconds: 데이터가 갱신된 뒤 지난 시간)"""
     try:
-        indices = get_all_indices()
-        return [
-            {
-                "name": idx.name,
-                "value": idx.value,
-                "change": idx.change,
-                "changePercent": idx.change_percent
-            }
-            for idx in indices
-        ]
+        indices, age = await _load_index_group("indices", get_all_indices)
+        return _index_rows(indices, age)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -39,7 +85,7 @@ async def get_indices() -> List[Dict[str, Any]]:
 async def get_stock_info(code: str) -> Dict[str, Any]:
     """종목 정보 조회"""
     try:
-        stock = get_stock_price(code)
+        stock = _from_board(f"stock:{code}") or await run_in_threadpool(get_stock_price, code)
         if not stock:
             raise HTTPException(status_code=404, detail="Stock not found")
         
@@ -50,24 +96,92 @@ async def get_stock_info(code: str) -> Dict[str, Any]:
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.get("/stocks")
+async def get_stocks_info(codes: str = Query(..., description="쉼표로 구분한 종목코드")) -> Dict[str, Any]:
+    """여러 종목 시세 일괄 조회 (종목코드 -> 시세, 조회 실패 종목은 null)"""
+    code_list = list(dict.fromkeys(c.strip() for c in codes.split(",") if c.strip()))
+    if not code_list:
+        raise HTTPException(status_code=400, detail="codes is empty")
+    if len(code_list) > MAX_BATCH_CODES:
+        raise HTTPException(status_code=400, detail=f"Too many codes (max {MAX_BATCH_CODES})")
+    try:
+        result = {code: _from_board(f"stock:{code}") for code in code_list}
+        missing = [code for code, stock in result.items() if not stock]
+        if missing:
+            result.update(await run_in_threadpool(get_stock_prices, missing))
+        return result
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/search")
+async def search_symbols(q: str = "", limit: int = Query(10, ge=1, le=20)) -> List[Dict[str, Any]]:
+    """종목명/코드 자동완성 (로컬 종목 마스터, 네트워크 호출 없음)"""
+    return [s.to_dict() for s in get_symbol_master().search(q, limit)]
+
+
 @router.get("/commodities")
 async def get_commodities() -> List[Dict[str, Any]]:
     """원자재 및 해외 지수 조회 (금, 은, 구리, 니케이)"""
     try:
-        items = get_commodities_and_world()
-        return [
-            {
-                "name": item.name,
-                "value": item.value,
-                "change": item.change,
-                "changePercent": item.change_percent
-            }
-            for item in items
-        ]
+        items, age = await _load_index_group("commodities", get_commodities_and_world)
+        return _index_rows(items, age)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.get("/intraday/{code}")
+async def get_intraday(code: str, bars: int = Query(60, ge=1, le=800), refresh: bool = True) -> Dict[str, Any]:
+    """
+    장중 분봉과 분봉 기준 지표 (RSI·볼린저밴드·이동평균)
+    
+    refresh=true면 마지막 분봉 이후만 받아 링 버퍼에 추가합니다 (종목별 최소 간격 적용).
+    종목 마스터나 관심 종목에 없는 코드, 쌓인 분봉이 없는 종목은 링을 만들지 않고 404를 반환합니다.
+    """
+    if not _STOCK_CODE.fullmatch(code) or (
+        get_symbol_master().get(code) is None and code not in market_poller.watchlist
+    ):
+        raise HTTPException(status_code=404, detail="Stock not found")
+    if refresh:
+        await run_in_threadpool(intraday_store.ingest, code)
+    ring = intraday_store.get(code)
+    if ring is None:
+        raise HTTPException(status_code=404, detail="No intraday bars")
+    cols = ring.arrays(bars)
+    return {
+        "code": code,
+        "indicators": await run_in_threadpool(intraday_store.indicators, code),
+        "bars": [
+            {"time": str(t), "open": o, "high": h, "low": l, "close": c, "volume": v}
+            for t, o, h, l, c, v in zip(
+                cols["ts"].tolist(), cols["open"].tolist(), cols["high"].tolist(),
+                cols["low"].tolist(), cols["close"].tolist(), cols["volume"].tolist(),
+            )
+        ],
+    }
+
+
+@router.get("/cache")
+async def get_cache_stats() -> Dict[str, Any]:
+    """시세 캐시 적중/미스 및 업스트림 요청 병합 통계"""
+    return {
+        **quote_cache.stats(),
+        "ttlSeconds": quote_ttl(),
+        "feeds": feed_cache.stats(),
+        "indicators": indicator_memo.stats(),
+        "news": news_cache.stats(),
+        "coalesced": http_client.inflight.stats(),
+        "pools": http_client.pool_stats(),
+        "hosts": guard_stats(),
+    }
+
+
+@router.get("/poller")
+async def get_poller_status() -> Dict[str, Any]:
+    """백그라운드 시세 폴러 상태"""
+    return market_poller.status()
+
+
 @router.get("/status")
 async def get_market_status() -> Dict[str, Any]:
     """시장 상태 조회"""
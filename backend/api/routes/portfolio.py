@@ -10,6 +10,7 @@ import logging
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "../.."))
 
 from fastapi import APIRouter, HTTPException
+from fastapi.concurrency import run_in_threadpool
 from typing import List, Dict, Any
 
 logger = logging.getLogger(__name__)
@@ -114,7 +115,7 @@ async def connect_kiwoom() -> Dict[str, Any]:
     """키움증권 연결"""
     if KIWOOM_AVAILABLE:
         try:
-            success = kiwoom_api.connect()
+            success = await run_in_threadpool(kiwoom_api.connect)
             return {"success": success, "message": "Connected" if success else "Failed"}
         except Exception as e:
             return {"success": False, "message": str(e)}
@@ -126,7 +127,7 @@ async def connect_kiwoom() -> Dict[str, Any]:
 async def disconnect_kiwoom() -> Dict[str, Any]:
     """키움증권 연결 해제"""
     if KIWOOM_AVAILABLE:
-        kiwoom_api.disconnect()
+        await run_in_threadpool(kiwoom_api.disconnect)
     return {"success": True, "message": "Disconnected"}
 
 
@@ -179,7 +180,7 @@ async def kiwoom_test() -> Dict[str, Any]:
         result["message"] = "키움 API 미사용 (패키지 또는 앱키/시크릿 미설정)"
         return result
     try:
-        ok = kiwoom_api.connect()
+        ok = await run_in_threadpool(kiwoom_api.connect)
         result["connected"] = ok
         if not ok:
             result["message"] = "connect() 실패"
@@ -191,14 +192,14 @@ async def kiwoom_test() -> Dict[str, Any]:
         return result
     # 계좌
     try:
-        account = kiwoom_api.get_account_info()
+        account = await run_in_threadpool(kiwoom_api.get_account_info)
         result["account_source"] = "mock" if _is_mock_account(account) else "real"
     except Exception as e:
         result["error_account"] = str(e)
         logger.exception("kiwoom-test: get_account_info failed")
     # 보유
     try:
-        holdings = kiwoom_api.get_holdings()
+        holdings = await run_in_threadpool(kiwoom_api.get_holdings)
         result["holdings_source"] = "mock" if _is_mock_holdings(holdings) else "real"
     except Exception as e:
         result["error_holdings"] = str(e)
@@ -217,7 +218,7 @@ async def get_portfolio_summary() -> Dict[str, Any]:
     try:
         if KIWOOM_AVAILABLE:
             try:
-                account = kiwoom_api.get_account_info()
+                account = await run_in_threadpool(kiwoom_api.get_account_info)
                 return {
                     "totalValue": account.total_evaluation,
                     "totalProfit": account.total_profit,
@@ -244,7 +245,7 @@ async def get_account_info() -> Dict[str, Any]:
     """계좌 정보 조회"""
     if KIWOOM_AVAILABLE:
         try:
-            account = kiwoom_api.get_account_info()
+            account = await run_in_threadpool(kiwoom_api.get_account_info)
             return {
                 "accountNo": account.account_no,
                 "totalDeposit": account.total_deposit,
@@ -263,7 +264,7 @@ async def get_holdings() -> List[Dict[str, Any]]:
     """보유 종목 조회"""
     if KIWOOM_AVAILABLE:
         try:
-            holdings = kiwoom_api.get_holdings()
+            holdings = await run_in_threadpool(kiwoom_api.get_holdings)
             return [
                 {
                     "code": h.code,
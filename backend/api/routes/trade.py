@@ -9,6 +9,7 @@ import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "../.."))
 
 from fastapi import APIRouter, HTTPException
+from fastapi.concurrency import run_in_threadpool
 from typing import List, Dict, Any
 from pydantic import BaseModel
 import uuid
@@ -83,7 +84,8 @@ async def place_order(request: OrderRequest) -> Dict[str, Any]:
             order_type_num = 1 if request.order_type == "buy" else 2
             price_type = "03" if request.price == 0 else "00"
             
-            result = kiwoom_api.send_order(
+            result = await run_in_threadpool(
+                kiwoom_api.send_order,
                 order_type=order_type_num,
                 code=request.code,
                 quantity=request.quantity,
@@ -123,7 +125,7 @@ async def get_auto_trade_status() -> Dict[str, Any]:
 async def start_auto_trade() -> Dict[str, Any]:
     """자동매매 시작"""
     if auto_trader:
-        success = auto_trader.start()
+        success = await run_in_threadpool(auto_trader.start)
         return {"success": success, "message": "Started" if success else "Already running"}
     
     return {"success": True, "message": "Mock auto-trade started"}
@@ -133,7 +135,7 @@ async def start_auto_trade() -> Dict[str, Any]:
 async def stop_auto_trade() -> Dict[str, Any]:
     """자동매매 중지"""
     if auto_trader:
-        success = auto_trader.stop()
+        success = await run_in_threadpool(auto_trader.stop)
         return {"success": success, "message": "Stopped"}
     
     return {"success": True, "message": "Mock auto-trade stopped"}
@@ -181,7 +183,7 @@ async def create_strategy(request: StrategyCreate) -> Dict[str, Any]:
             loss_cut_percent=request.loss_cut_percent,
             profit_take_percent=request.profit_take_percent
         )
-        success = auto_trader.add_strategy(strategy)
+        success = await run_in_threadpool(auto_trader.add_strategy, strategy)
         return {"success": success, "id": strategy_id}
     
     new_strategy = {
@@ -205,7 +207,7 @@ async def update_strategy(strategy_id: str, request: StrategyUpdate) -> Dict[str
     """전략 수정"""
     if auto_trader:
         updates = {k: v for k, v in request.dict().items() if v is not None}
-        success = auto_trader.update_strategy(strategy_id, updates)
+        success = await run_in_threadpool(auto_trader.update_strategy, strategy_id, updates)
         if not success:
             raise HTTPException(status_code=404, detail="Strategy not found")
         return {"success": True}
@@ -225,7 +227,7 @@ async def update_strategy(strategy_id: str, request: StrategyUpdate) -> Dict[str
 async def delete_strategy(strategy_id: str) -> Dict[str, Any]:
     """전략 삭제"""
     if auto_trader:
-        success = auto_trader.delete_strategy(strategy_id)
+        success = await run_in_threadpool(auto_trader.delete_strategy, strategy_id)
         if not success:
             raise HTTPException(status_code=404, detail="Strategy not found")
         return {"success": True}
@@ -239,7 +241,7 @@ async def delete_strategy(strategy_id: str) -> Dict[str, Any]:
 async def toggle_strategy(strategy_id: str) -> Dict[str, Any]:
     """전략 활성화/비활성화 토글"""
     if auto_trader:
-        success = auto_trader.toggle_strategy(strategy_id)
+        success = await run_in_threadpool(auto_trader.toggle_strategy, strategy_id)
         if not success:
             raise HTTPException(status_code=404, detail="Strategy not found")
         return {"success": True}
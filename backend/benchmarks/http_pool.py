@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+"""
+HTTP 커넥션 풀 벤치마크
+
+같은 호스트에 반복 요청할 때 매번 새 연결을 여는 requests.get(기존 방식)과
+호스트별 keep-alive 풀(http_client.session_for)의 호출당 지연을 비교합니다.
+http_client.get은 호스트별 요청 제한을 거치므로 풀 효과만 보도록 세션을 직접 호출합니다.
+기본은 로컬 HTTP 서버를 대상으로 하며, --url을 주면 실제 호스트(HTTPS면 TLS 핸드셰이크 포함)를 호출합니다.
+
+사용법:
+    cd backend
+    python benchmarks/http_pool.py --calls 200
+    python benchmarks/http_pool.py --calls 30 --url https://m.stock.naver.com/api/index/KOSPI/basic
+"""
+import argparse
+import os
+import statistics
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import requests
+
+from analysis import http_client
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive 허용
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        body = b'{"closePrice":"2,500.00"}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def _start_local_server() -> str:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return f"http://127.0.0.1:{server.server_address[1]}/api/index/KOSPI/basic"
+
+
+def _measure(label: str, fetch, url: str, calls: int) -> list:
+    latencies = []
+    for i in range(calls):
+        t0 = time.perf_counter()
+        r = fetch(url, i)
+        r.raise_for_status()
+        latencies.append(time.perf_counter() - t0)
+    latencies.sort()
+    print(
+        f"  {label:<22} mean {statistics.mean(latencies) * 1000:8.3f}ms  "
+        f"p50 {latencies[len(latencies) // 2] * 1000:8.3f}ms  "
+        f"p99 {latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))] * 1000:8.3f}ms"
+    )
+    return latencies
+
+
+def main():
+    parser = argparse.ArgumentParser(description="호출당 HTTP 지연: 새 연결 vs keep-alive 풀")
+    parser.add_argument("--calls", type=int, default=200, help="반복 호출 수")
+    parser.add_argument("--url", default=None, help="실제 호출할 URL (없으면 로컬 서버)")
+    args = parser.parse_args()
+
+    url = args.url or _start_local_server()
+    print("=" * 70)
+    print(f"[HTTP Pool Benchmark] {args.calls} calls -> {url}")
+    print("=" * 70)
+
+    # 캐시 우회용 쿼리 파라미터를 붙여 매 호출이 실제 요청이 되도록 함
+    before = _measure(
+        "requests.get (new conn)",
+        lambda u, i: requests.get(u, params={"_": i}, timeout=http_client.DEFAULT_TIMEOUT),
+        url, args.calls,
+    )
+    after = _measure(
+        "session_for (pool)",
+        lambda u, i: http_client.session_for(u).get(u, params={"_": i}, timeout=http_client.DEFAULT_TIMEOUT),
+        url, args.calls,
+    )
+    print(f"\n  mean speedup x{statistics.mean(before) / statistics.mean(after):.1f}")
+    for host, stats in http_client.pool_stats().items():
+        print(f"  {host}: {stats['requests']} requests over {stats['connectionsOpened']} connection(s)")
+
+
+if __name__ == "__main__":
+    main()
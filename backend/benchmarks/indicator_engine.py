@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+"""
+다종목 지표 엔진 벤치마크
+
+합성 종가(랜덤 워크)로 종목별 pandas 계산(indicators_from_ohlcv)과
+벡터화 엔진(analyze_close_matrix)의 소요 시간을 비교하고, 두 결과가 같은지 확인합니다.
+
+사용법:
+    cd backend
+    python benchmarks/indicator_engine.py --symbols 2000 --days 150
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import numpy as np
+import pandas as pd
+
+from analysis.indicator_engine import analyze_close_matrix, close_matrix
+from analysis.technical import indicators_from_ohlcv
+
+
+def _synthetic_closes(symbols: int, days: int, seed: int = 42) -> list:
+    """종목마다 다른 가격대·변동성의 랜덤 워크 (일부는 상장 기간이 짧음)"""
+    rng = np.random.default_rng(seed)
+    closes = []
+    for i in range(symbols):
+        start = rng.uniform(1_000, 500_000)
+        returns = rng.normal(0, rng.uniform(0.005, 0.04), days)
+        series = np.round(start * np.exp(np.cumsum(returns)), -1)
+        length = days if i % 10 else int(rng.integers(60, days))
+        closes.append(series[-length:])
+    return closes
+
+
+def main():
+    parser = argparse.ArgumentParser(description="종목별 pandas 계산 vs 벡터화 엔진")
+    parser.add_argument("--symbols", type=int, default=2000, help="종목 수")
+    parser.add_argument("--days", type=int, default=150, help="종목당 일봉 수")
+    args = parser.parse_args()
+
+    codes = [f"{i:06d}" for i in range(args.symbols)]
+    closes = _synthetic_closes(args.symbols, args.days)
+    frames = [pd.DataFrame({"close": c}) for c in closes]
+
+    print("=" * 70)
+    print(f"[Indicator Engine Benchmark] {args.symbols} symbols x {args.days} days")
+    print("=" * 70)
+
+    t0 = time.perf_counter()
+    expected = [
+        indicators_from_ohlcv(code, code, df) if len(df) >= 120 else None
+        for code, df in zip(codes, frames)
+    ]
+    per_symbol = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    matrix = close_matrix(closes, args.days)
+    build = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    actual = analyze_close_matrix(codes, matrix, codes)
+    engine = time.perf_counter() - t0
+
+    mismatches = [
+        code for code, e, a in zip(codes, expected, actual)
+        if (e.to_dict() if e else None) != (a.to_dict() if a else None)
+    ]
+    analyzed = sum(1 for a in actual if a)
+    print(f"  pandas per symbol   {per_symbol * 1000:9.1f}ms")
+    print(f"  matrix build        {build * 1000:9.1f}ms")
+    print(f"  vectorized engine   {engine * 1000:9.1f}ms  (x{per_symbol / engine:.0f})")
+    print(f"  analyzed {analyzed}/{args.symbols}, mismatches: {len(mismatches)} {mismatches[:5]}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+"""
+/api/market/indices 동시 처리량 부하 테스트
+
+블로킹 크롤러를 async 핸들러에서 직접 호출하던 기존 방식(before)과
+스레드풀로 오프로드하는 현재 방식(after)을 같은 조건에서 비교합니다.
+업스트림 지연은 기본적으로 time.sleep으로 재현하며, --live 옵션을 주면 실제 네이버를 호출합니다.
+
+사용법:
+    cd backend
+    python benchmarks/load_indices.py --requests 40 --concurrency 20 --latency 0.5
+"""
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import httpx
+
+import main
+from api.routes import market as market_routes
+from analysis.crawler import IndexData
+
+
+def _make_slow_indices(latency: float):
+    """업스트림 1회 왕복(latency초)을 흉내 내는 블로킹 get_all_indices"""
+    def slow_get_all_indices():
+        time.sleep(latency)
+        return [
+            IndexData("코스피", 2500.0, 10.0, 0.4),
+            IndexData("코스닥", 850.0, -2.0, -0.23),
+            IndexData("나스닥", 16000.0, 50.0, 0.31),
+        ]
+    return slow_get_all_indices
+
+
+def _install_blocking_route(fetch):
+    """기존 방식 재현: async def 안에서 블로킹 함수를 직접 호출"""
+    @main.app.get("/bench/indices-blocking")
+    async def indices_blocking():
+        return [
+            {"name": i.name, "value": i.value, "change": i.change, "changePercent": i.change_percent}
+            for i in fetch()
+        ]
+
+
+async def _run(path: str, total: int, concurrency: int) -> dict:
+    transport = httpx.ASGITransport(app=main.app)
+    sem = asyncio.Semaphore(concurrency)
+    latencies = []
+    health_latencies = []
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=120) as client:
+        async def one():
+            async with sem:
+                t0 = time.perf_counter()
+                r = await client.get(path)
+                latencies.append(time.perf_counter() - t0)
+                r.raise_for_status()
+
+        async def probe_health():
+            # 부하 중 /health 응답 시간 (이벤트 루프가 막히면 같이 느려짐)
+            await asyncio.sleep(0.05)
+            t0 = time.perf_counter()
+            await client.get("/health")
+            health_latencies.append(time.perf_counter() - t0)
+
+        t0 = time.perf_counter()
+        await asyncio.gather(*(one() for _ in range(total)), probe_health())
+        elapsed = time.perf_counter() - t0
+
+    latencies.sort()
+    return {
+        "elapsed": elapsed,
+        "rps": total / elapsed if elapsed else 0.0,
+        "p50": latencies[len(latencies) // 2],
+        "p99": latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))],
+        "health": health_latencies[0] if health_latencies else 0.0,
+    }
+
+
+def _print_result(label: str, r: dict):
+    print(
+        f"  {label:<8} {r['elapsed']:7.2f}s  {r['rps']:8.1f} req/s  "
+        f"p50 {r['p50'] * 1000:8.1f}ms  p99 {r['p99'] * 1000:8.1f}ms  /health {r['health'] * 1000:8.1f}ms"
+    )
+
+
+def main_cli():
+    parser = argparse.ArgumentParser(description="/api/market/indices 동시 처리량 비교")
+    parser.add_argument("--requests", type=int, default=40, help="총 요청 수")
+    parser.add_argument("--concurrency", type=int, default=20, help="동시 요청 수")
+    parser.add_argument("--latency", type=float, default=0.5, help="모의 업스트림 지연(초)")
+    parser.add_argument("--live", action="store_true", help="실제 네이버 크롤러 사용")
+    args = parser.parse_args()
+
+    if args.live:
+        fetch = market_routes.get_all_indices
+    else:
+        fetch = _make_slow_indices(args.latency)
+        market_routes.get_all_indices = fetch
+    _install_blocking_route(fetch)
+
+    print("=" * 70)
+    print(f"[Load Test] /api/market/indices  requests={args.requests} concurrency={args.concurrency}"
+          f" upstream={'live' if args.live else f'{args.latency}s mock'}")
+    print("=" * 70)
+    before = asyncio.run(_run("/bench/indices-blocking", args.requests, args.concurrency))
+    after = asyncio.run(_run("/api/market/indices", args.requests, args.concurrency))
+    _print_result("before", before)
+    _print_result("after", after)
+    if before["rps"]:
+        print(f"\n  throughput x{after['rps'] / before['rps']:.1f}")
+
+
+if __name__ == "__main__":
+    main_cli()
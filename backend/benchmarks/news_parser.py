@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+"""
+뉴스 목록 파서 벤치마크
+
+benchmarks/fixtures의 네이버 금융 뉴스 목록 페이지(실시간 속보, 종목 뉴스)를
+BeautifulSoup 경로와 lxml XPath 경로(news_parser)로 파싱해 소요 시간과 메모리 할당(tracemalloc 최대치)을 비교하고,
+두 경로가 같은 기사(기사 키·제목·링크)를 같은 순서로 읽는지 확인합니다.
+픽스처는 실제 페이지와 같은 마크업(머리말·메뉴·꼬리말 포함)으로 만든 합성 데이터입니다.
+
+실시간 속보는 한 li에 기사 여러 건이 들어 있어, BeautifulSoup 경로는 li 전체 텍스트의 첫 시각·언론사를
+모든 기사에 붙입니다. lxml 경로는 기사마다 자기 요약(dd.articleSummary)에서 읽으므로
+"metadata diff"는 이 차이를 센 값입니다.
+
+사용법:
+    cd backend
+    python benchmarks/news_parser.py --repeat 50
+"""
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from analysis.news import _iter_market_page, _iter_market_page_soup, _iter_stock_page, _iter_stock_page_soup
+
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+CASES = [
+    ("news_market_lss2d.html", _iter_market_page_soup, _iter_market_page),
+    ("news_stock_005930.html", _iter_stock_page_soup, _iter_stock_page),
+]
+
+
+def _best_of(fn, html: str, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        list(fn(html))
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def _peak_alloc(fn, html: str) -> int:
+    """한 번 파싱하는 동안 파이썬 할당 최대치 (바이트, libxml2 내부 메모리는 집계되지 않음)"""
+    tracemalloc.start()
+    try:
+        list(fn(html))
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="뉴스 목록 파싱: BeautifulSoup vs lxml XPath")
+    parser.add_argument("--repeat", type=int, default=50, help="파일당 반복 횟수 (최솟값 사용)")
+    args = parser.parse_args()
+
+    print("=" * 70)
+    print(f"[News Parser Benchmark] best of {args.repeat}")
+    print("=" * 70)
+
+    for name, soup_fn, fast_fn in CASES:
+        with open(os.path.join(FIXTURES, name), "r", encoding="utf-8") as f:
+            html = f.read()
+
+        soup_items = list(soup_fn(html))
+        fast_items = list(fast_fn(html))
+        same = [(k, n.title, n.url) for k, n in soup_items] == [(k, n.title, n.url) for k, n in fast_items]
+        meta_diff = sum(
+            (a.source, a.time, a.published) != (b.source, b.time, b.published)
+            for (_, a), (_, b) in zip(soup_items, fast_items)
+        )
+
+        before = _best_of(soup_fn, html, args.repeat)
+        after = _best_of(fast_fn, html, args.repeat)
+        mem_before = _peak_alloc(soup_fn, html)
+        mem_after = _peak_alloc(fast_fn, html)
+        print(f"  {name} ({len(html) / 1024:.0f}KB, {len(fast_items)} articles, same articles: {same}, metadata diff: {meta_diff})")
+        print(f"    {'BeautifulSoup':<16} {before * 1000:8.2f}ms  peak {mem_before / 1024:8.1f}KB")
+        print(f"    {'lxml XPath':<16} {after * 1000:8.2f}ms  peak {mem_after / 1024:8.1f}KB  (x{before / after:.1f}, mem x{mem_before / max(mem_after, 1):.1f})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+"""
+siseJson 파서 벤치마크
+
+benchmarks/fixtures의 siseJson 응답 본문(여러 해 일봉)을 기존 파서(literal_eval + DataFrame 변환)와
+parse_sise_json(NumPy 컬럼)으로 파싱해 소요 시간을 비교하고, 두 결과가 같은지 확인합니다.
+픽스처는 실제 응답과 같은 형식(헤더 작은따옴표, 날짜 큰따옴표, 줄바꿈·탭 구분)으로 만든 합성 데이터입니다.
+
+사용법:
+    cd backend
+    python benchmarks/sise_parser.py --repeat 20
+"""
+import argparse
+import glob
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import numpy as np
+import pandas as pd
+
+from analysis.sise_parser import parse_sise_json
+from analysis.technical import OHLCV_COLUMNS, _parse_sise_legacy
+
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+
+def _best_of(fn, text: str, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn(text)
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def _fast_frame(text: str) -> pd.DataFrame:
+    columns = parse_sise_json(text)
+    return pd.DataFrame(columns, columns=OHLCV_COLUMNS)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="siseJson 파싱: literal_eval vs parse_sise_json")
+    parser.add_argument("--repeat", type=int, default=20, help="파일당 반복 횟수 (최솟값 사용)")
+    args = parser.parse_args()
+
+    print("=" * 70)
+    print(f"[siseJson Parser Benchmark] best of {args.repeat}")
+    print("=" * 70)
+
+    for path in sorted(glob.glob(os.path.join(FIXTURES, "sise_*.txt"))):
+        with open(path, "r", encoding="utf-8") as f:
+            text = f.read()
+
+        legacy = _parse_sise_legacy(text)
+        fast = _fast_frame(text)
+        same = (
+            list(legacy["date"]) == list(fast["date"])
+            and all(np.allclose(legacy[c], fast[c]) for c in OHLCV_COLUMNS[1:])
+        )
+
+        before = _best_of(_parse_sise_legacy, text, args.repeat)
+        columns_only = _best_of(parse_sise_json, text, args.repeat)
+        after = _best_of(_fast_frame, text, args.repeat)
+        print(f"  {os.path.basename(path)} ({len(text) / 1024:.0f}KB, {len(fast)} rows, same result: {same})")
+        print(f"    {'literal_eval + DataFrame':<28} {before * 1000:8.2f}ms")
+        print(f"    {'parse_sise_json (columns)':<28} {columns_only * 1000:8.2f}ms  (x{before / columns_only:.1f})")
+        print(f"    {'parse_sise_json + DataFrame':<28} {after * 1000:8.2f}ms  (x{before / after:.1f})")
+
+
+if __name__ == "__main__":
+    main()
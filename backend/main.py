@@ -4,6 +4,7 @@
 """
 import os
 import sys
+import threading
 
 if sys.platform == "win32":
     try:
@@ -12,8 +13,10 @@ if sys.platform == "win32":
         pass
 
 from contextlib import asynccontextmanager
+import anyio.to_thread
 from dotenv import load_dotenv
 from fastapi import FastAPI
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.requests import Request
@@ -27,21 +30,38 @@ from api.routes import market, portfolio, trade, analysis
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     print("[Server] Starting Kiwoom Investment System...")
+    # 라우트의 블로킹 I/O(크롤러·키움·OpenAI)는 스레드풀로 넘기므로 풀 크기를 조정 가능하게 둠
+    threadpool_size = int(os.getenv("THREADPOOL_SIZE", "40"))
+    anyio.to_thread.current_default_thread_limiter().total_tokens = threadpool_size
+    print(f"[OK] Blocking I/O threadpool size: {threadpool_size}")
     try:
         from analysis.crawler import get_all_indices
-        indices = get_all_indices()
+        indices = await run_in_threadpool(get_all_indices)
         for idx in indices[:3]:
             sign = "+" if idx.change >= 0 else ""
             print(f"  {idx.name}: {idx.value:,.2f} ({sign}{idx.change_percent:.2f}%)")
         print("[OK] Market data crawler working")
     except Exception as e:
         print(f"[Warning] Crawler test failed: {e}")
+    from analysis.symbols import get_symbol_master
+    master = await run_in_threadpool(get_symbol_master)
+    print(f"[OK] Symbol master loaded: {len(master)} symbols")
+    # 스크리너 스냅샷은 첫 요청 전에 백그라운드로 미리 생성
+    from analysis.screener import get_snapshot, start_universe_sync, stop_universe_sync
+    threading.Thread(target=get_snapshot, name="screen-warmup", daemon=True).start()
+    # 스크리너가 전 종목을 유지하도록 매일 장 마감 뒤 일봉 저장소 동기화
+    start_universe_sync()
     api_key = os.getenv("OPENAI_API_KEY", "")
     if api_key and api_key.startswith("sk-"):
         print("[OK] OpenAI API key configured")
     else:
         print("[Warning] OpenAI API key not set - using mock analysis")
+    from analysis.poller import MARKET_POLLER_ENABLED, market_poller
+    if MARKET_POLLER_ENABLED:
+        market_poller.start()
     yield
+    market_poller.stop()
+    stop_universe_sync()
     print("[Server] Shutting down...")
 
 app = FastAPI(
@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+"""공용 픽스처"""
+import time
+
+import numpy as np
+import pytest
+
+
+def random_walk(rng: np.random.Generator, n: int, start: float = 50000.0) -> np.ndarray:
+    """양수 종가 랜덤워크 (호가 단위처럼 정수로 반올림, 보합 봉 포함)"""
+    steps = rng.normal(0, 0.015, n)
+    return np.round(start * np.exp(np.cumsum(steps)))
+
+
+@pytest.fixture
+def rng():
+    return np.random.default_rng(20240102)
+
+
+class FakeClock:
+    """time.monotonic 대체. sleep하면 그만큼 시간이 흐름"""
+
+    def __init__(self):
+        self.now = 1000.0
+        self.slept = []
+
+    def __call__(self):
+        return self.now
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.slept.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """time.monotonic·time.sleep을 FakeClock으로 바꿈 (모듈들이 같은 time 모듈을 쓰므로 한 번에 적용)"""
+    fake = FakeClock()
+    monkeypatch.setattr(time, "monotonic", fake.monotonic)
+    monkeypatch.setattr(time, "sleep", fake.sleep)
+    return fake
@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+"""시세 캐시(TTLCache, cached_quote, 장 시간 TTL) 테스트"""
+from datetime import datetime
+
+import pytest
+
+from analysis import cache
+from analysis.cache import KST, TTLCache, cached_quote, is_krx_session, quote_ttl
+
+
+def test_krx_session_hours():
+    assert is_krx_session(datetime(2024, 1, 2, 10, 0, tzinfo=KST))
+    assert not is_krx_session(datetime(2024, 1, 2, 8, 59, tzinfo=KST))
+    assert not is_krx_session(datetime(2024, 1, 2, 15, 31, tzinfo=KST))
+    # 토요일
+    assert not is_krx_session(datetime(2024, 1, 6, 10, 0, tzinfo=KST))
+    assert quote_ttl(datetime(2024, 1, 2, 10, 0, tzinfo=KST)) == cache.QUOTE_TTL_OPEN
+    assert quote_ttl(datetime(2024, 1, 6, 10, 0, tzinfo=KST)) == cache.QUOTE_TTL_CLOSED
+
+
+def test_closed_ttl_stops_at_next_open():
+    # 개장 1분 전에 캐시한 시세는 개장 시각까지만 유효
+    assert quote_ttl(datetime(2024, 1, 2, 8, 59, tzinfo=KST)) == 60
+    assert quote_ttl(datetime(2024, 1, 2, 8, 59, 58, tzinfo=KST)) == cache.QUOTE_TTL_OPEN
+    # 금요일 장 마감 뒤에는 월요일 개장까지 여유가 있어 QUOTE_TTL_CLOSED 그대로
+    assert quote_ttl(datetime(2024, 1, 5, 16, 0, tzinfo=KST)) == cache.QUOTE_TTL_CLOSED
+    assert cache.seconds_until_open(datetime(2024, 1, 7, 8, 30, tzinfo=KST)) == 24.5 * 3600
+
+
+def test_get_expires_after_ttl(clock):
+    c = TTLCache("t")
+    c.set("k", 1, ttl=5)
+    assert c.get("k") == 1
+    clock.now += 5
+    assert c.get("k") is None
+    assert (c.hits, c.misses) == (1, 1)
+
+
+def test_lru_eviction(clock):
+    c = TTLCache("t", maxsize=2)
+    c.set("a", 1, 60)
+    c.set("b", 2, 60)
+    c.get("a")
+    c.set("c", 3, 60)
+    assert c.get("b") is None
+    assert c.get("a") == 1 and c.get("c") == 3
+    assert c.evictions == 1
+
+
+def test_cached_quote_returns_copies(monkeypatch):
+    monkeypatch.setattr(cache, "quote_cache", TTLCache("quotes"))
+    calls = []
+
+    @cached_quote(lambda code: f"stock:{code}")
+    def fetch(code):
+        calls.append(code)
+        return {"code": code, "currentPrice": 100}
+
+    first = fetch("005930")
+    first["currentPrice"] = 0
+    second = fetch("005930")
+    second["currentPrice"] = -1
+    assert fetch("005930")["currentPrice"] == 100
+    assert calls == ["005930"]
+
+
+def test_cached_quote_skips_uncacheable(monkeypatch):
+    monkeypatch.setattr(cache, "quote_cache", TTLCache("quotes"))
+    calls = []
+
+    @cached_quote("index:X", lambda v: v > 0)
+    def fetch():
+        calls.append(1)
+        return 0
+
+    assert fetch() == 0 and fetch() == 0
+    assert len(calls) == 2
@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+"""/api/analysis/crosses/{code} 쿼리 파싱 테스트"""
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from api.routes import analysis as analysis_routes
+from analysis.indicator_engine import DEFAULT_CROSS_PAIRS
+
+
+class _Events:
+    days = 300
+
+    def query(self, kind=None, within=None):
+        return [{"type": kind, "within": within}]
+
+
+@pytest.fixture
+def client(monkeypatch):
+    """get_cross_events 호출 인자 기록 (000000은 일봉 없음)"""
+    calls = []
+
+    def fake_events(code, days, pairs):
+        calls.append((code, days, pairs))
+        return None if code == "000000" else _Events()
+
+    monkeypatch.setattr(analysis_routes, "get_cross_events", fake_events)
+    app = FastAPI()
+    app.include_router(analysis_routes.router, prefix="/api/analysis")
+    client = TestClient(app)
+    client.calls = calls
+    return client
+
+
+def test_default_pairs_and_type_alias(client):
+    res = client.get("/api/analysis/crosses/005930", params={"type": "golden", "within": 5})
+    assert res.status_code == 200
+    assert res.json() == {"code": "005930", "bars": 300, "events": [{"type": "golden", "within": 5}]}
+    assert client.calls == [("005930", 500, DEFAULT_CROSS_PAIRS)]
+
+
+def test_custom_pairs_parsed(client):
+    res = client.get("/api/analysis/crosses/005930", params={"pairs": "3-10, 10-30,", "days": 100})
+    assert res.status_code == 200
+    assert res.json()["events"] == [{"type": None, "within": None}]
+    assert client.calls == [("005930", 100, ((3, 10), (10, 30)))]
+
+
+@pytest.mark.parametrize("pairs", ["", " , ", "20-5", "5-5", "0-5", "5-20-60", "5", "a-b"])
+def test_bad_pairs_rejected(client, pairs):
+    res = client.get("/api/analysis/crosses/005930", params={"pairs": pairs})
+    assert res.status_code == 400
+    assert client.calls == []
+
+
+def test_bad_type_rejected_and_missing_data_404(client):
+    assert client.get("/api/analysis/crosses/005930", params={"type": "both"}).status_code == 400
+    assert client.get("/api/analysis/crosses/000000").status_code == 404
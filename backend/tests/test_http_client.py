@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+"""공용 HTTP 클라이언트(get 요청 병합, fetch_all 마감) 테스트"""
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+import requests
+
+from analysis import http_client
+from analysis.ratelimit import HostGuard
+
+
+class FakeSession:
+    """첫 요청은 release까지 막혔다가 타임아웃, 이후 요청은 성공"""
+
+    def __init__(self):
+        self.release = threading.Event()
+        self.timeouts = []
+
+    def get(self, url, params=None, headers=None, timeout=None):
+        self.timeouts.append(timeout)
+        if len(self.timeouts) == 1:
+            self.release.wait(5)
+            raise requests.ReadTimeout("read timed out")
+        response = requests.Response()
+        response.status_code = 200
+        return response
+
+
+@pytest.fixture
+def session(monkeypatch):
+    fake = FakeSession()
+    guard = HostGuard("coalesce.test")
+    monkeypatch.setattr(http_client, "session_for", lambda url: fake)
+    monkeypatch.setattr(http_client, "guard_for", lambda host: guard)
+    monkeypatch.setattr(http_client, "inflight", http_client.SingleFlight())
+    fake.guard = guard
+    return fake
+
+
+def test_follower_retries_after_leader_deadline(session):
+    url = "https://coalesce.test/api/stock/005930/basic"
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        # fetch_all 작업(마감 있음)이 먼저 요청을 보내고, 라우트(마감 없음)가 같은 요청에 붙음
+        leader = pool.submit(http_client._run_until, lambda: http_client.get(url), time.monotonic() + 1.0)
+        while not session.timeouts:
+            time.sleep(0.001)
+        follower = pool.submit(http_client.get, url)
+        while http_client.inflight.stats()["shared"] < 1:
+            time.sleep(0.001)
+        session.release.set()
+        with pytest.raises(http_client.DeadlineExceeded):
+            leader.result(5)
+        assert follower.result(5).status_code == 200
+    # 두 번째 요청은 라우트 자신의 (줄이지 않은) 타임아웃으로 보냄
+    assert session.timeouts[1] == http_client.DEFAULT_TIMEOUT
+    assert session.guard.breaker.failures == 0
+
+
+def test_follower_wait_is_bounded_by_its_deadline(session):
+    url = "https://coalesce.test/slow"
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        leader = pool.submit(http_client.get, url)
+        while not session.timeouts:
+            time.sleep(0.001)
+        with pytest.raises(http_client.DeadlineExceeded):
+            http_client._run_until(lambda: http_client.get(url), time.monotonic() + 0.05)
+        session.release.set()
+        with pytest.raises(requests.Timeout):
+            leader.result(5)
+
+
+def test_fetch_all_returns_by_deadline_and_drops_late_tasks(capsys):
+    release = threading.Event()
+
+    def late():
+        release.wait(5)
+        return "late"
+
+    def boom():
+        raise ValueError("boom")
+
+    t0 = time.monotonic()
+    results = http_client.fetch_all({"fast": lambda: "fast", "late": late, "boom": boom}, deadline=0.2)
+    elapsed = time.monotonic() - t0
+    release.set()
+
+    # 늦은 작업을 기다리지 않고 마감 즈음 반환, 실패·지각 키는 빠짐
+    assert results == {"fast": "fast"}
+    assert elapsed < 1.0
+    out = capsys.readouterr().out
+    assert "late missed fetch deadline" in out
+    assert "boom fetch failed: boom" in out
+
+
+def test_fetch_all_sets_deadline_for_tasks():
+    seen = http_client.fetch_all({"remaining": http_client._remaining}, deadline=2.0)
+    assert 0 < seen["remaining"] <= 2.0
+    # 중첩 호출은 더 이른 마감을 따르고, 끝나면 스레드의 마감은 원래대로
+    outer = time.monotonic() + 5.0
+    inner = http_client._run_until(
+        lambda: http_client._run_until(http_client._remaining, time.monotonic() + 10.0), outer
+    )
+    assert inner <= 5.0
+    assert http_client._remaining() is None
@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+"""벡터화 지표 엔진 vs technical.py pandas 구현 비교"""
+from dataclasses import asdict
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from analysis.indicator_engine import (
+    MIN_BARS, analyze_close_matrix, close_matrix, compute_indicator_arrays, detect_crosses,
+)
+from analysis.technical import calculate_moving_averages, indicators_from_ohlcv
+from conftest import random_walk
+
+
+def test_matches_pandas_per_symbol(rng):
+    lengths = [150, 130, 120, 149, 150, 125]
+    series = [random_walk(rng, n, start=1000 * (i + 1)) for i, n in enumerate(lengths)]
+    codes = [f"{i:06d}" for i in range(len(series))]
+
+    vectorized = analyze_close_matrix(codes, close_matrix(series, 150), names=codes)
+
+    for code, closes, got in zip(codes, series, vectorized):
+        expected = indicators_from_ohlcv(code, code, pd.DataFrame({"close": closes}))
+        got, expected = asdict(got), asdict(expected)
+        for field, value in expected.items():
+            if isinstance(value, float):
+                # 반올림 경계에서 마지막 자리가 갈릴 수 있음
+                assert got[field] == pytest.approx(value, abs=0.011), (code, field)
+            else:
+                assert got[field] == value, (code, field)
+
+
+def test_short_history_is_none(rng):
+    series = [random_walk(rng, 150), random_walk(rng, MIN_BARS - 1)]
+    results = analyze_close_matrix(["A", "B"], close_matrix(series, 150), names=["A", "B"])
+    assert results[0] is not None and results[1] is None
+
+
+def test_rejects_too_few_days():
+    with pytest.raises(ValueError):
+        compute_indicator_arrays(np.ones((2, MIN_BARS - 1)))
+
+
+def test_cross_flags_match_check_cross():
+    # 하락 후 급반등: 마지막 봉들에서 MA5가 MA20을 상향 돌파
+    closes = np.concatenate([np.linspace(200, 100, 140), [110, 130, 160, 200]])
+    arrays = compute_indicator_arrays(closes[None, :])
+    ma = calculate_moving_averages(pd.DataFrame({"close": closes}))
+    diff = (ma["ma5"] - ma["ma20"]).tail(5).to_numpy()
+    assert bool(arrays["golden_cross"][0]) == bool(((diff[:-1] < 0) & (diff[1:] > 0)).any()) is True
+    assert not arrays["dead_cross"][0]
+
+
+def test_detect_crosses_matches_pandas(rng):
+    series = np.stack([random_walk(rng, 300), random_walk(rng, 300)])
+    pairs = ((5, 20), (20, 60))
+    events = detect_crosses(series, pairs, codes=["A", "B"])
+
+    expected = []
+    for s, code in enumerate(["A", "B"]):
+        close = pd.Series(series[s])
+        for short, long in pairs:
+            diff = (close.rolling(short).mean() - close.rolling(long).mean()).to_numpy()
+            for p in range(1, len(diff)):
+                if diff[p - 1] < 0 < diff[p]:
+                    expected.append((code, p, f"MA{short}/MA{long}", "golden"))
+                elif diff[p - 1] > 0 > diff[p]:
+                    expected.append((code, p, f"MA{short}/MA{long}", "dead"))
+
+    got = [(e["code"], 300 - 1 - e["barsAgo"], e["pair"], e["type"]) for e in events.query()]
+    assert sorted(got) == sorted(expected)
+    assert len(expected) > 0
+
+
+def test_cross_index_filters(rng):
+    events = detect_crosses(random_walk(rng, 300), ((5, 20),), codes=["A"])
+    golden = events.query(kind="golden")
+    assert golden and all(e["type"] == "golden" for e in golden)
+    assert all(e["barsAgo"] < 30 for e in events.query(within=30))
+    assert events.query(code="ZZZ") == []
+    last_golden = min(e["barsAgo"] for e in golden)
+    assert events.bars_since("golden", (5, 20)).tolist() == [last_golden]
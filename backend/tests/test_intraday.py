@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+"""분봉 링 버퍼(MinuteRing)와 저장소(IntradayStore) 링 할당·LRU 제거 테스트"""
+import numpy as np
+
+from analysis.intraday import IntradayStore, MinuteRing
+
+
+def test_get_does_not_allocate():
+    store = IntradayStore(capacity=10)
+    assert store.get("005930") is None
+    assert store.codes() == []
+
+
+def test_rings_are_capped_lru():
+    store = IntradayStore(capacity=10, max_rings=2)
+    store.ring("005930")
+    store.ring("000660")
+    # 최근에 읽은 종목은 남고 가장 오래 안 쓴 종목이 빠짐
+    store.get("005930")
+    store.ring("373220")
+    assert store.codes() == ["005930", "373220"]
+    assert store.evictions == 1
+
+
+def _cols(ts, close):
+    close = np.asarray(close, dtype=float)
+    return np.asarray(ts, dtype=np.int64), {
+        "open": close, "high": close + 1, "low": close - 1, "close": close, "volume": np.ones(len(close)),
+    }
+
+
+def test_extend_overwrites_in_progress_minute():
+    ring = MinuteRing(capacity=5)
+    assert ring.extend(*_cols([202401020900, 202401020901], [100, 101])) == 2
+    # 진행 중인 09:01 봉은 덮어쓰고, 이미 지난 09:00 봉은 무시
+    assert ring.extend(*_cols([202401020900, 202401020901, 202401020902], [99, 102, 103])) == 1
+    cols = ring.arrays()
+    assert cols["ts"].tolist() == [202401020900, 202401020901, 202401020902]
+    assert cols["close"].tolist() == [100, 102, 103]
+    assert len(ring) == 3 and ring.last_ts == 202401020902
+
+
+def test_wraparound_keeps_latest_bars_in_order():
+    ring = MinuteRing(capacity=4)
+    ts = [202401020900 + i for i in range(7)]
+    ring.extend(*_cols(ts[:3], [1, 2, 3]))
+    ring.extend(*_cols(ts[3:], [4, 5, 6, 7]))
+    assert len(ring) == 4
+    cols = ring.arrays()
+    # 가득 차면 가장 오래된 분봉부터 덮어쓰고, arrays()는 항상 오래된 순
+    assert cols["ts"].tolist() == ts[3:]
+    assert cols["close"].tolist() == [4, 5, 6, 7]
+    assert ring.arrays(2)["close"].tolist() == [6, 7]
+    assert ring.arrays(10)["ts"].tolist() == ts[3:]
+    # 꽉 찬 뒤에도 진행 중인 분봉 덮어쓰기는 경계를 넘어 마지막 칸에 적용
+    ring.extend(*_cols([ts[-1]], [8]))
+    assert ring.arrays()["close"].tolist() == [4, 5, 6, 8]
+    assert ring.to_frame()["date"].tolist() == [str(t) for t in ts[3:]]
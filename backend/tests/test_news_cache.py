@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+"""종목 뉴스 캐시(_cached_stock_news) 테스트"""
+import pytest
+
+from analysis import news
+from analysis.cache import TTLCache
+from analysis.news import NewsCrawler, NewsItem
+
+
+@pytest.fixture
+def crawls(monkeypatch):
+    """iter_stock_news 호출 기록. 종목별로 준비된 기사 수만큼만 반환"""
+    available = {}
+    calls = []
+    monkeypatch.setattr(news, "news_cache", TTLCache("news"))
+
+    def fake_iter(self, code, max_pages=news.NEWS_MAX_PAGES, since=None):
+        calls.append(code)
+        return iter([NewsItem(f"{code} 기사 {i}", "한국경제", "", f"u{i}") for i in range(available[code])])
+
+    monkeypatch.setattr(NewsCrawler, "iter_stock_news", fake_iter)
+    return available, calls
+
+
+def test_short_list_is_served_from_cache(crawls):
+    available, calls = crawls
+    available["005930"] = 3
+    crawler = NewsCrawler()
+    assert len(crawler.get_stock_news("005930", limit=10)) == 3
+    # 기사가 3건뿐이었다는 것을 기억하므로 다시 크롤링하지 않음
+    assert len(crawler.get_stock_news("005930", limit=10)) == 3
+    assert crawler.get_stock_news_many(["005930"], limit=10)["005930"][0].title == "005930 기사 0"
+    assert calls == ["005930"]
+
+
+def test_larger_limit_refetches_truncated_list(crawls):
+    available, calls = crawls
+    available["000660"] = 20
+    crawler = NewsCrawler()
+    crawler.get_stock_news("000660", limit=5)
+    assert len(crawler.get_stock_news("000660", limit=3)) == 3
+    # 5건에서 잘랐으므로 10건 요청은 다시 조회
+    assert len(crawler.get_stock_news("000660", limit=10)) == 10
+    assert calls == ["000660", "000660"]
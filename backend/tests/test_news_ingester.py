@@ -0,0 +1,130 @@
+# -*- coding: utf-8 -*-
+"""실시간 속보 증분 수집기(MarketNewsIngester) 중복 제거·중단 조건, /news 라우트 테스트"""
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from analysis import news
+from analysis.news import MarketNewsIngester
+from api.routes import analysis as analysis_routes
+
+
+def _article(article_id: str, office_id: str = "001") -> str:
+    href = f"/news/news_read.naver?article_id={article_id}&office_id={office_id}&mode=LSS2D"
+    return (
+        f'<dd class="articleSubject"><a href="{href}">속보 기사 제목 {article_id} 입니다</a></dd>'
+        f'<dd class="articleSummary">요약<span class="press">한국경제</span>|'
+        f'<span class="wdate">2024-01-02 09:30</span></dd>'
+    )
+
+
+def _page(*article_ids: str) -> str:
+    body = "".join(_article(a) for a in article_ids)
+    return f"<html><body><ul class='realtimeNewsList'><li><dl>{body}</dl></li></ul></body></html>"
+
+
+class FakeResponse:
+    def __init__(self, text):
+        self.text = text
+
+    def raise_for_status(self):
+        pass
+
+
+@pytest.fixture
+def pages(monkeypatch):
+    """ingest가 받을 페이지 목록 (호출마다 앞에서 하나씩)"""
+    queue = []
+    archived = []
+    monkeypatch.setattr(news.http_client, "get", lambda *a, **kw: FakeResponse(queue.pop(0)))
+    monkeypatch.setattr(news, "_archive", lambda items, code=None: archived.append(list(items)))
+    return queue, archived
+
+
+def _ids(items):
+    return [item.url.rsplit("/", 1)[-1] for item in items]
+
+
+def test_first_page_dedupes_thumbnail_links(pages):
+    queue, archived = pages
+    queue.append(_page("3", "3", "2", "1"))
+    ingester = MarketNewsIngester()
+    assert ingester.ingest() == 3
+    assert _ids(ingester.headlines()) == ["3", "2", "1"]
+    assert _ids(archived[0]) == ["3", "2", "1"]
+
+
+def test_stops_at_previously_indexed_article(pages):
+    queue, archived = pages
+    queue.extend([_page("2", "1"), _page("4", "3", "2", "99")])
+    ingester = MarketNewsIngester()
+    ingester.ingest()
+    # 최신순이므로 색인된 "2" 이후("99")는 읽지 않음
+    assert ingester.ingest() == 2
+    assert _ids(ingester.headlines()) == ["4", "3", "2", "1"]
+    assert _ids(archived[-1]) == ["4", "3"]
+
+
+def test_duplicate_within_page_does_not_stop(pages):
+    queue, _ = pages
+    queue.extend([_page("1"), _page("5", "5", "4", "3", "1")])
+    ingester = MarketNewsIngester()
+    ingester.ingest()
+    # 같은 페이지 안 중복 "5"에서 멈추면 "4", "3"을 잃음
+    assert ingester.ingest() == 3
+    assert _ids(ingester.headlines()) == ["5", "4", "3", "1"]
+
+
+def test_unchanged_page_adds_nothing(pages):
+    queue, _ = pages
+    queue.extend([_page("2", "1"), _page("2", "1")])
+    ingester = MarketNewsIngester()
+    ingester.ingest()
+    assert ingester.ingest() == 0
+    assert len(ingester) == 2
+
+
+def test_seen_index_is_bounded(pages):
+    queue, _ = pages
+    ingester = MarketNewsIngester(ring_size=2)
+    ingester._seen_size = 3
+    queue.extend([_page("3", "2", "1"), _page("6", "5", "4")])
+    ingester.ingest()
+    ingester.ingest()
+    assert len(ingester._seen) == 3
+    assert _ids(ingester.headlines()) == ["6", "5"]
+
+
+def test_refresh_reads_ring_within_interval(pages, clock):
+    queue, _ = pages
+    queue.extend([_page("2", "1"), _page("3", "2", "1")])
+    ingester = MarketNewsIngester()
+    assert ingester.refresh(min_interval=60) == 2
+    # 간격 안에서는 목록을 다시 받지 않음
+    clock.now += 30
+    assert ingester.refresh(min_interval=60) == 0
+    assert len(queue) == 1
+    clock.now += 30
+    assert ingester.refresh(min_interval=60) == 1
+    assert _ids(ingester.headlines()) == ["3", "2", "1"]
+
+
+def test_route_reads_ring_and_reports_ingest_age(pages, clock, monkeypatch):
+    queue, _ = pages
+    ingester = MarketNewsIngester()
+    monkeypatch.setattr(news, "market_news_ingester", ingester)
+    monkeypatch.setattr(analysis_routes, "market_news_ingester", ingester)
+    queue.extend([_page("2", "1"), _page("3", "2", "1")])
+
+    rows = asyncio.run(analysis_routes.get_news())
+    assert _ids(SimpleNamespace(**r) for r in rows) == ["2", "1"]
+    assert rows[0]["ageSeconds"] == 0.0
+    # 수집 간격 안에서는 링을 그대로 읽고, 나이는 마지막 수집 기준
+    clock.now += 30
+    rows = asyncio.run(analysis_routes.get_news())
+    assert len(rows) == 2 and rows[0]["ageSeconds"] == 30.0
+    clock.now += news.NEWS_INGEST_INTERVAL
+    rows = asyncio.run(analysis_routes.get_news())
+    assert _ids(SimpleNamespace(**r) for r in rows) == ["3", "2", "1"]
+    assert rows[0]["ageSeconds"] == 0.0 and queue == []
@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+"""뉴스 여러 페이지 조회(_walk_pages, iter_stock_news, iter_market_news) 테스트"""
+from datetime import datetime
+from itertools import islice
+
+import pytest
+
+from analysis import news
+from analysis.news import NewsCrawler, NewsItem
+
+
+def _item(article_id, published):
+    return ("001", article_id), NewsItem(f"기사 {article_id}", "연합뉴스", published[-5:], f"u{article_id}", published=published)
+
+
+# 페이지 번호 -> (기사 키, NewsItem) 목록. 3페이지 이후는 마지막 페이지(3) 반복
+PAGES = {
+    1: [_item("10", "2024-01-02 15:00"), _item("9", "2024-01-02 14:00"), _item("8", "2024-01-02 13:00")],
+    # 첫 기사는 1페이지에 이미 나온 기사 (새 기사가 올라와 밀려남)
+    2: [_item("8", "2024-01-02 13:00"), _item("7", "2024-01-02 12:00"), _item("6", "2024-01-02 11:00")],
+    3: [_item("5", "2024-01-01 10:00")],
+}
+
+
+@pytest.fixture
+def site(monkeypatch):
+    """요청한 페이지와 아카이브에 저장한 기사 기록"""
+    fetched, archived = [], []
+
+    def fake_archive(items, code=None):
+        if items:
+            archived.append((code, [i.url for i in items]))
+
+    monkeypatch.setattr(news, "_archive", fake_archive)
+
+    def fake_get_page(self, url, params):
+        fetched.append((url, params))
+        return str(min(params["page"], 3))
+
+    monkeypatch.setattr(NewsCrawler, "_get_page", fake_get_page)
+    parse = lambda html: iter(PAGES[int(html)])
+    monkeypatch.setattr(news, "_iter_stock_page", parse)
+    monkeypatch.setattr(news, "_iter_market_page", parse)
+    return fetched, archived
+
+
+def test_dedupes_across_pages_and_stops_on_repeated_last_page(site):
+    fetched, archived = site
+    items = list(NewsCrawler().iter_stock_news("005930", max_pages=10))
+    assert [i.url for i in items] == ["u10", "u9", "u8", "u7", "u6", "u5"]
+    # 4페이지는 3페이지 반복이라 새 기사가 없으므로 거기서 중단
+    assert [p["page"] for _, p in fetched] == [1, 2, 3, 4]
+    assert all(url == news.STOCK_NEWS_URL and p["code"] == "005930" for url, p in fetched)
+    assert archived == [("005930", ["u10", "u9", "u8"]), ("005930", ["u7", "u6"]), ("005930", ["u5"])]
+
+
+def test_since_cutoff_stops_before_older_articles(site):
+    fetched, archived = site
+    items = list(NewsCrawler().iter_market_news(since=datetime(2024, 1, 2, 11, 30)))
+    assert [i.url for i in items] == ["u10", "u9", "u8", "u7"]
+    assert [p for _, p in fetched] == [{"page": 1}, {"page": 2}]
+    assert archived == [(None, ["u10", "u9", "u8"]), (None, ["u7"])]
+
+
+def test_max_pages_limits_requests(site):
+    fetched, _ = site
+    items = list(NewsCrawler().iter_market_news(max_pages=2))
+    assert [i.url for i in items] == ["u10", "u9", "u8", "u7", "u6"]
+    assert len(fetched) == 2
+
+
+def test_next_page_fetched_lazily(site):
+    fetched, archived = site
+    items = list(islice(NewsCrawler().iter_stock_news("005930"), 2))
+    assert [i.url for i in items] == ["u10", "u9"]
+    assert len(fetched) == 1
+    # 중간에 멈춰도 반환한 기사는 아카이브에 저장
+    assert archived == [("005930", ["u10", "u9"])]
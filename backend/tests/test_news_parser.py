@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+"""뉴스 목록 lxml 파서 vs BeautifulSoup 파서 비교 (benchmarks/fixtures 페이지)"""
+import os
+
+import pytest
+from bs4 import BeautifulSoup
+
+from analysis.news import (
+    _iter_market_page,
+    _iter_market_page_soup,
+    _iter_stock_page,
+    _iter_stock_page_soup,
+)
+from analysis.news_parser import parse_market_links
+
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "benchmarks", "fixtures")
+
+
+def _read(name):
+    with open(os.path.join(FIXTURES, name), "r", encoding="utf-8") as f:
+        return f.read()
+
+
+def _articles(items):
+    return [(key, item.title, item.url) for key, item in items]
+
+
+def test_stock_page_matches_soup_parser():
+    html = _read("news_stock_005930.html")
+    fast, soup = list(_iter_stock_page(html)), list(_iter_stock_page_soup(html))
+    assert len(fast) > 10
+    assert fast == soup
+
+
+def test_market_page_same_articles_as_soup_parser():
+    html = _read("news_market_lss2d.html")
+    fast, soup = list(_iter_market_page(html)), list(_iter_market_page_soup(html))
+    assert len(fast) > 10
+    assert _articles(fast) == _articles(soup)
+
+
+def test_market_page_metadata_from_own_summary():
+    """한 li에 기사 여러 건이 있으면 soup 파서는 첫 기사의 시각·언론사를 모두에 붙이지만 lxml 파서는 기사마다 읽음"""
+    html = _read("news_market_lss2d.html")
+    expected = []
+    for summary in BeautifulSoup(html, "lxml").select("dd.articleSummary"):
+        press, wdate = summary.select_one("span.press"), summary.select_one("span.wdate")
+        expected.append((press.get_text(strip=True), wdate.get_text(strip=True)))
+
+    fast = [item for _, item in _iter_market_page(html)]
+    assert [(i.source, i.published) for i in fast] == expected
+    assert all(i.time == i.published[-5:] for i in fast)
+
+    soup = [item for _, item in _iter_market_page_soup(html)]
+    assert (soup[1].source, soup[1].published) == (soup[0].source, soup[0].published)
+    assert (fast[1].source, fast[1].published) != (fast[0].source, fast[0].published)
+
+
+def test_market_links_without_summary_use_enclosing_li():
+    html = (
+        "<ul><li><a href='/news/news_read.naver?article_id=1&office_id=009'>요약 없는 형식의 기사 제목</a>"
+        " <span>매일경제 | 2024-01-02 09:30</span></li>"
+        "<li><a href='/news/news_read.naver?article_id=2&office_id=009'>짧은제목</a></li></ul>"
+    )
+    links = list(parse_market_links(html))
+    assert len(links) == 1
+    assert "매일경제 | 2024-01-02 09:30" in links[0][2]
+    (key, item), = _iter_market_page(html)
+    assert key == ("009", "1")
+    assert (item.source, item.published) == ("매일경제", "2024-01-02 09:30")
+
+
+@pytest.mark.parametrize("parse", [_iter_market_page, _iter_stock_page])
+def test_empty_page_falls_back_to_soup(parse):
+    assert list(parse("")) == []
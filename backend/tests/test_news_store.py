@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+"""뉴스 아카이브(NewsStore) 저장·색인 동기화·검색·정리 테스트"""
+import sqlite3
+from datetime import datetime, timedelta
+
+import pytest
+
+from analysis.cache import KST
+from analysis.news import NewsItem
+from analysis.news_store import NewsStore, fts_query
+
+
+def _item(n: int, title: str, published: str = "2024-01-02 09:30", summary: str = "") -> NewsItem:
+    return NewsItem(title, "한국경제", "09:30", f"https://n.news/{n}", summary=summary, published=published)
+
+
+def _titles(items):
+    return [n.title for n in items]
+
+
+@pytest.fixture
+def store():
+    return NewsStore(":memory:", retention_days=100000)
+
+
+def test_add_skips_duplicates_and_fills_summary(store):
+    assert store.add([_item(1, "SK하이닉스 HBM 호조"), _item(1, "SK하이닉스 HBM 호조")]) == 1
+    assert store.add([_item(1, "SK하이닉스 HBM 호조")]) == 0
+    # 요약이 새로 생긴 경우만 갱신하고 FTS 색인도 트리거로 따라감
+    assert store.add([_item(1, "SK하이닉스 HBM 호조", summary="메모리 업황 개선")]) == 1
+    assert store.add([_item(1, "SK하이닉스 HBM 호조", summary="다른 요약")]) == 0
+    assert len(store) == 1
+    assert _titles(store.search("업황")) == ["SK하이닉스 HBM 호조"]
+    assert store.search("다른 요약") == []
+
+
+def test_korean_substring_search(store):
+    store.add([
+        _item(1, "SK하이닉스 HBM 호조"),
+        _item(2, "삼성전자가 반도체 투자 확대", published="2024-01-02 10:00"),
+        _item(3, "코스피 약보합 마감"),
+    ])
+    assert _titles(store.search("하이닉스")) == ["SK하이닉스 HBM 호조"]
+    assert _titles(store.search("삼성전자")) == ["삼성전자가 반도체 투자 확대"]
+    # 2글자 단어(LIKE)와 3글자 이상 단어(FTS)는 모두 만족해야 함
+    assert _titles(store.search("삼성 반도체")) == ["삼성전자가 반도체 투자 확대"]
+    assert store.search("삼성 하이닉스") == []
+    assert _titles(store.search("hbm")) == ["SK하이닉스 HBM 호조"]
+
+
+def test_code_since_and_match_any_filters(store):
+    store.add([_item(1, "SK하이닉스 HBM 호조", published="2024-01-01 09:00")], code="000660")
+    store.add([_item(2, "하이닉스 목표가 상향", published="2024-01-03 09:00")])
+    store.add([_item(3, "코스피 약보합 마감", published="2024-01-03 15:40")], code="000660")
+
+    assert _titles(store.search(code="000660")) == ["코스피 약보합 마감", "SK하이닉스 HBM 호조"]
+    assert _titles(store.search("하이닉스", code="000660")) == ["SK하이닉스 HBM 호조"]
+    assert len(store.search("하이닉스", code="000660", match_any=True)) == 3
+    assert _titles(store.search(code="000660", since="2024-01-02")) == ["코스피 약보합 마감"]
+    assert _titles(store.search(since="2024-01-03 10:00")) == ["코스피 약보합 마감"]
+    assert len(store.search(limit=2)) == 2
+
+
+def test_prune_removes_old_articles_from_index(store):
+    now = datetime.now(KST)
+    old = (now - timedelta(days=10)).strftime("%Y-%m-%d %H:%M")
+    recent = now.strftime("%Y-%m-%d %H:%M")
+    store.add([_item(1, "오래된 하이닉스 기사", published=old)], code="000660")
+    store.add([_item(2, "최근 하이닉스 기사", published=recent)])
+    assert store.prune(retention_days=5) == 1
+    assert _titles(store.search("하이닉스")) == ["최근 하이닉스 기사"]
+    assert store.search(code="000660") == []
+
+
+def test_unicode61_index_is_rebuilt_as_trigram(tmp_path):
+    path = str(tmp_path / "news.sqlite3")
+    conn = sqlite3.connect(path)
+    conn.execute("""CREATE TABLE news (id INTEGER PRIMARY KEY, url TEXT NOT NULL UNIQUE, title TEXT NOT NULL,
+                    source TEXT NOT NULL, time TEXT NOT NULL, summary TEXT NOT NULL DEFAULT '',
+                    published TEXT NOT NULL, fetched_at REAL NOT NULL)""")
+    conn.execute("""CREATE VIRTUAL TABLE news_fts USING fts5(title, summary, content='news', content_rowid='id',
+                    tokenize='unicode61', prefix='2 3')""")
+    conn.execute("INSERT INTO news VALUES (1, 'u', 'SK하이닉스 HBM 호조', 's', '09:30', '', '2024-01-02 09:30', 0)")
+    conn.execute("INSERT INTO news_fts (rowid, title, summary) VALUES (1, 'SK하이닉스 HBM 호조', '')")
+    conn.commit()
+    conn.close()
+    assert _titles(NewsStore(path).search("하이닉스")) == ["SK하이닉스 HBM 호조"]
+
+
+def test_fts_query_keeps_long_terms():
+    assert fts_query("SK 하이닉스, HBM") == '"하이닉스" AND "HBM"'
+    assert fts_query("!!") == ""
@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+"""로컬 일봉 저장소(OHLCVStore)와 get_stock_ohlcv 증분 동기화 테스트"""
+from datetime import datetime
+
+import pandas as pd
+import pytest
+
+from analysis import technical
+from analysis.ohlcv_store import OHLCVStore
+
+
+def _bars(start: datetime, end: datetime, close: float = 100.0) -> pd.DataFrame:
+    dates = pd.bdate_range(start.date(), end.date()).strftime("%Y%m%d")
+    return pd.DataFrame({"date": dates, "open": close, "high": close, "low": close, "close": close, "volume": 10.0})
+
+
+@pytest.fixture
+def store(monkeypatch):
+    store = OHLCVStore(":memory:")
+    monkeypatch.setattr(technical, "get_ohlcv_store", lambda: store)
+    return store
+
+
+@pytest.fixture
+def fetches(monkeypatch):
+    """_fetch_ohlcv 호출 기록 ((시작일, 종료일) YYYYMMDD), 요청 구간의 평일 봉을 반환"""
+    calls = []
+
+    def fake_fetch(code, start_date, end_date):
+        calls.append((start_date.strftime("%Y%m%d"), end_date.strftime("%Y%m%d")))
+        return _bars(start_date, end_date)
+
+    monkeypatch.setattr(technical, "_fetch_ohlcv", fake_fetch)
+    return calls
+
+
+def test_upsert_keeps_earliest_start_date():
+    store = OHLCVStore(":memory:")
+    store.upsert("005930", _bars(datetime(2024, 1, 2), datetime(2024, 1, 5)), "20240102")
+    store.upsert("005930", _bars(datetime(2024, 1, 4), datetime(2024, 1, 8), close=101.0), "20240104")
+    assert store.sync_state("005930")[0] == "20240102"
+    # 같은 날짜 봉은 덮어씀
+    assert store.last_bar("005930") == ("20240108", 101.0)
+    assert store.load("005930", "20240101", 100)["date"].tolist() == [
+        "20240102", "20240103", "20240104", "20240105", "20240108",
+    ]
+    assert store.load("005930", "20240101", 2)["date"].tolist() == ["20240105", "20240108"]
+
+
+def test_missing_columns_are_filled():
+    store = OHLCVStore(":memory:")
+    df = pd.DataFrame({"date": ["20240102", "20240103"], "close": [100.0, None]})
+    store.upsert("005930", df, "20240102")
+    loaded = store.load("005930", "20240101", 10)
+    assert loaded.to_dict("records") == [
+        {"date": "20240102", "open": 100.0, "high": 100.0, "low": 100.0, "close": 100.0, "volume": 0.0}
+    ]
+
+
+def test_first_call_fetches_range_then_serves_locally(store, fetches):
+    df = technical.get_stock_ohlcv("005930", days=60)
+    _, start = technical._ohlcv_range(60)
+    assert fetches == [(start.strftime("%Y%m%d"), datetime.now().strftime("%Y%m%d"))]
+    assert store.sync_state("005930")[0] == start.strftime("%Y%m%d")
+    assert len(df) <= 60 and df["date"].is_monotonic_increasing
+
+    # 시세 TTL 안에서는 네트워크 없이 응답
+    technical.get_stock_ohlcv("005930", days=60)
+    assert len(fetches) == 1
+
+
+def test_expired_sync_refetches_from_last_bar(store, fetches, monkeypatch):
+    _, start = technical._ohlcv_range(60)
+    # 며칠 전 봉까지만 있는 상태 (빈 구간은 마지막 봉부터 다시 받아 채움)
+    store.upsert("005930", _bars(start, start + pd.Timedelta(days=20)), start.strftime("%Y%m%d"))
+    last = store.last_bar("005930")[0]
+    monkeypatch.setattr(technical, "quote_ttl", lambda: 0.0)
+    df = technical.get_stock_ohlcv("005930", days=60)
+    assert fetches == [(last, datetime.now().strftime("%Y%m%d"))]
+    assert df["date"].iloc[-1] == store.last_bar("005930")[0] > last
+
+
+def test_longer_history_refetches_from_new_start(store, fetches):
+    technical.get_stock_ohlcv("005930", days=30)
+    technical.get_stock_ohlcv("005930", days=120)
+    _, start = technical._ohlcv_range(120)
+    assert fetches[-1][0] == start.strftime("%Y%m%d")
+    assert store.sync_state("005930")[0] == start.strftime("%Y%m%d")
+
+
+def test_failed_fetch_serves_stored_bars(store, fetches, monkeypatch):
+    technical.get_stock_ohlcv("005930", days=60)
+    monkeypatch.setattr(technical, "quote_ttl", lambda: 0.0)
+    monkeypatch.setattr(technical, "_fetch_ohlcv", lambda *a: None)
+    assert technical.get_stock_ohlcv("005930", days=60) is not None
+    # 저장된 적 없는 종목은 None
+    assert technical.get_stock_ohlcv("000660", days=60) is None
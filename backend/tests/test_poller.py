@@ -0,0 +1,43 @@
+# -*- coding: utf-8 -*-
+"""시세판(QuoteBoard) 데이터 나이와 폴러 지수 병합 테스트"""
+from analysis import poller
+from analysis.crawler import IndexData
+from analysis.poller import MarketPoller, QuoteBoard, _merge_indices
+
+
+def test_failed_item_keeps_previous_fetch_time():
+    prev = _merge_indices(None, [IndexData("금", 2000.0, 1.0, 0.1), IndexData("은", 0.0, 0.0, 0.0)], now=100.0)
+    assert [at for _, at in prev] == [100.0, 0.0]
+    merged = _merge_indices(prev, [IndexData("금", 0.0, 0.0, 0.0), IndexData("은", 25.0, 0.1, 0.4)], now=200.0)
+    assert [(idx.value, at) for idx, at in merged] == [(2000.0, 100.0), (25.0, 200.0)]
+
+
+def test_group_is_stamped_with_oldest_item(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(poller.time, "time", lambda: now[0])
+    board = QuoteBoard()
+    p = MarketPoller(board)
+    p._put_group("indices", [IndexData("코스피", 2500.0, 0, 0), IndexData("코스닥", 800.0, 0, 0)])
+    now[0] += 60
+    # 코스닥 조회 실패 -> 직전 값 유지, 그룹 조회 시각은 코스닥의 1000초
+    p._put_group("indices", [IndexData("코스피", 2510.0, 0, 0), IndexData("코스닥", 0.0, 0, 0)])
+    values, fetched_at = board.get("indices")
+    assert [i.value for i in values] == [2510.0, 800.0]
+    assert fetched_at == 1000.0
+
+
+def test_group_without_any_success_is_not_put():
+    board = QuoteBoard()
+    MarketPoller(board)._put_group("indices", [IndexData("코스피", 0.0, 0, 0)])
+    assert board.get("indices") is None
+
+
+def test_get_fresh_rejects_old_data(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(poller.time, "time", lambda: now[0])
+    board = QuoteBoard()
+    board.put("btc", "v", fetched_at=900.0)
+    assert board.get_fresh("btc", max_age=100) == ("v", 900.0)
+    now[0] += 1
+    assert board.get_fresh("btc", max_age=100) is None
+    assert board.get("btc") == ("v", 900.0)
@@ -0,0 +1,131 @@
+# -*- coding: utf-8 -*-
+"""토큰 버킷·서킷 브레이커 상태 전이 테스트"""
+import pytest
+import requests
+
+from analysis import ratelimit
+from analysis.ratelimit import (
+    CircuitBreaker,
+    CircuitOpenError,
+    HostGuard,
+    RateLimitTimeout,
+    TokenBucket,
+    _parse_host_limits,
+)
+
+
+def test_bucket_allows_burst_then_waits(clock):
+    bucket = TokenBucket(rate=2, burst=3)
+    assert [bucket.acquire() for _ in range(3)] == [0.0, 0.0, 0.0]
+    assert bucket.acquire() == pytest.approx(0.5)
+    assert clock.slept == [pytest.approx(0.5)]
+    assert bucket.waited == pytest.approx(0.5)
+
+
+def test_bucket_refills_up_to_burst(clock):
+    bucket = TokenBucket(rate=2, burst=3)
+    for _ in range(3):
+        bucket.acquire()
+    clock.now += 60
+    # 오래 쉬어도 burst개까지만 쌓임
+    assert [bucket.acquire() for _ in range(3)] == [0.0, 0.0, 0.0]
+    assert bucket.acquire() > 0
+
+
+def test_breaker_opens_after_threshold(clock):
+    breaker = CircuitBreaker(failure_threshold=3, reset_timeout=30)
+    for _ in range(2):
+        breaker.record_failure()
+    assert breaker.state == "closed" and breaker.allow()
+    breaker.record_failure()
+    assert breaker.state == "open"
+    assert not breaker.allow()
+    assert breaker.short_circuited == 1
+
+
+def test_success_resets_failure_count(clock):
+    breaker = CircuitBreaker(failure_threshold=3, reset_timeout=30)
+    breaker.record_failure()
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+    assert breaker.state == "closed"
+
+
+def test_half_open_allows_single_trial(clock):
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=30)
+    breaker.record_failure()
+    clock.now += 30
+    assert breaker.state == "half-open"
+    assert breaker.allow()
+    assert not breaker.allow()
+
+    # 시험 요청 성공 -> closed
+    breaker.record_success()
+    assert breaker.state == "closed" and breaker.allow()
+
+
+def test_failed_trial_reopens(clock):
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=30)
+    breaker.record_failure()
+    clock.now += 30
+    assert breaker.allow()
+    breaker.record_failure()
+    assert breaker.state == "open"
+    clock.now += 30
+    assert breaker.allow()
+
+
+def test_guard_raises_when_open(clock, monkeypatch):
+    monkeypatch.setattr(ratelimit, "CIRCUIT_FAILURE_THRESHOLD", 2)
+    guard = HostGuard("example.com")
+    guard.before_request()
+    guard.breaker.record_failure()
+    guard.breaker.record_failure()
+    with pytest.raises(CircuitOpenError):
+        guard.before_request()
+    assert guard.stats()["circuit"] == "open"
+
+
+def test_parse_host_limits():
+    limits = _parse_host_limits("a.com=0.5:2, b.com=3,broken,c.com=x:1")
+    assert limits == {"a.com": (0.5, 2), "b.com": (3.0, ratelimit.HTTP_RATE_BURST)}
+
+
+def test_bucket_max_wait_does_not_reserve(clock):
+    bucket = TokenBucket(rate=2, burst=1)
+    assert bucket.acquire() == 0.0
+    assert bucket.acquire(max_wait=0.1) is None
+    assert clock.slept == []
+    # 거절된 호출은 토큰을 예약하지 않으므로 다음 대기는 0.5초 그대로
+    assert bucket.acquire(max_wait=0.5) == pytest.approx(0.5)
+
+
+def test_guard_rate_limit_timeout_releases_trial(clock, monkeypatch):
+    monkeypatch.setattr(ratelimit, "CIRCUIT_FAILURE_THRESHOLD", 1)
+    monkeypatch.setattr(ratelimit, "HTTP_RATE_BURST", 1)
+    guard = HostGuard("example.com")
+    guard.before_request()
+    guard.breaker.record_failure()
+    clock.now += ratelimit.CIRCUIT_RESET_TIMEOUT
+    # 토큰은 채워졌지만 다시 비운 뒤 시험 요청이 마감 안에 토큰을 못 받는 경우
+    guard.bucket.acquire()
+    with pytest.raises(RateLimitTimeout):
+        guard.before_request(max_wait=0.0)
+    assert guard.breaker.failures == 1
+    assert guard.breaker.allow()
+
+
+def test_deadline_expiry_is_not_a_host_failure(monkeypatch):
+    from analysis import http_client
+
+    guard = HostGuard("deadline.test")
+    monkeypatch.setattr(http_client, "guard_for", lambda host: guard)
+    sent = []
+    monkeypatch.setattr(http_client, "session_for", lambda url: sent.append(url))
+    for _ in range(ratelimit.CIRCUIT_FAILURE_THRESHOLD + 1):
+        with pytest.raises(requests.Timeout):
+            http_client._run_until(lambda: http_client.get("https://deadline.test/x", coalesce=False), 0.0)
+    assert sent == []
+    assert guard.breaker.failures == 0 and guard.breaker.state == "closed"
+    assert guard.bucket.burst - guard.bucket._tokens < 1
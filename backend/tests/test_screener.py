@@ -0,0 +1,145 @@
+# -*- coding: utf-8 -*-
+"""스크리너 마스크·정렬·페이지 및 스냅샷 생성 테스트"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from analysis import screener
+from analysis.ohlcv_store import OHLCVStore
+from analysis.screener import ScreenSnapshot, build_snapshot, screen
+from analysis.symbols import SymbolInfo, SymbolMaster
+from conftest import random_walk
+
+NAN = np.nan
+
+
+def _snapshot() -> ScreenSnapshot:
+    rows = [
+        # code, market, price, rsi, bb_upper, bb_lower, golden, dead, golden_ago, dead_ago, ma_status
+        ("000001", "KOSPI", 100.0, 25.0, 110.0, 90.0, True, False, 2, -1, "정배열"),
+        ("000002", "KOSPI", 120.0, 75.0, 115.0, 95.0, False, False, 12, 30, "정배열"),
+        ("000003", "KOSDAQ", 80.0, NAN, 100.0, 85.0, False, True, -1, 1, "역배열"),
+        ("000004", "KOSDAQ", 95.0, 30.0, 105.0, 90.0, True, False, 4, 40, "혼조"),
+        ("000005", "KOSPI", 50.0, 45.0, 60.0, 40.0, False, False, -1, -1, "혼조"),
+    ]
+    code, market, price, rsi, upper, lower, golden, dead, golden_ago, dead_ago, ma_status = map(list, zip(*rows))
+    price = np.array(price)
+    nan = np.full(len(rows), NAN)
+    columns = {
+        "code": np.array(code, dtype=object),
+        "name": np.array([f"종목{c[-1]}" for c in code], dtype=object),
+        "market": np.array(market, dtype=object),
+        "sector": np.array([""] * len(rows), dtype=object),
+        "as_of": np.array(["20240102"] * len(rows), dtype=object),
+        "price": price,
+        "rsi": np.array(rsi),
+        "bb_upper": np.array(upper),
+        "bb_middle": (np.array(upper) + np.array(lower)) / 2,
+        "bb_lower": np.array(lower),
+        "bb_width": np.array([20.0, 19.0, 16.0, 15.0, NAN]),
+        "ma5": nan, "ma20": nan, "ma60": nan, "ma120": nan,
+        "ma20_gap": nan,
+        "ma_status": np.array(ma_status, dtype=object),
+        "golden_cross": np.array(golden),
+        "dead_cross": np.array(dead),
+        "golden_bars_ago": np.array(golden_ago),
+        "dead_bars_ago": np.array(dead_ago),
+    }
+    return ScreenSnapshot(columns, built_at=0.0, elapsed_ms=0.0)
+
+
+def _codes(result):
+    return [r["code"] for r in result["items"]]
+
+
+@pytest.mark.parametrize("kwargs, expected", [
+    ({}, ["000001", "000002", "000003", "000004", "000005"]),
+    # rsi_min 이상, rsi_max 미만. NaN은 어느 조건에도 걸리지 않음
+    ({"rsi_max": 30}, ["000001"]),
+    ({"rsi_min": 30}, ["000002", "000004", "000005"]),
+    ({"rsi_max": 30, "golden_cross": True}, ["000001"]),
+    ({"dead_cross": True}, ["000003"]),
+    ({"golden_within": 5}, ["000001", "000004"]),
+    ({"dead_within": 30}, ["000003"]),
+    ({"bb": "above_upper"}, ["000002"]),
+    ({"bb": "below_lower"}, ["000003"]),
+    ({"bb": "inside"}, ["000001", "000004", "000005"]),
+    ({"market": "kosdaq"}, ["000003", "000004"]),
+    ({"ma_status": "혼조"}, ["000004", "000005"]),
+    ({"price_min": 90, "price_max": 100}, ["000001", "000004"]),
+])
+def test_masks(kwargs, expected):
+    assert _codes(screen(_snapshot(), **kwargs)) == expected
+
+
+def test_sort_puts_nan_last_in_both_directions():
+    snap = _snapshot()
+    assert _codes(screen(snap, sort="rsi")) == ["000001", "000004", "000005", "000002", "000003"]
+    assert _codes(screen(snap, sort="rsi", desc=True)) == ["000002", "000005", "000004", "000001", "000003"]
+    assert _codes(screen(snap, sort="bbWidth", desc=True))[-1] == "000005"
+    assert _codes(screen(snap, sort="code", desc=True))[0] == "000005"
+
+
+def test_pagination():
+    snap = _snapshot()
+    first = screen(snap, sort="price", page=1, page_size=2)
+    second = screen(snap, sort="price", page=2, page_size=2)
+    last = screen(snap, sort="price", page=3, page_size=2)
+    assert first["total"] == second["total"] == 5 and first["universe"] == 5
+    assert _codes(first) + _codes(second) + _codes(last) == ["000005", "000003", "000004", "000001", "000002"]
+    assert screen(snap, page=4, page_size=2)["items"] == []
+
+
+def test_row_fields():
+    row = screen(_snapshot(), rsi_max=30)["items"][0]
+    assert row["asOf"] == "20240102" and row["goldenBarsAgo"] == 2 and row["ma20"] is None
+    assert screen(_snapshot(), market="KOSDAQ", sort="rsi", desc=True)["items"][-1]["rsi"] is None
+
+
+@pytest.mark.parametrize("kwargs", [{"bb": "upper"}, {"sort": "volume"}])
+def test_invalid_arguments(kwargs):
+    with pytest.raises(ValueError):
+        screen(_snapshot(), **kwargs)
+
+
+def test_build_snapshot_skips_stale_and_other_markets(monkeypatch, rng):
+    dates = pd.bdate_range("2023-06-01", periods=150).strftime("%Y%m%d").tolist()
+    store = OHLCVStore(":memory:")
+
+    def put(code, bar_dates):
+        closes = random_walk(rng, len(bar_dates))
+        df = pd.DataFrame({"date": bar_dates, "open": closes, "high": closes, "low": closes,
+                           "close": closes, "volume": 1.0})
+        store.upsert(code, df, bar_dates[0])
+
+    put("000001", dates)           # 최신
+    put("000002", dates[:-1])      # 당일 봉만 아직 없음 -> 포함
+    put("000003", dates[:-5])      # 거래정지 -> 제외
+    put("000004", dates)           # ETF -> 제외
+    put("000005", dates[-60:])     # 봉 부족 -> 제외
+    master = SymbolMaster([
+        SymbolInfo("000001", "가", "KOSPI"),
+        SymbolInfo("000002", "나", "KOSDAQ"),
+        SymbolInfo("000003", "다", "KOSPI"),
+        SymbolInfo("000004", "라", "ETF"),
+        SymbolInfo("000005", "마", "KOSPI"),
+    ])
+    monkeypatch.setattr(screener, "get_ohlcv_store", lambda: store)
+    monkeypatch.setattr(screener, "get_symbol_master", lambda: master)
+
+    snap = build_snapshot()
+    assert snap.columns["code"].tolist() == ["000001", "000002"]
+    assert snap.columns["as_of"].tolist() == [dates[-1], dates[-2]]
+    assert snap.coverage == {"universe": 4, "covered": 2, "stale": 1}
+    assert screen(snap)["coverage"] == snap.coverage
+
+
+def test_stale_cutoff_allows_one_missing_day():
+    dates = pd.bdate_range("2024-01-01", periods=5).strftime("%Y%m%d").tolist()
+    store = OHLCVStore(":memory:")
+    for code, bar_dates in [("000001", dates), ("000002", dates[:3])]:
+        df = pd.DataFrame({"date": bar_dates, "open": 1.0, "high": 1.0, "low": 1.0, "close": 1.0, "volume": 1.0})
+        store.upsert(code, df, bar_dates[0])
+    # 가장 최근 봉을 가진 종목의 직전 거래일까지 허용
+    assert screener._stale_cutoff(store, store.last_dates()) == dates[-2]
+    assert screener._stale_cutoff(store, {}) == ""
@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+"""SingleFlight 요청 병합 테스트"""
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from analysis.singleflight import SingleFlight, WaitTimeout
+
+
+def _wait_shared(group, n, timeout=5.0):
+    """리더 외 호출 n개가 진행 중인 호출에 붙을 때까지 대기"""
+    deadline = time.monotonic() + timeout
+    while group.stats()["shared"] < n:
+        assert time.monotonic() < deadline, "callers did not join the in-flight call"
+        time.sleep(0.001)
+
+
+def _wait_executed(group, n, timeout=5.0):
+    """리더 호출 n개가 시작될 때까지 대기"""
+    deadline = time.monotonic() + timeout
+    while group.stats()["executed"] < n:
+        assert time.monotonic() < deadline, "leader did not start"
+        time.sleep(0.001)
+
+
+def test_concurrent_calls_share_one_result():
+    group = SingleFlight()
+    release = threading.Event()
+    calls = []
+
+    def fn():
+        calls.append(1)
+        release.wait(5)
+        return {"value": 42}
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        futures = [pool.submit(group.do, "k", fn) for _ in range(8)]
+        _wait_shared(group, 7)
+        release.set()
+        results = [f.result(5) for f in futures]
+
+    assert len(calls) == 1
+    assert all(r is results[0] for r in results)
+    assert group.stats() == {"executed": 1, "shared": 7, "inFlight": 0}
+
+
+def test_error_is_shared_and_key_released():
+    group = SingleFlight()
+    release = threading.Event()
+
+    def fail():
+        release.wait(5)
+        raise ValueError("boom")
+
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        futures = [pool.submit(group.do, "k", fail) for _ in range(3)]
+        _wait_shared(group, 2)
+        release.set()
+        for f in futures:
+            with pytest.raises(ValueError):
+                f.result(5)
+
+    # 끝난 호출은 공유되지 않고 새로 실행됨
+    assert group.do("k", lambda: "again") == "again"
+    assert group.stats()["executed"] == 2
+
+
+def test_different_keys_do_not_share():
+    group = SingleFlight()
+    assert group.do("a", lambda: 1) == 1
+    assert group.do("b", lambda: 2) == 2
+    assert group.stats()["shared"] == 0
+
+
+class LeaderDeadline(Exception):
+    """리더 자신의 마감 초과 (공유하지 않는 예외)"""
+
+
+def test_unshared_error_makes_follower_retry():
+    group = SingleFlight()
+    release = threading.Event()
+    calls = []
+
+    def leader_fn():
+        calls.append("leader")
+        release.wait(5)
+        raise LeaderDeadline()
+
+    def follower_fn():
+        calls.append("follower")
+        return "ok"
+
+    def share(e):
+        return not isinstance(e, LeaderDeadline)
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        leader = pool.submit(group.do, "k", leader_fn, share_error=share)
+        _wait_executed(group, 1)
+        follower = pool.submit(group.do, "k", follower_fn, share_error=share)
+        _wait_shared(group, 1)
+        release.set()
+        with pytest.raises(LeaderDeadline):
+            leader.result(5)
+        # 리더의 마감 초과를 받지 않고 새 리더로 직접 실행
+        assert follower.result(5) == "ok"
+    assert calls == ["leader", "follower"]
+
+
+def test_follower_wait_is_bounded():
+    group = SingleFlight()
+    release = threading.Event()
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        leader = pool.submit(group.do, "k", lambda: release.wait(5) and "done")
+        _wait_executed(group, 1)
+        with pytest.raises(WaitTimeout):
+            group.do("k", lambda: "never", timeout=0.01)
+        release.set()
+        assert leader.result(5) == "done"
@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+"""siseJson 빠른 파서 vs _parse_sise_legacy 비교"""
+import glob
+import os
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from analysis import technical
+from analysis.sise_parser import SiseParseError, parse_sise_json
+from analysis.technical import OHLCV_COLUMNS, _parse_sise_legacy
+
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "benchmarks", "fixtures")
+HEADER = "[['날짜', '시가', '고가', '저가', '종가', '거래량', '외국인소진율'],\n"
+
+
+def _fixture_texts():
+    for path in sorted(glob.glob(os.path.join(FIXTURES, "sise_*.txt"))):
+        with open(path, "r", encoding="utf-8") as f:
+            yield pytest.param(f.read(), id=os.path.basename(path))
+
+
+@pytest.mark.parametrize("text", list(_fixture_texts()))
+def test_matches_legacy_parser(text):
+    legacy = _parse_sise_legacy(text)
+    fast = pd.DataFrame(parse_sise_json(text), columns=OHLCV_COLUMNS)
+    assert len(fast) > 200
+    assert list(fast["date"]) == list(legacy["date"].astype(str))
+    for col in OHLCV_COLUMNS[1:]:
+        np.testing.assert_array_equal(fast[col].to_numpy(), legacy[col].to_numpy(dtype=float))
+
+
+def test_unsorted_rows_are_sorted():
+    text = HEADER + '["20240103", 1, 2, 0.5, 1.5, 10, 1.0],\n["20240102", 2, 3, 1, 2.5, 20, 1.0]\n]'
+    columns = parse_sise_json(text)
+    assert columns["date"].tolist() == ["20240102", "20240103"]
+    assert columns["close"].tolist() == [2.5, 1.5]
+
+
+def test_empty_body():
+    columns = parse_sise_json(HEADER + "]")
+    assert len(columns["date"]) == 0 and len(columns["close"]) == 0
+
+
+def test_bad_row_is_named():
+    text = (HEADER + '["20240102", 1, 2, 0.5, 1.5, 10, 1.0],\n'
+            '["20240103", 1, 2, 0.5, null, 10, 1.0]\n]')
+    with pytest.raises(SiseParseError, match=r"row 1 .*'null'.*20240103"):
+        parse_sise_json(text)
+
+
+@pytest.mark.parametrize("text", [
+    "<html>error</html>",
+    "[['일자', '값'],\n[\"20240102\", 1]]",
+    HEADER + '["20240102", 1, 2, 0.5, 1.5, 10]\n]',
+])
+def test_format_errors(text):
+    with pytest.raises(SiseParseError):
+        parse_sise_json(text)
+
+
+class FakeResponse:
+    def __init__(self, text):
+        self.text = text
+
+    def raise_for_status(self):
+        pass
+
+
+def test_fetch_falls_back_to_legacy_on_parse_error(monkeypatch):
+    text = (HEADER + '["20240102", 1, 2, 0.5, 1.5, 10, 1.0],\n'
+            '["20240103", 1, 2, 0.5, null, 10, 1.0]\n]')
+    monkeypatch.setattr(technical.http_client, "get", lambda *a, **kw: FakeResponse(text))
+    df = technical._fetch_ohlcv("005930", datetime(2024, 1, 1), datetime(2024, 1, 3))
+    assert list(df["date"]) == ["20240102", "20240103"]
+    assert df["close"].iloc[0] == 1.5 and np.isnan(df["close"].iloc[1])
@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+"""여러 종목 시세 일괄 조회(get_stock_prices, /stocks) 테스트"""
+import asyncio
+import threading
+import time
+
+import pytest
+from fastapi import HTTPException
+
+from analysis import crawler
+from analysis.cache import TTLCache
+from api.routes import market as market_routes
+
+
+@pytest.fixture
+def fetched(monkeypatch):
+    """업스트림 대신 호출 기록 (999999는 조회 실패, 앞 종목일수록 늦게 응답)"""
+    calls = []
+    lock = threading.Lock()
+
+    def fake_price(code):
+        with lock:
+            calls.append(code)
+        time.sleep(0.01 * (3 - len(calls) % 3))
+        return None if code == "999999" else {"code": code, "price": int(code[-1])}
+
+    monkeypatch.setattr(crawler, "quote_cache", TTLCache("quotes"))
+    monkeypatch.setattr(crawler, "get_stock_price", fake_price)
+    return calls
+
+
+def test_dedupes_and_keeps_input_order(fetched):
+    result = crawler.get_stock_prices(["000660", " 005930", "", "000660", "035420", "005930"])
+    assert list(result) == ["000660", "005930", "035420"]
+    assert result["005930"] == {"code": "005930", "price": 0}
+    assert sorted(fetched) == ["000660", "005930", "035420"]
+
+
+def test_reuses_cached_quotes(fetched):
+    crawler.quote_cache.set("stock:005930", {"code": "005930", "price": 1}, 60)
+    result = crawler.get_stock_prices(["005930", "000660"])
+    assert fetched == ["000660"]
+    # 캐시 항목은 복사본을 돌려줘 호출자가 수정해도 캐시는 그대로
+    result["005930"]["price"] = 2
+    assert crawler.quote_cache.get("stock:005930")["price"] == 1
+
+
+def test_partial_failure_is_null(fetched):
+    result = crawler.get_stock_prices(["005930", "999999", "000660"])
+    assert list(result) == ["005930", "999999", "000660"]
+    assert result["999999"] is None
+    assert result["000660"]["code"] == "000660"
+
+
+def test_route_fills_board_misses_in_order(fetched, monkeypatch):
+    monkeypatch.setattr(market_routes, "get_stock_prices", crawler.get_stock_prices)
+    board = {"stock:000660": {"code": "000660", "price": "board"}}
+    monkeypatch.setattr(market_routes, "_from_board", board.get)
+
+    result = asyncio.run(market_routes.get_stocks_info("005930, 000660,999999,005930"))
+    assert list(result) == ["005930", "000660", "999999"]
+    assert result["000660"]["price"] == "board"
+    assert result["999999"] is None
+    assert sorted(fetched) == ["005930", "999999"]
+
+
+def test_route_rejects_empty_and_oversized_batches():
+    with pytest.raises(HTTPException) as exc:
+        asyncio.run(market_routes.get_stocks_info(" , "))
+    assert exc.value.status_code == 400
+    codes = ",".join(f"{i:06d}" for i in range(market_routes.MAX_BATCH_CODES + 1))
+    with pytest.raises(HTTPException) as exc:
+        asyncio.run(market_routes.get_stocks_info(codes))
+    assert exc.value.status_code == 400
@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+"""스트리밍 지표 vs technical.py pandas 구현 비교"""
+from dataclasses import asdict
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from analysis import streaming
+from analysis.streaming import IndicatorState, MACross, StreamingBollinger, StreamingRSI, StreamingSMA
+from analysis.technical import calculate_bollinger_bands, calculate_rsi, indicators_from_ohlcv
+from conftest import random_walk
+
+
+def _same(a: float, b: float) -> bool:
+    if np.isnan(b):
+        return np.isnan(a)
+    return a == pytest.approx(b, rel=1e-7, abs=1e-7)
+
+
+@pytest.fixture
+def closes(rng):
+    closes = random_walk(rng, 400)
+    # 보합 구간 (RSI 0/0, 표준편차 0)
+    closes[50:75] = closes[49]
+    return closes
+
+
+@pytest.mark.parametrize("resync", [streaming.RESYNC_EVERY, 7])
+def test_series_match_pandas_bar_by_bar(closes, monkeypatch, resync):
+    monkeypatch.setattr(streaming, "RESYNC_EVERY", resync)
+    df = pd.DataFrame({"close": closes})
+    rsi_expected = calculate_rsi(df).to_numpy()
+    bb_expected = {k: v.to_numpy() for k, v in calculate_bollinger_bands(df).items()}
+    ma60_expected = df["close"].rolling(60).mean().to_numpy()
+
+    rsi, bb, ma60 = StreamingRSI(14), StreamingBollinger(20, 2.0), StreamingSMA(60)
+    for i, close in enumerate(closes):
+        rsi.update(close)
+        bb.update(close)
+        ma60.update(close)
+        assert _same(rsi.value, rsi_expected[i]), i
+        assert _same(bb.middle, bb_expected["middle"][i]), i
+        assert _same(bb.upper, bb_expected["upper"][i]), i
+        assert _same(bb.lower, bb_expected["lower"][i]), i
+        assert _same(ma60.value, ma60_expected[i]), i
+
+
+def test_snapshot_matches_indicators_from_ohlcv(closes):
+    state = IndicatorState("000000", "TEST").seed(closes[:150])
+    expected = indicators_from_ohlcv("000000", "TEST", pd.DataFrame({"close": closes[:150]}))
+    assert state.ready
+    got = asdict(state.snapshot())
+    for field, value in asdict(expected).items():
+        if isinstance(value, float):
+            assert got[field] == pytest.approx(value, abs=0.011), field
+        else:
+            assert got[field] == value, field
+
+
+def test_update_last_equals_recompute(closes):
+    state = IndicatorState("000000", "TEST").seed(closes[:150])
+    # 장중 체결가 여러 번 -> 마지막 가격으로 당일 봉을 새로 만든 것과 같아야 함
+    for price in (closes[149] * 1.03, closes[149] * 0.97, closes[149] * 1.01):
+        state.update_last(price)
+    fresh = IndicatorState("000000", "TEST").seed(list(closes[:149]) + [closes[149] * 1.01])
+    assert asdict(state.snapshot()) == pytest.approx(asdict(fresh.snapshot()))
+
+
+def test_cross_detected_on_streaming_updates():
+    closes = list(np.linspace(200, 100, 140))
+    cross = MACross(5, 20).seed(closes)
+    assert not cross.golden_cross
+    for close in (110, 130, 160, 200):
+        cross.update(close)
+    assert cross.golden_cross and not cross.dead_cross
+
+
+def test_on_price_updates_same_day_and_appends_new_day(closes):
+    df = pd.DataFrame({"date": [f"2024{i:04d}" for i in range(150)], "close": closes[:150]})
+    state = IndicatorState.from_ohlcv("000000", df, "TEST")
+    last = df["date"].iloc[-1]
+
+    state.on_price(last, 1.0)
+    assert state.bars == 150 and state.price == 1.0
+
+    state.on_price("20250101", 2.0)
+    state.on_price("20250101", 3.0)
+    assert state.bars == 151 and state.last_date == "20250101"
+    expected = IndicatorState("000000", "TEST").seed(list(closes[:149]) + [1.0, 3.0])
+    assert asdict(state.snapshot()) == pytest.approx(asdict(expected.snapshot()))
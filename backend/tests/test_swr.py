@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+"""TTLCache.get_or_revalidate (stale-while-revalidate) 테스트"""
+import asyncio
+
+import pytest
+
+from analysis import cache, poller
+from analysis.cache import TTLCache
+from analysis.crawler import IndexData
+from api.routes import market as market_routes
+
+
+class DeferredExecutor:
+    """백그라운드 갱신을 바로 실행하지 않고 모아 두었다가 run()으로 실행"""
+
+    def __init__(self):
+        self.pending = []
+
+    def submit(self, fn, *args):
+        self.pending.append((fn, args))
+
+    def run(self):
+        pending, self.pending = self.pending, []
+        for fn, args in pending:
+            fn(*args)
+
+
+@pytest.fixture
+def revalidator(monkeypatch):
+    executor = DeferredExecutor()
+    monkeypatch.setattr(cache, "_revalidator", executor)
+    return executor
+
+
+class Loader:
+    def __init__(self, *values):
+        self.values = list(values)
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        return self.values.pop(0)
+
+
+def test_miss_loads_synchronously(clock, revalidator):
+    c = TTLCache("t")
+    loader = Loader("v1")
+    assert c.get_or_revalidate("k", loader, ttl=10, max_stale=60) == ("v1", 0.0)
+    assert loader.calls == 1 and not revalidator.pending
+
+
+def test_fresh_hit_reports_age(clock, revalidator):
+    c = TTLCache("t")
+    loader = Loader("v1")
+    c.get_or_revalidate("k", loader, ttl=10, max_stale=60)
+    clock.now += 4
+    assert c.get_or_revalidate("k", loader, ttl=10, max_stale=60) == ("v1", 4.0)
+    assert loader.calls == 1 and c.hits == 1
+
+
+def test_stale_value_served_then_revalidated_once(clock, revalidator):
+    c = TTLCache("t")
+    loader = Loader("v1", "v2")
+    c.get_or_revalidate("k", loader, ttl=10, max_stale=60)
+    clock.now += 15
+
+    # 만료됐지만 max_stale 이내: 묵은 값을 즉시 주고 갱신은 한 번만 예약
+    assert c.get_or_revalidate("k", loader, ttl=10, max_stale=60) == ("v1", 15.0)
+    assert c.get_or_revalidate("k", loader, ttl=10, max_stale=60) == ("v1", 15.0)
+    assert len(revalidator.pending) == 1 and loader.calls == 1
+    assert c.stale_hits == 2
+
+    revalidator.run()
+    assert c.get_or_revalidate("k", loader, ttl=10, max_stale=60) == ("v2", 0.0)
+    assert loader.calls == 2
+
+
+def test_too_stale_loads_synchronously(clock, revalidator):
+    c = TTLCache("t")
+    loader = Loader("v1", "v2")
+    c.get_or_revalidate("k", loader, ttl=10, max_stale=60)
+    clock.now += 10 + 61
+    assert c.get_or_revalidate("k", loader, ttl=10, max_stale=60) == ("v2", 0.0)
+    assert not revalidator.pending
+
+
+def test_failed_revalidation_keeps_stale_value(clock, revalidator):
+    c = TTLCache("t")
+    values = iter(["v1"])
+
+    def loader():
+        return next(values)
+
+    c.get_or_revalidate("k", loader, ttl=10, max_stale=60)
+    clock.now += 15
+    c.get_or_revalidate("k", loader, ttl=10, max_stale=60)
+    revalidator.run()  # StopIteration -> 로그만 남기고 묵은 값 유지
+
+    assert c.get_or_revalidate("k", loader, ttl=10, max_stale=60)[0] == "v1"
+    # 갱신 표시가 풀려 다음 요청이 다시 갱신을 예약함
+    assert len(revalidator.pending) == 1
+
+
+def test_uncacheable_result_not_stored(clock, revalidator):
+    c = TTLCache("t")
+    loader = Loader(None, "v1")
+    assert c.get_or_revalidate("k", loader, ttl=10) == (None, 0.0)
+    assert c.get_or_revalidate("k", loader, ttl=10) == ("v1", 0.0)
+    assert loader.calls == 2
+
+
+def test_route_skips_board_older_than_max_stale(monkeypatch):
+    board = poller.QuoteBoard()
+    monkeypatch.setattr(market_routes, "quote_board", board)
+    monkeypatch.setattr(market_routes.market_poller, "is_running", lambda: True)
+    monkeypatch.setattr(market_routes, "feed_cache", TTLCache("feeds"))
+    now = poller.time.time()
+    on_board, loaded = [IndexData("코스피", 2500.0, 0, 0)], [IndexData("코스피", 2510.0, 0, 0)]
+
+    board.put("indices", on_board, fetched_at=now - 30)
+    items, age = asyncio.run(market_routes._load_index_group("indices", lambda: loaded))
+    assert items is on_board and age >= 30
+
+    # 최대 묵은 시간을 넘긴 시세판 값은 버리고 캐시 경로로 다시 조회
+    board.put("indices", on_board, fetched_at=now - poller.board_max_age() - 1)
+    items, age = asyncio.run(market_routes._load_index_group("indices", lambda: loaded))
+    assert items == loaded and age == 0.0
@@ -0,0 +1,46 @@
+# -*- coding: utf-8 -*-
+"""종목 마스터(SymbolMaster.search) 테스트"""
+from analysis.symbols import MAX_SUGGESTIONS, SymbolInfo, SymbolMaster
+
+
+def _master():
+    return SymbolMaster([
+        SymbolInfo("005930", "삼성전자", "KOSPI"),
+        SymbolInfo("005935", "삼성전자우", "KOSPI"),
+        SymbolInfo("028260", "삼성물산", "KOSPI"),
+        SymbolInfo("000660", "SK하이닉스", "KOSPI"),
+        SymbolInfo("069500", "KODEX 200", "ETF"),
+        SymbolInfo("005930", "중복 코드", "KOSDAQ"),
+    ])
+
+
+def test_name_prefix_in_insertion_order():
+    master = _master()
+    assert len(master) == 5
+    assert [s.code for s in master.search("삼성")] == ["005930", "005935", "028260"]
+    assert [s.code for s in master.search("삼성전자")] == ["005930", "005935"]
+    assert master.search("전자") == []
+
+
+def test_query_normalized():
+    master = _master()
+    assert [s.code for s in master.search("kodex2")] == ["069500"]
+    assert [s.code for s in master.search(" sk 하이")] == ["000660"]
+    assert master.search("") == [] and master.search(None) == []
+
+
+def test_code_prefix_and_exact_code_first():
+    master = _master()
+    assert [s.code for s in master.search("0059")] == ["005930", "005935"]
+    # 정확히 일치하는 코드는 다른 후보보다 앞
+    master.add(SymbolInfo("111111", "005935 추종", "ETF"))
+    assert [s.code for s in master.search("005935")][:1] == ["005935"]
+    assert master.name_of("005930") == "삼성전자"
+
+
+def test_limit():
+    master = SymbolMaster([SymbolInfo(f"{i:06d}", f"테스트{i}", "KOSPI") for i in range(30)])
+    assert len(master.search("테스트")) == 10
+    assert len(master.search("테스트", limit=50)) == MAX_SUGGESTIONS
+    assert [s.code for s in master.search("테스트", limit=3)] == ["000000", "000001", "000002"]
+    assert [s.code for s in master.search("000007", limit=1)] == ["000007"]
@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+"""기술적 분석(analyze_stock 봉 단위 메모) 테스트"""
+import threading
+import time
+import types
+
+import pandas as pd
+import pytest
+
+from analysis import technical
+from analysis.cache import TTLCache
+from analysis.ohlcv_store import OHLCVStore
+from conftest import random_walk
+
+
+@pytest.fixture
+def store(monkeypatch, rng):
+    """일봉 150개가 최근에 동기화된 저장소, 지표 계산 횟수 기록"""
+    store = OHLCVStore(":memory:")
+    dates = pd.bdate_range(end=pd.Timestamp.today(), periods=150).strftime("%Y%m%d")
+    closes = random_walk(rng, len(dates))
+    df = pd.DataFrame({"date": dates, "open": closes, "high": closes, "low": closes, "close": closes, "volume": 1.0})
+    store.upsert("005930", df, technical._ohlcv_range(150)[1].strftime("%Y%m%d"))
+    monkeypatch.setattr(technical, "get_ohlcv_store", lambda: store)
+    monkeypatch.setattr(technical, "indicator_memo", TTLCache("indicators"))
+    monkeypatch.setattr(technical, "_fetch_ohlcv", lambda *a: pytest.fail("store is fresh, no fetch expected"))
+
+    computed = []
+    compute = technical.indicators_from_ohlcv
+    monkeypatch.setattr(technical, "indicators_from_ohlcv", lambda *a: computed.append(a[0]) or compute(*a))
+    store.computed = computed
+    return store
+
+
+def test_memo_hits_while_last_bar_unchanged(store, monkeypatch):
+    first = technical.analyze_stock("005930", "삼성전자")
+    # 저장소가 최신이면 일봉을 읽지 않고 마지막 봉만으로 메모 조회
+    monkeypatch.setattr(technical, "get_stock_ohlcv", lambda *a: pytest.fail("fast path should skip OHLCV load"))
+    assert technical.analyze_stock("005930", "삼성전자") is first
+    renamed = technical.analyze_stock("005930", "Samsung")
+    assert renamed.name == "Samsung" and renamed.rsi == first.rsi
+    assert store.computed == ["005930"]
+
+
+def test_memo_misses_when_last_bar_changes(store):
+    first = technical.analyze_stock("005930", "삼성전자")
+    last_date, last_close = store.last_bar("005930")
+    # 장중 체결로 마지막 봉 종가가 바뀜 -> 키가 달라져 다시 계산
+    tick = pd.DataFrame({"date": [last_date], "open": [last_close], "high": [last_close * 1.05],
+                         "low": [last_close], "close": [last_close * 1.05], "volume": [2.0]})
+    store.upsert("005930", tick, store.sync_state("005930")[0])
+    second = technical.analyze_stock("005930", "삼성전자")
+    assert second is not first
+    assert second.current_price == pytest.approx(last_close * 1.05)
+    assert store.computed == ["005930", "005930"]
+
+
+def test_report_keeps_input_order_and_records_failures(monkeypatch):
+    codes = ["A", "B", "C", "D", "E", "F"]
+    delays = {"A": 0.05, "B": 0.0, "C": 0.03, "D": 0.0, "E": 0.02, "F": 0.01}
+    threads = set()
+
+    def fake_analyze(code, name):
+        threads.add(threading.get_ident())
+        time.sleep(delays[code])
+        if code == "C":
+            raise RuntimeError("upstream 503")
+        if code == "E":
+            return None
+        return types.SimpleNamespace(to_dict=lambda: {"code": code})
+
+    monkeypatch.setattr(technical, "analyze_stock", fake_analyze)
+    monkeypatch.setattr(technical, "_stock_name", lambda code: f"name-{code}")
+    report = technical.analyze_stocks_report(codes, max_workers=4)
+
+    # 늦게 끝난 종목이 있어도 결과는 입력 순서
+    assert [r.code for r in report.results] == codes
+    assert [r.name for r in report.results] == [f"name-{c}" for c in codes]
+    assert report.workers == 4 and len(threads) > 1
+    assert [r.code for r in report.failures] == ["C", "E"]
+    assert report.results[2].error == "upstream 503"
+    assert "120봉" in report.results[4].error
+    assert report.results[0].elapsed_ms >= 50
+    assert report.elapsed_ms >= report.results[0].elapsed_ms
+
+    d = report.to_dict()
+    assert (d["succeeded"], d["failed"]) == (4, 2)
+    assert [r["code"] for r in d["results"]] == codes
@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+"""주봉·월봉 리샘플링 경계, 첫 봉 처리, 지표 캐시 키 테스트"""
+import pandas as pd
+import pytest
+
+from analysis import timeframes
+from analysis.cache import TTLCache
+from analysis.timeframes import analyze_timeframes, resample_ohlcv
+
+
+def _daily(start: str, end: str, step: float = 1.0) -> pd.DataFrame:
+    dates = pd.bdate_range(start, end)
+    close = [100.0 + i * step for i in range(len(dates))]
+    return pd.DataFrame({
+        "date": dates.strftime("%Y%m%d"),
+        "open": [c - 0.5 for c in close],
+        "high": [c + 1 for c in close],
+        "low": [c - 1 for c in close],
+        "close": close,
+        "volume": 1.0,
+    })
+
+
+def test_weekly_boundaries_and_aggregates():
+    # 2024-01-03(수) ~ 2024-01-16(화): 수~금 / 월~금 / 월~화
+    bars = resample_ohlcv({"A": _daily("2024-01-03", "2024-01-16")}, "weekly")["A"]
+    assert bars["date"].tolist() == ["20240105", "20240112", "20240116"]
+    assert bars["open"].tolist() == [99.5, 102.5, 107.5]
+    assert bars["high"].tolist() == [103.0, 108.0, 110.0]
+    assert bars["low"].tolist() == [99.0, 102.0, 107.0]
+    assert bars["close"].tolist() == [102.0, 107.0, 109.0]
+    assert bars["volume"].tolist() == [3.0, 5.0, 2.0]
+
+
+def test_monthly_boundaries_do_not_mix_symbols():
+    frames = {"A": _daily("2024-01-30", "2024-03-04"), "B": _daily("2024-02-28", "2024-03-01", step=10)}
+    out = resample_ohlcv(frames, "monthly")
+    assert out["A"]["date"].tolist() == ["20240131", "20240229", "20240304"]
+    # B의 첫 봉은 A의 마지막 봉과 같은 달이어도 따로 집계
+    assert out["B"]["date"].tolist() == ["20240229", "20240301"]
+    assert out["B"]["close"].tolist() == [110.0, 120.0]
+    with pytest.raises(ValueError):
+        resample_ohlcv(frames, "daily")
+
+
+@pytest.mark.parametrize("first, timeframe, complete", [
+    ("20240108", "weekly", True),    # 월요일
+    ("20240110", "weekly", False),   # 수요일 -> 월·화 빠짐
+    ("20240201", "monthly", True),
+    ("20240603", "monthly", True),   # 6/1이 토요일이라 첫 평일
+    ("20240215", "monthly", False),
+])
+def test_first_bar_complete(first, timeframe, complete):
+    assert timeframes._first_bar_complete(first, timeframe) is complete
+
+
+@pytest.fixture
+def daily(monkeypatch):
+    """get_stock_ohlcv 대체 (종목 -> 일봉), 호출 기록"""
+    frames, calls = {}, []
+
+    def fake(code, days):
+        calls.append((code, days))
+        return frames.get(code)
+
+    monkeypatch.setattr(timeframes, "get_stock_ohlcv", fake)
+    monkeypatch.setattr(timeframes, "indicator_memo", TTLCache("indicators"))
+    monkeypatch.setattr(timeframes, "_stock_name", lambda code: code)
+    return frames, calls
+
+
+def test_first_bar_dropped_only_when_partial(daily):
+    frames, _ = daily
+    frames["A"] = _daily("2024-01-08", "2024-06-28")   # 월요일 시작
+    frames["B"] = _daily("2024-01-10", "2024-06-28")   # 수요일 시작
+    out = analyze_timeframes(["A", "B"], ["weekly"])
+    assert out["A"]["weekly"].bars == out["B"]["weekly"].bars + 1
+
+
+def test_memo_key_tracks_last_bar(daily):
+    frames, calls = daily
+    frames["A"] = _daily("2024-01-08", "2024-06-28")
+    first = analyze_timeframes(["A"], ["weekly"])["A"]["weekly"]
+    # 마지막 일봉이 같으면 캐시된 결과
+    assert analyze_timeframes(["A"], ["weekly"])["A"]["weekly"] is first
+    # 마지막 종가가 바뀌면(장중 갱신) 다시 계산
+    frames["A"] = frames["A"].assign(close=frames["A"]["close"].where(frames["A"].index < len(frames["A"]) - 1, 999.0))
+    changed = analyze_timeframes(["A"], ["weekly"])["A"]["weekly"]
+    assert changed is not first and changed.close == 999.0
+    # 주봉만 요청하면 월봉에 필요한 긴 구간을 받지 않음
+    assert {days for _, days in calls} == {timeframes.DAILY_HISTORY["weekly"]}
@@ -34,6 +34,13 @@ export const marketApi = {
   // 종목 정보 조회
   getStockInfo: (code: string) => apiClient.get(`/market/stock/${code}`),
   
+  // 여러 종목 시세 일괄 조회
+  getStocksInfo: (codes: string[]) =>
+    apiClient.get('/market/stocks', { params: { codes: codes.join(',') } }),
+  
+  // 종목명/코드 자동완성
+  searchSymbols: (q: string) => apiClient.get('/market/search', { params: { q } }),
+  
   // 시장 상태 조회
   getMarketStatus: () => apiClient.get('/market/status'),
 }
@@ -69,12 +76,20 @@ export const analysisApi = {
   // 종목별 뉴스
   getStockNews: (code: string) => apiClient.get(`/analysis/news/stock/${code}`),
   
+  // 뉴스 아카이브 전문 검색 (예: { q: '반도체', code: '005930', since: '2026-01-02' })
+  searchNews: (params: { q?: string; code?: string; since?: string; limit?: number }) =>
+    apiClient.get('/analysis/news/search', { params }),
+  
   // AI 분석 생성
   generateAnalysis: (holdings?: string[]) => 
     apiClient.post('/analysis/generate', { holdings }),
   
   // 지수 조회
   getIndices: () => apiClient.get('/analysis/indices'),
+  
+  // 전 종목 기술적 지표 스크리너 (예: { rsiMax: 30, goldenCross: true })
+  screen: (params: Record<string, string | number | boolean>) =>
+    apiClient.get('/analysis/screen', { params }),
 }
 
 // ===== 매매 API =====
@@ -8,6 +8,7 @@ export interface IndexData {
   value: number
   change: number
   changePercent: number
+  ageSeconds?: number  // 데이터 갱신 후 지난 시간(초)
 }
 
 // 종목 정보
@@ -54,6 +55,8 @@ export interface NewsItem {
   time: string
   url: string
   summary?: string
+  published?: string  // 게시 시각 "YYYY-MM-DD HH:MM"
+  ageSeconds?: number  // 데이터 갱신 후 지난 시간(초)
 }
 
 // 유망 테마